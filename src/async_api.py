@@ -0,0 +1,207 @@
+"""
+API asyncio untuk penyisipan dan ekstraksi pesan.
+
+Tahap CPU-bound (pembuatan kunci RSA/ECC, DWT, penyisipan, dan ekstraksi)
+dijalankan di executor thread atau proses, sedangkan baca/tulis file
+dijalankan lewat asyncio.to_thread sehingga event loop tidak pernah
+terblokir. Jumlah job yang berjalan bersamaan dibatasi dengan semaphore.
+
+Pembatalan task memeriksa batas antar tahap: job yang dibatalkan berhenti
+sebelum tahap berikutnya dan tidak meninggalkan file output sebagian,
+karena output ditulis ke file sementara lalu dipindahkan secara atomik.
+"""
+import os
+import io
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from core import (prepare_message, build_stego_info, embed_bits_in_audio, extract_payload,
+                  resolve_stego_info, save_key_files, dwt_from_info)
+from crypto import KeyStore
+from utils import suppress_stdout
+
+def _prepare_stage(message, alpha):
+    """Tahap enkripsi ganda ECC+RSA, mengembalikan bit dan informasi ekstraksi."""
+    with suppress_stdout():
+        all_bits, ecc_crypto, rsa_crypto = prepare_message(message)
+    return all_bits, build_stego_info(all_bits, ecc_crypto, rsa_crypto, message, alpha)
+
+def _embed_stage(audio_bytes, all_bits, alpha, dwt_info=None):
+    """
+    Tahap DWT, penyisipan, dan IDWT pada audio di memori, mengembalikan WAV
+    bytes. dwt_info berisi transform dan dtype (lihat dwt_from_info).
+    """
+    dwt = dwt_from_info(dwt_info)
+    audio_data, sample_rate = dwt.read_audio(audio_bytes)
+    stego_data = embed_bits_in_audio(audio_data, all_bits, alpha=alpha, dwt=dwt)
+    buffer = io.BytesIO()
+    dwt.save_audio(buffer, stego_data, sample_rate)
+    return buffer.getvalue()
+
+def _extract_stage(stego_bytes, info):
+    """
+    Tahap DWT, ekstraksi bit, dan dekripsi pada audio di memori dengan
+    parameter dan mode penyisipan yang tercatat pada info.
+    """
+    with suppress_stdout():
+        return extract_payload(stego_bytes, info["bits_length"],
+                               alpha=info.get("alpha", 0.001),
+                               ecc_private_key=info.get("ecc_private_key"),
+                               rsa_private_key=info.get("rsa_private_key"),
+                               dwt=dwt_from_info(info),
+                               multiband=info.get("multiband", False),
+                               spread_key=info.get("spread_key"),
+                               recipient_key=info.get("rsa_public_key") if info.get("container") else None,
+                               fec=info.get("fec"))
+
+def _save_keys_stage(info, output_file):
+    """Tahap penyimpanan file .key dan .info."""
+    with suppress_stdout():
+        save_key_files(info, key_file=output_file + ".key", info_file=output_file + ".info")
+
+def _read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _write_file_atomic(path, data):
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+class AsyncStego:
+    def __init__(self, executor="thread", max_workers=None, max_concurrency=None):
+        """
+        Inisialisasi API asyncio.
+
+        Args:
+            executor (str or Executor): "thread", "process", atau instance
+                Executor milik pemanggil untuk tahap CPU-bound
+            max_workers (int, optional): Jumlah worker executor yang dibuat
+            max_concurrency (int, optional): Batas job yang berjalan bersamaan
+                (default: max_workers atau jumlah CPU)
+        """
+        if isinstance(executor, Executor):
+            self.executor = executor
+            self._owns_executor = False
+        elif executor == "thread":
+            self.executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._owns_executor = True
+        elif executor == "process":
+            self.executor = ProcessPoolExecutor(max_workers=max_workers)
+            self._owns_executor = True
+        else:
+            raise ValueError(f"Executor tidak dikenal: {executor!r}")
+
+        self.max_concurrency = max_concurrency or max_workers or os.cpu_count() or 1
+        self._semaphore = None
+
+    def _get_semaphore(self):
+        # Semaphore dibuat saat pertama dipakai agar terikat ke event loop yang berjalan
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run_cpu(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    async def embed_message(self, input_file, output_file, message, alpha=0.001, save_keys=True,
+                            transform=None, dtype='float64'):
+        """
+        Menyisipkan pesan ke dalam file audio tanpa memblokir event loop.
+
+        Args:
+            input_file (str): Path ke file audio input
+            output_file (str): Path ke file audio output (WAV)
+            message (str): Pesan yang akan disembunyikan
+            alpha (float, optional): Parameter DWT, default 0.001
+            save_keys (bool): Simpan file <output>.key dan <output>.info
+            transform (str, optional): Backend transformasi ('pywt', 'conv', atau
+                'lifting'; default pywt, atau lifting untuk dtype integer)
+            dtype (str): Tipe sampel pemrosesan; 'int16'/'int32' memakai
+                lifting integer yang eksak
+
+        Returns:
+            dict: Informasi ekstraksi (lihat build_stego_info)
+
+        Raises:
+            ValueError: Jika pesan kosong, kombinasi dtype dan transform tidak
+                didukung, atau pesan melebihi kapasitas audio
+            asyncio.CancelledError: Jika task dibatalkan
+        """
+        if not message:
+            raise ValueError("Pesan tidak boleh kosong")
+        dwt_info = {"dtype": dtype}
+        if transform is not None:
+            dwt_info["transform"] = transform
+        # Validasi kombinasi dtype dan transform sebelum pembuatan kunci
+        dwt = dwt_from_info(dwt_info)
+
+        async with self._get_semaphore():
+            audio_bytes = await asyncio.to_thread(_read_file, input_file)
+            all_bits, info = await self._run_cpu(_prepare_stage, message, alpha)
+            if dwt.transform.name != 'pywt':
+                info["transform"] = dwt.transform.name
+            if dwt.integer:
+                info["dtype"] = dwt.dtype
+            stego_bytes = await self._run_cpu(_embed_stage, audio_bytes, all_bits, alpha, dwt_info)
+            await asyncio.to_thread(_write_file_atomic, output_file, stego_bytes)
+            if save_keys:
+                await asyncio.to_thread(_save_keys_stage, info, output_file)
+            return info
+
+    async def extract_message(self, stego_file, num_bits=None, alpha=None,
+                              ecc_private_key=None, rsa_private_key=None, transform=None,
+                              keystore_root=None, key_id=None):
+        """
+        Mengekstrak pesan dari file audio tanpa memblokir event loop.
+        Parameter yang tidak diberikan diambil dari file sidecar .info, chunk
+        metadata, atau keystore (lihat resolve_stego_info), termasuk dtype,
+        level, dan mode penyisipan yang tercatat.
+
+        Args:
+            stego_file (str): Path ke file audio stego
+            num_bits (int, optional): Jumlah bit yang akan diekstrak
+            alpha (float, optional): Parameter DWT
+            ecc_private_key (str, optional): Kunci privat ECC dalam format PEM
+            rsa_private_key (str, optional): Kunci privat RSA dalam format PEM
+            transform (str, optional): Backend transformasi
+            keystore_root (str, optional): Direktori keystore
+            key_id (str, optional): key_id di keystore (default nama file stego)
+
+        Returns:
+            str: Pesan yang didekripsi
+
+        Raises:
+            ValueError: Jika parameter tidak ditemukan atau pesan tidak dapat didekripsi
+            asyncio.CancelledError: Jika task dibatalkan
+        """
+        async with self._get_semaphore():
+            keystore = KeyStore(keystore_root) if keystore_root else None
+            info = await asyncio.to_thread(resolve_stego_info, stego_file, keystore=keystore,
+                                           key_id=key_id)
+            info = dict(info or {})
+            overrides = {"bits_length": num_bits, "alpha": alpha, "ecc_private_key": ecc_private_key,
+                         "rsa_private_key": rsa_private_key, "transform": transform}
+            info.update((name, value) for name, value in overrides.items() if value is not None)
+            if "bits_length" not in info:
+                raise ValueError(f"Jumlah bit tidak diketahui untuk {stego_file}")
+
+            stego_bytes = await asyncio.to_thread(_read_file, stego_file)
+            return await self._run_cpu(_extract_stage, stego_bytes, info)
+
+    def close(self):
+        """Menghentikan executor milik instance ini dan membatalkan job yang belum mulai."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        self.close()
@@ -0,0 +1,309 @@
+"""
+Ekstraksi batch pesan dari banyak file audio stego secara paralel.
+"""
+import os
+import io
+import sys
+import glob
+import json
+import hashlib
+import time
+import argparse
+import contextlib
+
+from core import resolve_stego_info, extract_payload, dwt_from_info
+from crypto import KeyStore
+from jobindex import JobIndex, content_hash
+
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.ogg')
+
+def collect_stego_files(inputs):
+    """
+    Mengumpulkan file audio stego dari daftar direktori, pola glob, atau path file.
+
+    Args:
+        inputs (list): Daftar direktori, pola glob, atau path file
+
+    Returns:
+        list: Path file audio tanpa duplikat, sesuai urutan input
+    """
+    files = []
+    seen = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = sorted(
+                entry.path for entry in os.scandir(item)
+                if entry.is_file() and entry.name.lower().endswith(AUDIO_EXTENSIONS)
+            )
+        elif glob.has_magic(item):
+            candidates = sorted(glob.glob(item))
+        else:
+            candidates = [item]
+
+        for path in candidates:
+            if path not in seen:
+                seen.add(path)
+                files.append(path)
+    return files
+
+def resolve_extract_params(stego_file, keystore=None, index=None):
+    """
+    Mencari parameter ekstraksi dari indeks job, file sidecar .info, chunk
+    metadata WAV, atau entri keystore (lihat resolve_stego_info).
+
+    Args:
+        stego_file (str): Path ke file audio stego
+        keystore (KeyStore, optional): Keystore kunci privat
+        index (JobIndex, optional): Indeks job
+
+    Returns:
+        dict: Parameter ekstraksi (bits_length, alpha, dan kunci privat)
+
+    Raises:
+        ValueError: Jika parameter tidak ditemukan
+    """
+    info = resolve_stego_info(stego_file, keystore=keystore, index=index)
+    if info is None:
+        raise ValueError("Parameter ekstraksi tidak ditemukan (indeks job, file .info, "
+                         "chunk metadata, atau entri keystore)")
+    return info
+
+def extract_one(stego_file, keystore_root=None, verbose=False, index_path=None):
+    """
+    Mengekstrak satu file stego tanpa prompt interaktif.
+
+    Args:
+        stego_file (str): Path ke file audio stego
+        keystore_root (str, optional): Direktori keystore
+        verbose (bool): Tampilkan log proses ekstraksi
+        index_path (str, optional): File SQLite indeks job
+
+    Returns:
+        dict: Hasil ekstraksi dengan kunci file, ok, message/error, dan seconds
+            (ditambah fec_corrected untuk payload ber-FEC)
+    """
+    start_time = time.perf_counter()
+    result = {"file": stego_file}
+    log = sys.stdout if verbose else io.StringIO()
+    stats = {}
+    try:
+        with contextlib.redirect_stdout(log):
+            keystore = KeyStore(keystore_root) if keystore_root else None
+            if index_path:
+                with JobIndex(index_path) as index:
+                    info = resolve_extract_params(stego_file, keystore, index)
+            else:
+                info = resolve_extract_params(stego_file, keystore)
+            message = extract_payload(
+                stego_file,
+                info["bits_length"],
+                alpha=info.get("alpha", 0.001),
+                ecc_private_key=info.get("ecc_private_key"),
+                rsa_private_key=info.get("rsa_private_key"),
+                dwt=dwt_from_info(info),
+                multiband=info.get("multiband", False),
+                spread_key=info.get("spread_key"),
+                recipient_key=info.get("rsa_public_key") if info.get("container") else None,
+                fec=info.get("fec"),
+                stats=stats,
+            )
+        result["ok"] = True
+        result["message"] = message
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = f"{type(e).__name__}: {str(e)}"
+    result.update(stats)
+    result["seconds"] = round(time.perf_counter() - start_time, 4)
+    return result
+
+def output_names(files):
+    """
+    Nama file pesan di direktori output untuk setiap file stego: <basename>.txt,
+    atau <basename>.<hash path>.txt jika beberapa file dari direktori berbeda
+    memiliki basename yang sama, sehingga hasilnya tidak saling menimpa.
+
+    Args:
+        files (list): Path file stego
+
+    Returns:
+        dict: {path file stego: nama file output}
+    """
+    counts = {}
+    for stego_file in files:
+        base = os.path.basename(stego_file)
+        counts[base] = counts.get(base, 0) + 1
+    names = {}
+    for stego_file in files:
+        base = os.path.basename(stego_file)
+        if counts[base] > 1:
+            digest = hashlib.sha1(os.path.abspath(stego_file).encode('utf-8')).hexdigest()[:8]
+            base = f"{base}.{digest}"
+        names[stego_file] = base + ".txt"
+    return names
+
+def _write_result(result, jsonl_file=None, output_dir=None, names=None):
+    """
+    Menulis satu hasil ekstraksi ke file JSONL dan/atau direktori output
+    (nama file dari output_names).
+    """
+    if jsonl_file is not None:
+        jsonl_file.write(json.dumps(result) + "\n")
+        jsonl_file.flush()
+    if output_dir is not None and result["ok"]:
+        name = (names or {}).get(result["file"]) or os.path.basename(result["file"]) + ".txt"
+        with open(os.path.join(output_dir, name), 'w', encoding='utf-8') as f:
+            f.write(result["message"])
+
+def deduplicate_files(files, index):
+    """
+    Mengelompokkan file stego berdasarkan hash isi, dan menghitung file yang
+    memiliki job di indeks.
+
+    Returns:
+        tuple: (file unik, {file duplikat: file unik yang sama isinya},
+            jumlah file yang terindeks)
+    """
+    unique, duplicates, first_by_hash = [], {}, {}
+    indexed = 0
+    for stego_file in files:
+        try:
+            digest = content_hash(stego_file)
+        except OSError:
+            # Biarkan worker melaporkan kesalahan baca file
+            unique.append(stego_file)
+            continue
+        if digest in first_by_hash:
+            duplicates[stego_file] = first_by_hash[digest]
+            continue
+        first_by_hash[digest] = stego_file
+        unique.append(stego_file)
+        if index.lookup(stego_file, output_hash=digest) is not None:
+            indexed += 1
+    return unique, duplicates, indexed
+
+def batch_extract(inputs, jsonl_path=None, output_dir=None, workers=None,
+                  max_in_flight=None, keystore_root=None, on_result=None, index_path=None):
+    """
+    Mengekstrak pesan dari banyak file stego secara paralel di proses worker.
+
+    Jumlah file yang sedang diproses dibatasi oleh max_in_flight, sehingga
+    paling banyak max_in_flight file didekode pada saat yang sama.
+
+    Args:
+        inputs (list): Daftar direktori, pola glob, atau path file stego
+        jsonl_path (str, optional): File JSONL untuk hasil ("-" untuk stdout)
+        output_dir (str, optional): Direktori untuk menyimpan pesan per file
+        workers (int, optional): Jumlah proses worker (default: jumlah CPU)
+        max_in_flight (int, optional): Batas file yang diproses bersamaan
+            (default: sama dengan workers)
+        keystore_root (str, optional): Direktori keystore untuk file tanpa sidecar
+        on_result (callable, optional): Dipanggil untuk setiap hasil
+        index_path (str, optional): File SQLite indeks job; parameter dicari di
+            indeks, file dengan isi identik hanya diekstrak sekali (hasilnya
+            ditandai duplicate_of), dan ringkasan memuat jumlah file terindeks
+
+    Returns:
+        dict: Ringkasan dengan kunci total, ok, dan failed (ditambah indexed
+            dan duplicates jika index_path diisi)
+    """
+    # concurrent.futures.process memuat multiprocessing dan logging; hanya dibutuhkan di sini
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    files = collect_stego_files(inputs)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers
+    if workers < 1 or max_in_flight < 1:
+        raise ValueError("workers dan max_in_flight harus minimal 1")
+
+    names = None
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        names = output_names(files)
+
+    summary = {"total": len(files), "ok": 0, "failed": 0}
+    duplicates = {}
+    if index_path is not None:
+        with JobIndex(index_path) as index:
+            files, duplicates, indexed = deduplicate_files(files, index)
+        summary.update(indexed=indexed, duplicates=len(duplicates))
+    if not files:
+        return summary
+    copies = {}
+    for duplicate, original in duplicates.items():
+        copies.setdefault(original, []).append(duplicate)
+
+    if jsonl_path == "-":
+        jsonl_file = sys.stdout
+    elif jsonl_path is not None:
+        jsonl_file = open(jsonl_path, 'w', encoding='utf-8')
+    else:
+        jsonl_file = None
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, max_in_flight)) as executor:
+            file_iter = iter(files)
+            pending = set()
+
+            def fill():
+                # Hanya kirim pekerjaan baru selama batas in-flight belum tercapai
+                while len(pending) < max_in_flight:
+                    stego_file = next(file_iter, None)
+                    if stego_file is None:
+                        return
+                    pending.add(executor.submit(extract_one, stego_file, keystore_root,
+                                                False, index_path))
+
+            fill()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results = [result] + [{**result, "file": duplicate, "duplicate_of": result["file"]}
+                                          for duplicate in copies.get(result["file"], [])]
+                    for result in results:
+                        summary["ok" if result["ok"] else "failed"] += 1
+                        _write_result(result, jsonl_file, output_dir, names)
+                        if on_result is not None:
+                            on_result(result)
+                fill()
+    finally:
+        if jsonl_file is not None and jsonl_file is not sys.stdout:
+            jsonl_file.close()
+
+    return summary
+
+def main(argv=None):
+    """Fungsi utama ekstraksi batch."""
+    parser = argparse.ArgumentParser(description="Ekstraksi batch pesan dari file audio stego")
+    parser.add_argument("inputs", nargs="+", help="Direktori, pola glob, atau file stego")
+    parser.add_argument("--jsonl", help="File JSONL untuk hasil ('-' untuk stdout)")
+    parser.add_argument("--output-dir", help="Direktori untuk menyimpan pesan hasil ekstraksi")
+    parser.add_argument("--workers", type=int, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--max-in-flight", type=int,
+                        help="Batas file yang didekode bersamaan (default: jumlah worker)")
+    parser.add_argument("--keystore", help="Direktori keystore untuk file tanpa sidecar .info")
+    parser.add_argument("--index", help="File SQLite indeks job untuk parameter, deduplikasi, dan laporan")
+    args = parser.parse_args(argv)
+
+    jsonl_path = args.jsonl
+    if jsonl_path is None and args.output_dir is None:
+        jsonl_path = "-"
+
+    summary = batch_extract(
+        args.inputs,
+        jsonl_path=jsonl_path,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        keystore_root=args.keystore,
+        index_path=args.index,
+    )
+    print(f"Selesai: {summary['ok']} berhasil, {summary['failed']} gagal dari {summary['total']} file",
+          file=sys.stderr)
+    if args.index:
+        print(f"Terindeks: {summary['indexed']} file, duplikat: {summary['duplicates']} file",
+              file=sys.stderr)
+    return 0 if summary["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,764 @@
 """
 Command-line interface untuk aplikasi steganografi audio dengan ECC dan RSA.
+
+Tanpa argumen, CLI menampilkan menu interaktif. Dengan subcommand
+(embed, container, append, shard, unshard, extract, debug, margin, capacity, sweep,
+scan, bench, daemon, jobs), CLI berjalan tanpa prompt
+sehingga dapat dipakai di skrip. Path "-" berarti stdin/stdout, sehingga
+audio dan pesan dapat dialirkan lewat pipe tanpa file sementara.
 """
-from core import embed_message, extract_message, debug_extract
+import io
+import os
+import sys
+import time
+import json
+import argparse
+import contextlib
 
-def main():
-    """Fungsi utama CLI."""
+from core import (embed_message, extract_message, debug_extract, embed_payload,
+                  extract_payload, save_key_files, resolve_stego_info, audio_capacity,
+                  prepare_message, embed_bits_in_audio, decode_payload_bits, generate_audio,
+                  audio_band_capacities, record_job, confidence_report, LOW_CONFIDENCE)
+from crypto import KeyStore, path_key_id
+from steg import AudioDWT, OUTPUT_SUBTYPES, TRANSFORMS, DTYPES, INTEGER_DTYPES, CarrierCache, FEC_CODES
+from steg import bands as band_layout
+
+def _open_audio_input(path):
+    """Mengembalikan path file, atau bytes WAV berisi seluruh stdin jika path adalah "-"."""
+    if path == "-":
+        return sys.stdin.buffer.read()
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File tidak ditemukan: {path}")
+    return path
+
+def _read_text_input(path):
+    """Membaca teks dari file, atau dari stdin jika path adalah "-"."""
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _write_output(path, data, stdout):
+    """Menulis bytes atau teks ke file, atau ke stdout jika path adalah "-"."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if path == "-":
+        stdout.buffer.write(data)
+        stdout.buffer.flush()
+    else:
+        with open(path, 'wb') as f:
+            f.write(data)
+
+def _make_dwt(args, info=None):
+    """
+    Membuat instance DWT sesuai opsi --dtype dan --transform; tanpa --transform,
+    backend transformasi diambil dari info ekstraksi (default pywt, atau
+    lifting untuk dtype integer). Mode integer dan level multi-band yang
+    tercatat di info selalu dipakai untuk ekstraksi.
+    """
+    info = info or {}
+    dtype = info.get("dtype") or getattr(args, "dtype", "float64")
+    default_transform = "lifting" if dtype in INTEGER_DTYPES else "pywt"
+    transform = getattr(args, "transform", None) or info.get("transform", default_transform)
+    level = info.get("level") or getattr(args, "level", 1)
+    return AudioDWT(wavelet='db2', level=level, dtype=dtype, transform=transform)
+
+def _parse_bands(args):
+    """
+    Urutan band mode multi-band dari --bands ("3,2,1") atau --level > 1
+    (semua band, dari yang paling halus); None untuk mode satu band.
+    """
+    if args.bands:
+        try:
+            bands = [int(band) for band in args.bands.split(",")]
+        except ValueError:
+            raise ValueError(f"--bands harus berupa daftar indeks band, misalnya 3,2,1: {args.bands!r}")
+        return band_layout.validate_bands(bands, args.level)
+    if args.level > 1:
+        return band_layout.default_bands(args.level)
+    return None
+
+def _open_index(args):
+    """Membuka indeks job dari opsi --index, atau None jika tidak diisi."""
+    if not getattr(args, "index", None):
+        return None
+    from jobindex import JobIndex
+    return JobIndex(args.index)
+
+def _resolve_info(args, stego):
+    """
+    Mencari parameter ekstraksi dari --info, sidecar, chunk metadata WAV, atau
+    keystore (lihat resolve_stego_info), lalu menerapkan override --bits dan --alpha.
+    """
+    info = None
+    if args.info:
+        with open(args.info, 'r') as f:
+            info = json.load(f)
+    else:
+        keystore = KeyStore(args.keystore) if getattr(args, "keystore", None) else None
+        index = _open_index(args)
+        try:
+            info = resolve_stego_info(stego, keystore=keystore, key_id=args.key_id, index=index)
+        finally:
+            if index is not None:
+                index.close()
+        if info is None and keystore is not None and args.stego == "-" and not args.key_id:
+            raise ValueError("--key-id wajib diisi saat membaca dari stdin dengan --keystore")
+
+    info = dict(info or {})
+    if args.bits is not None:
+        info["bits_length"] = args.bits
+    if args.alpha is not None:
+        info["alpha"] = args.alpha
+    return info
+
+def cmd_embed(args, stdout):
+    """Subcommand embed: sisipkan pesan ke audio carrier."""
+    if args.message is not None:
+        message = args.message
+    elif args.message_file is not None:
+        if args.message_file == "-" and args.carrier == "-":
+            raise ValueError("Carrier dan pesan tidak bisa sama-sama dibaca dari stdin")
+        message = _read_text_input(args.message_file)
+    else:
+        raise ValueError("Gunakan --message atau --message-file")
+
+    to_stdout = args.output == "-"
+    # Dengan chunk metadata, parameter publik ada di WAV dan kunci privat di keystore
+    sidecars = not (to_stdout or args.metadata_chunk)
+    info_file = args.info or (args.output + ".info" if sidecars else None)
+    key_file = args.key_file or (args.output + ".key" if sidecars else None)
+    if args.metadata_chunk and not args.keystore:
+        raise ValueError("--metadata-chunk memerlukan --keystore untuk menyimpan kunci privat")
+    if to_stdout and info_file is None and not args.keystore:
+        raise ValueError("Output ke stdout memerlukan --info atau --keystore untuk menyimpan kunci")
+    key_id = None
+    if args.keystore:
+        key_id = args.key_id or (None if to_stdout else path_key_id(args.output))
+        if key_id is None:
+            raise ValueError("--key-id wajib diisi saat menulis ke stdout dengan --keystore")
+        if key_id in KeyStore(args.keystore):
+            raise ValueError(f"key_id sudah ada di keystore: {key_id} (gunakan --key-id lain)")
+
+    carrier = _open_audio_input(args.carrier)
+    output = io.BytesIO() if to_stdout else args.output
+    start = time.perf_counter()
+    info = embed_payload(carrier, output, message, alpha=args.alpha, dwt=_make_dwt(args),
+                         validate=args.validate, subtype=args.subtype, verify=args.verify,
+                         bands=_parse_bands(args), spread=args.spread, workers=args.workers,
+                         metadata_chunk=args.metadata_chunk, key_id=key_id,
+                         cache=CarrierCache(args.cache, args.cache_size << 20) if args.cache else None,
+                         fec=args.fec)
+    seconds = time.perf_counter() - start
+
+    save_key_files(info, key_file=key_file, info_file=info_file)
+    if args.keystore:
+        KeyStore(args.keystore).put(key_id, info)
+        print(f"Kunci disimpan dalam keystore {args.keystore} dengan key_id {key_id}")
+    index = _open_index(args)
+    if index is not None:
+        with index:
+            job_id = record_job(index, info, carrier, output, key_id=key_id, seconds=seconds)
+        print(f"Job dicatat dalam indeks {args.index} dengan id {job_id}")
+
+    if to_stdout:
+        _write_output("-", output.getvalue(), stdout)
+    return 0
+
+def cmd_container(args, stdout):
+    """Subcommand container: sisipkan beberapa pesan untuk penerima berbeda ke satu carrier."""
+    from container import embed_container
+
+    messages = list(args.message or [])
+    for path in args.message_file or []:
+        if path == "-" and args.carrier == "-":
+            raise ValueError("Carrier dan pesan tidak bisa sama-sama dibaca dari stdin")
+        messages.append(_read_text_input(path))
+    if len(messages) < 1:
+        raise ValueError("Gunakan --message atau --message-file (boleh diulang)")
+    if args.output == "-":
+        raise ValueError("Output kontainer harus berupa file (info ditulis per penerima)")
+    keystore = KeyStore(args.keystore) if args.keystore else None
+    prefix = args.key_id or path_key_id(args.output)
+    if keystore is not None:
+        taken = [f"{prefix}.{entry}" for entry in range(len(messages)) if f"{prefix}.{entry}" in keystore]
+        if taken:
+            raise ValueError(f"key_id sudah ada di keystore: {', '.join(taken)} (gunakan --key-id lain)")
+
+    infos = embed_container(_open_audio_input(args.carrier), args.output, messages,
+                            alpha=args.alpha, dwt=_make_dwt(args), subtype=args.subtype,
+                            verify=args.verify, workers=args.workers,
+                            cache=CarrierCache(args.cache, args.cache_size << 20) if args.cache else None,
+                            slots=args.slots)
+
+    for entry, info in enumerate(infos):
+        # Setiap penerima hanya menerima info dan kuncinya sendiri
+        save_key_files(info, key_file=f"{args.output}.{entry}.key", info_file=f"{args.output}.{entry}.info")
+        if keystore is not None:
+            keystore.put(f"{prefix}.{entry}", info)
+            print(f"Kunci penerima {entry} disimpan dalam keystore {args.keystore} "
+                  f"dengan key_id {prefix}.{entry}")
+    return 0
+
+def cmd_append(args, stdout):
+    """Subcommand append: tambahkan pesan penerima baru ke kontainer yang sudah ada."""
+    from container import append_container
+
+    if args.message is not None:
+        message = args.message
+    elif args.message_file is not None:
+        message = _read_text_input(args.message_file)
+    else:
+        raise ValueError("Gunakan --message atau --message-file")
+
+    # Parameter publik (alpha, dtype, transformasi) dapat diambil dari info penerima lain
+    info = {}
+    if args.info:
+        with open(args.info, 'r') as f:
+            info = json.load(f)
+    alpha = args.alpha if args.alpha is not None else info.get("alpha", 0.001)
+    output = args.output or args.stego
+    info = append_container(args.stego, message, alpha=alpha, dwt=_make_dwt(args, info),
+                            output_file=args.output)
+
+    entry = info["entry"]
+    save_key_files(info, key_file=f"{output}.{entry}.key", info_file=f"{output}.{entry}.info")
+    if args.keystore:
+        key_id = f"{args.key_id or path_key_id(output)}.{entry}"
+        KeyStore(args.keystore).put(key_id, info)
+        print(f"Kunci penerima {entry} disimpan dalam keystore {args.keystore} dengan key_id {key_id}")
+    return 0
+
+def cmd_shard(args, stdout):
+    """Subcommand shard: bagi satu pesan ke beberapa carrier."""
+    from multicarrier import embed_sharded
+
+    if args.message is not None:
+        message = args.message
+    elif args.message_file is not None:
+        message = _read_text_input(args.message_file)
+    else:
+        raise ValueError("Gunakan --message atau --message-file")
+
+    info, _ = embed_sharded(args.carriers, args.output_dir, message, alpha=args.alpha,
+                            dwt=_make_dwt(args), subtype=args.subtype, workers=args.workers)
+    base = os.path.join(args.output_dir, "shards")
+    save_key_files(info, key_file=base + ".key", info_file=base + ".info")
+    if args.keystore:
+        key_id = args.key_id or path_key_id(args.output_dir)
+        KeyStore(args.keystore).put(key_id, info)
+        print(f"Kunci juga disimpan dalam keystore {args.keystore} dengan key_id {key_id}")
+    return 0
+
+def cmd_unshard(args, stdout):
+    """Subcommand unshard: susun ulang shard dari direktori dan dekripsi pesannya."""
+    from multicarrier import extract_sharded
+
+    info = {}
+    info_file = args.info
+    if info_file is None and os.path.isdir(args.inputs[0]):
+        info_file = os.path.join(args.inputs[0], "shards.info")
+    if args.keystore and args.key_id:
+        info = KeyStore(args.keystore).get(args.key_id) or {}
+    elif info_file is not None and os.path.exists(info_file):
+        with open(info_file, 'r') as f:
+            info = json.load(f)
+    if not info:
+        raise ValueError("Kunci tidak ditemukan: gunakan --info atau --keystore dengan --key-id")
+
+    message = extract_sharded(args.inputs, info.get("ecc_private_key"), info.get("rsa_private_key"),
+                              alpha=args.alpha if args.alpha is not None else info.get("alpha", 0.001),
+                              dwt=_make_dwt(args, info), expected_hash=info.get("payload_hash"),
+                              workers=args.workers)
+    _write_output(args.output, message if args.output != "-" else message + "\n", stdout)
+    return 0
+
+def cmd_extract(args, stdout):
+    """Subcommand extract: ekstrak dan dekripsi pesan dari audio stego."""
+    stego = _open_audio_input(args.stego)
+    info = _resolve_info(args, stego)
+    if "bits_length" not in info:
+        raise ValueError("Jumlah bit tidak diketahui: gunakan --info, --keystore, atau --bits")
+
+    message = extract_payload(
+        stego,
+        info["bits_length"],
+        alpha=info.get("alpha", 0.001),
+        ecc_private_key=info.get("ecc_private_key"),
+        rsa_private_key=info.get("rsa_private_key"),
+        dwt=_make_dwt(args, info),
+        multiband=info.get("multiband", False),
+        spread_key=info.get("spread_key"),
+        fec=info.get("fec"),
+        soft=args.soft,
+        recipient_key=info.get("rsa_public_key") if info.get("container") else None,
+    )
+    _write_output(args.output, message if args.output != "-" else message + "\n", stdout)
+    return 0
+
+def cmd_debug(args, stdout):
+    """Subcommand debug: tampilkan data mentah hasil ekstraksi."""
+    stego = _open_audio_input(args.stego)
+    info = _resolve_info(args, stego)
+    if "bits_length" not in info:
+        raise ValueError("Jumlah bit tidak diketahui: gunakan --info atau --bits")
+    if info.get("container"):
+        raise ValueError("Debug belum mendukung kontainer multi-pesan; gunakan extract")
+    debug_extract(stego, num_bits=info["bits_length"], alpha=info.get("alpha", 0.001),
+                  dwt=_make_dwt(args, info), multiband=info.get("multiband", False),
+                  spread_key=info.get("spread_key"), fec=info.get("fec"))
+    return 0
+
+def cmd_margin(args, stdout):
+    """Subcommand margin: histogram keyakinan bit hasil ekstraksi soft-decision."""
+    stego = _open_audio_input(args.stego)
+    info = _resolve_info(args, stego)
+    if "bits_length" not in info:
+        raise ValueError("Jumlah bit tidak diketahui: gunakan --info, --keystore, atau --bits")
+    if info.get("multiband") or info.get("spread_key"):
+        raise ValueError("Histogram keyakinan hanya mendukung mode satu band berurutan")
+
+    dwt = _make_dwt(args, info)
+    alpha = info.get("alpha", 0.001)
+    audio_data, _ = dwt.read_audio(stego)
+    _, confidence = dwt.extract_soft_from_coefficients(dwt.apply_dwt(audio_data), info["bits_length"],
+                                                       alpha=alpha)
+    report = confidence_report(confidence, bins=args.bins)
+    if args.json:
+        stdout.write(json.dumps({"stego": args.stego, "alpha": alpha, **report}) + "\n")
+        return 0
+    stdout.write(f"Keyakinan {report['bits']} bit (alpha {alpha}):\n")
+    peak = max(report["histogram"]) or 1
+    for i, count in enumerate(report["histogram"]):
+        bar = "#" * round(40 * count / peak)
+        stdout.write(f"  {i / args.bins:.2f}-{(i + 1) / args.bins:.2f} {bar:<40} {count}\n")
+    stdout.write(f"Rata-rata {report['mean_confidence']:.3f}, minimum {report['min_confidence']:.3f}, "
+                 f"{report['low_confidence_bits']} bit di bawah {LOW_CONFIDENCE}\n")
+    return 0
+
+def cmd_capacity(args, stdout):
+    """Subcommand capacity: hitung kapasitas penyisipan audio carrier."""
+    dwt = _make_dwt(args)
+    audio_data, sample_rate = dwt.read_audio(_open_audio_input(args.carrier))
+    # Dengan --level > 1, embed menyebar payload ke semua band (multi-band), sehingga
+    # kapasitasnya adalah jumlah kapasitas band dikurangi tabel band di dalam audio
+    single_band = audio_capacity(audio_data, dwt=dwt)
+    capacity = single_band
+    if dwt.level > 1:
+        bands = audio_band_capacities(audio_data, dwt=dwt)
+        capacity = sum(bands.values()) - band_layout.table_length(bands)
+    result = {
+        "carrier": args.carrier,
+        "sample_rate": sample_rate,
+        "samples": len(audio_data),
+        "capacity_bits": capacity,
+        "capacity_bytes": capacity // 8,
+    }
+    if dwt.level > 1:
+        result["bands"] = {str(band): bits for band, bits in bands.items()}
+        result["multiband_capacity_bits"] = capacity
+        result["single_band_capacity_bits"] = single_band
+    if args.json:
+        stdout.write(json.dumps(result) + "\n")
+    else:
+        label = "Kapasitas multi-band" if dwt.level > 1 else "Kapasitas"
+        stdout.write(f"{label}: {capacity} bit ({capacity // 8} byte) "
+                     f"dari {len(audio_data)} sampel @ {sample_rate} Hz\n")
+        if dwt.level > 1:
+            for band, bits in bands.items():
+                stdout.write(f"  Band {band} (cD{dwt.level - band + 1}): {bits} bit\n")
+            stdout.write(f"  Tabel band: {band_layout.table_length(bands)} bit\n")
+    return 0
+
+def cmd_sweep(args, stdout):
+    """Subcommand sweep: evaluasi grid alpha dan rekomendasi alpha terkecil yang memenuhi target."""
+    import sweep
+    from steg import fec as fec_codec
+
+    if args.message is not None or args.message_file is not None:
+        if args.message_file == "-" and args.carrier == "-":
+            raise ValueError("Carrier dan pesan tidak bisa sama-sama dibaca dari stdin")
+        message = args.message if args.message is not None else _read_text_input(args.message_file)
+        all_bits, _, _ = prepare_message(message)
+    elif args.bits is not None:
+        import numpy as np
+        all_bits = "".join(np.random.default_rng(args.seed).choice(("0", "1"), size=args.bits))
+    else:
+        raise ValueError("Gunakan --message, --message-file, atau --bits")
+    if args.fec:
+        all_bits = fec_codec.encode_bits(all_bits, args.fec)
+
+    if args.alphas:
+        try:
+            alphas = [float(alpha) for alpha in args.alphas.split(",")]
+        except ValueError:
+            raise ValueError(f"--alphas harus berupa daftar angka, misalnya 0.0005,0.001: {args.alphas!r}")
+    else:
+        alphas = sweep.alpha_grid(args.alpha_min, args.alpha_max, args.steps)
+
+    dwt = _make_dwt(args)
+    audio_data, _ = dwt.read_audio(_open_audio_input(args.carrier))
+    rows = sweep.sweep_alpha(audio_data, all_bits, alphas, dwt=dwt, subtype=args.subtype)
+    recommended = sweep.recommend_alpha(rows, target_ber=args.target_ber, target_snr=args.target_snr)
+    targets = {"ber": args.target_ber, "snr_db": args.target_snr, "subtype": args.subtype,
+               "bits": len(all_bits)}
+
+    if args.csv:
+        sweep.write_csv(rows, args.csv)
+    if args.json_file:
+        sweep.write_json(rows, args.json_file, recommended=recommended, targets=targets)
+    if args.chart:
+        sweep.write_chart(rows, args.chart, recommended=recommended, target_ber=args.target_ber,
+                          target_snr=args.target_snr)
+
+    if args.json:
+        stdout.write(json.dumps({"carrier": args.carrier, "targets": targets,
+                                 "recommended": recommended, "results": rows}) + "\n")
+    else:
+        stdout.write(f"Sweep {len(rows)} alpha untuk {len(all_bits)} bit (output {args.subtype}):\n")
+        stdout.write(sweep.format_table(rows, recommended) + "\n")
+        if recommended is None:
+            stdout.write("Tidak ada alpha pada grid yang memenuhi target BER dan SNR\n")
+        else:
+            stdout.write(f"Rekomendasi alpha: {recommended['alpha']:.6g} (SNR {recommended['snr_db']:.2f} dB, "
+                         f"BER {recommended['ber']:.6f})\n")
+    return 0 if recommended is not None else 1
+
+def cmd_scan(args, stdout):
+    """Subcommand scan: ekstraksi batch dari direktori atau pola glob."""
+    from batch import batch_extract
+
+    jsonl_path = args.jsonl
+    if jsonl_path is None and args.output_dir is None:
+        jsonl_path = "-"
+    with contextlib.redirect_stdout(stdout):
+        summary = batch_extract(args.inputs, jsonl_path=jsonl_path, output_dir=args.output_dir,
+                                workers=args.workers, max_in_flight=args.max_in_flight,
+                                keystore_root=args.keystore, index_path=args.index)
+    print(f"Selesai: {summary['ok']} berhasil, {summary['failed']} gagal dari {summary['total']} file")
+    if args.index:
+        print(f"Terindeks: {summary['indexed']} file, duplikat: {summary['duplicates']} file")
+    return 0 if summary["failed"] == 0 else 1
+
+def cmd_bench(args, stdout):
+    """Subcommand bench: ukur waktu setiap tahap embed dan extract di memori."""
+    dwt = _make_dwt(args)
+    if args.carrier is None:
+        carrier = io.BytesIO()
+        generate_audio(carrier, duration=args.duration)
+        carrier.seek(0)
+    else:
+        carrier = _open_audio_input(args.carrier)
+    audio_data, sample_rate = dwt.read_audio(carrier)
+
+    timings = {"prepare": [], "embed": [], "write": [], "read": [], "extract": []}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        all_bits, ecc_crypto, rsa_crypto = prepare_message(args.message)
+        timings["prepare"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        stego_data = embed_bits_in_audio(audio_data, all_bits, alpha=args.alpha, dwt=dwt,
+                                         validate=args.validate)
+        timings["embed"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        buffer = io.BytesIO()
+        dwt.save_audio(buffer, stego_data, sample_rate)
+        timings["write"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        buffer.seek(0)
+        stego_data, _ = dwt.read_audio(buffer)
+        timings["read"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        coeffs = dwt.apply_dwt(stego_data)
+        bits = dwt.extract_bits_from_coefficients(coeffs, len(all_bits), alpha=args.alpha)
+        decoded = decode_payload_bits(bits, ecc_crypto.get_private_key(), rsa_crypto.get_private_key())
+        timings["extract"].append(time.perf_counter() - start)
+        if decoded != args.message:
+            raise ValueError("Pesan hasil ekstraksi tidak sama dengan pesan asli")
+
+    stdout.write(f"{'Tahap':<10} {'Rata-rata (ms)':>15} {'Min (ms)':>10}\n")
+    for stage, values in timings.items():
+        stdout.write(f"{stage:<10} {1000 * sum(values) / len(values):>15.2f} {1000 * min(values):>10.2f}\n")
+    return 0
+
+def cmd_jobs(args, stdout):
+    """Subcommand jobs: ringkasan atau pencarian job di indeks job."""
+    from jobindex import JobIndex
+
+    if not os.path.exists(args.index):
+        raise FileNotFoundError(f"Indeks tidak ditemukan: {args.index}")
+    with JobIndex(args.index) as index:
+        if args.path or args.fingerprint:
+            if args.path:
+                job = index.lookup(args.path)
+                jobs = [job] if job is not None else []
+            else:
+                jobs = index.find_by_fingerprint(args.fingerprint)
+            for job in jobs:
+                stdout.write(json.dumps(job) + "\n")
+        else:
+            stdout.write(json.dumps(index.report(), indent=None if args.json else 2) + "\n")
+    return 0
+
+def cmd_daemon(args, stdout):
+    """Subcommand daemon: jalankan daemon lokal dengan UNIX socket."""
+    from daemon import StegoDaemon
+
+    daemon = StegoDaemon(args.socket, workers=args.workers, max_pending=args.max_pending,
+                         job_timeout=args.timeout, keystore_root=args.keystore,
+                         use_threads=args.threads)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("Daemon dihentikan")
+    return 0
+
+def build_parser():
+    """Membuat parser argumen untuk semua subcommand."""
+    parser = argparse.ArgumentParser(
+        description="Steganografi audio dengan enkripsi ganda ECC+RSA dan DWT. "
+                    "Jalankan tanpa argumen untuk menu interaktif.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    p = subparsers.add_parser("embed", help="Sisipkan pesan ke audio carrier")
+    p.add_argument("carrier", help="File WAV carrier ('-' untuk stdin)")
+    p.add_argument("-o", "--output", required=True, help="File WAV stego ('-' untuk stdout)")
+    p.add_argument("-m", "--message", help="Pesan yang akan disembunyikan")
+    p.add_argument("--message-file", help="File berisi pesan ('-' untuk stdin)")
+    p.add_argument("--alpha", type=float, default=0.001, help="Parameter DWT (default 0.001)")
+    p.add_argument("--dtype", choices=DTYPES, default="float64",
+                   help="Tipe sampel pemrosesan (default float64; int16/int32 memakai "
+                        "lifting integer yang eksak)")
+    p.add_argument("--validate", action="store_true",
+                   help="Validasi round-trip ekstraksi sebelum menulis output")
+    p.add_argument("--transform", choices=TRANSFORMS,
+                   help="Backend transformasi wavelet (default pywt, dicatat di .info)")
+    p.add_argument("--verify", action="store_true",
+                   help="Verifikasi payload di memori (dengan kuantisasi output) dan "
+                        "laporkan BER sebelum menulis")
+    p.add_argument("--subtype", choices=OUTPUT_SUBTYPES,
+                   help="Subtype WAV output; penyisipan dibuat sadar-kuantisasi dan "
+                        "diverifikasi di memori (misalnya PCM_16)")
+    p.add_argument("--level", type=int, default=1,
+                   help="Level dekomposisi; >1 menyebar payload ke semua band detail (multi-band)")
+    p.add_argument("--bands",
+                   help="Urutan band multi-band, misalnya 3,2,1 (1 = cD paling kasar, "
+                        "level = cD1); dicatat dalam tabel di audio")
+    p.add_argument("--spread", action="store_true",
+                   help="Sebar payload ke seluruh audio dengan permutasi berkunci "
+                        "(kunci disimpan di .info/keystore)")
+    p.add_argument("--workers", type=int,
+                   help="Transformasi dan rekonstruksi paralel per segmen waktu dengan N proses "
+                        "(hasil identik dengan jalur serial)")
+    p.add_argument("--fec", choices=tuple(FEC_CODES),
+                   help="Kode koreksi kesalahan (Hamming + interleaver) untuk bit terenkripsi; "
+                        "ekstraksi melaporkan jumlah bit yang dikoreksi")
+    p.add_argument("--metadata-chunk", action="store_true",
+                   help="Simpan parameter publik dalam chunk RIFF di WAV output dan kunci "
+                        "privat hanya di keystore (tanpa .info/.key; memerlukan --keystore)")
+    p.add_argument("--info", help="Path file .info (default <output>.info)")
+    p.add_argument("--key-file", help="Path file .key (default <output>.key)")
+    p.add_argument("--keystore", help="Direktori keystore untuk menyimpan kunci")
+    p.add_argument("--key-id", help="key_id di keystore (default nama file output + hash path absolut; "
+                                    "key_id yang sudah ada tidak ditimpa)")
+    p.add_argument("--index", help="File SQLite indeks job tempat penyisipan dicatat")
+    p.add_argument("--cache", help="Direktori cache sampel dan koefisien carrier (.npy); "
+                                   "penyisipan berulang ke carrier yang sama melewati dekode dan DWT")
+    p.add_argument("--cache-size", type=int, default=1024,
+                   help="Batas ukuran cache dalam MiB (default 1024); entri terlama dihapus")
+    p.set_defaults(func=cmd_embed)
+
+    p = subparsers.add_parser("container", help="Sisipkan beberapa pesan untuk penerima berbeda ke satu carrier")
+    p.add_argument("carrier", help="File WAV carrier ('-' untuk stdin)")
+    p.add_argument("-o", "--output", required=True,
+                   help="File WAV stego; info penerima ke-i ditulis ke <output>.<i>.info")
+    p.add_argument("-m", "--message", action="append", help="Pesan untuk satu penerima (boleh diulang)")
+    p.add_argument("--message-file", action="append",
+                   help="File berisi pesan untuk satu penerima (boleh diulang)")
+    p.add_argument("--alpha", type=float, default=0.001, help="Parameter DWT (default 0.001)")
+    p.add_argument("--dtype", choices=DTYPES, default="float64", help="Tipe sampel pemrosesan")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet (default pywt)")
+    p.add_argument("--subtype", choices=OUTPUT_SUBTYPES, help="Subtype WAV output")
+    p.add_argument("--verify", action="store_true", help="Verifikasi kontainer di memori sebelum menulis")
+    p.add_argument("--workers", type=int, help="Transformasi dan rekonstruksi paralel per segmen waktu")
+    p.add_argument("--cache", help="Direktori cache sampel dan koefisien carrier")
+    p.add_argument("--cache-size", type=int, default=1024,
+                   help="Batas ukuran cache dalam MiB (default 1024); entri terlama dihapus")
+    p.add_argument("--keystore", help="Direktori keystore untuk menyimpan kunci setiap penerima")
+    p.add_argument("--key-id", help="Awalan key_id di keystore (default nama file output + hash path); "
+                                    "penerima ke-i memakai <awalan>.<i>")
+    p.add_argument("--slots", type=int,
+                   help="Jumlah slot TOC, termasuk cadangan untuk subcommand append "
+                        "(default jumlah pesan)")
+    p.set_defaults(func=cmd_container)
+
+    p = subparsers.add_parser("append", help="Tambahkan pesan penerima baru ke kontainer tanpa "
+                                             "menyisipkan ulang dari carrier")
+    p.add_argument("stego", help="File WAV kontainer (diubah di tempat kecuali -o diisi)")
+    p.add_argument("-o", "--output", help="Tulis ke salinan ini alih-alih mengubah file kontainer")
+    p.add_argument("-m", "--message", help="Pesan untuk penerima baru")
+    p.add_argument("--message-file", help="File berisi pesan ('-' untuk stdin)")
+    p.add_argument("--info", help="File .info penerima lain untuk mengambil alpha, dtype, dan transformasi")
+    p.add_argument("--alpha", type=float, help="Parameter DWT (default dari --info atau 0.001)")
+    p.add_argument("--dtype", choices=DTYPES, default="float64", help="Tipe sampel pemrosesan")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet")
+    p.add_argument("--keystore", help="Direktori keystore untuk menyimpan kunci penerima baru")
+    p.add_argument("--key-id", help="Awalan key_id di keystore (default nama file output + hash path)")
+    p.set_defaults(func=cmd_append)
+
+    p = subparsers.add_parser("shard", help="Bagi pesan yang melebihi kapasitas satu carrier ke "
+                                            "beberapa carrier")
+    p.add_argument("carriers", nargs="+", help="File WAV carrier; perencana kapasitas memilih yang dipakai")
+    p.add_argument("-o", "--output-dir", required=True,
+                   help="Direktori file shard; info ditulis ke <output-dir>/shards.info")
+    p.add_argument("-m", "--message", help="Pesan yang akan disembunyikan")
+    p.add_argument("--message-file", help="File berisi pesan ('-' untuk stdin)")
+    p.add_argument("--alpha", type=float, default=0.001, help="Parameter DWT (default 0.001)")
+    p.add_argument("--dtype", choices=DTYPES, default="float64", help="Tipe sampel pemrosesan")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet (default pywt)")
+    p.add_argument("--subtype", choices=OUTPUT_SUBTYPES, help="Subtype WAV output")
+    p.add_argument("--workers", type=int, help="Jumlah proses worker (default jumlah CPU)")
+    p.add_argument("--keystore", help="Direktori keystore untuk menyimpan kunci")
+    p.add_argument("--key-id", help="key_id di keystore (default nama direktori output + hash path)")
+    p.set_defaults(func=cmd_shard)
+
+    p = subparsers.add_parser("unshard", help="Susun ulang shard dari direktori dan dekripsi pesannya")
+    p.add_argument("inputs", nargs="+", help="Direktori, pola glob, atau file shard")
+    p.add_argument("-o", "--output", default="-", help="File pesan ('-' untuk stdout)")
+    p.add_argument("--info", help="Path file .info (default <direktori>/shards.info)")
+    p.add_argument("--keystore", help="Direktori keystore")
+    p.add_argument("--key-id", help="key_id di keystore")
+    p.add_argument("--alpha", type=float, help="Parameter DWT (default dari .info)")
+    p.add_argument("--dtype", choices=DTYPES, default="float64",
+                   help="Tipe sampel pemrosesan (mode integer diambil dari .info)")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet (default dari .info)")
+    p.add_argument("--workers", type=int, help="Jumlah proses worker (default jumlah CPU)")
+    p.set_defaults(func=cmd_unshard)
+
+    for name, func, help_text in (("extract", cmd_extract, "Ekstrak dan dekripsi pesan"),
+                                  ("debug", cmd_debug, "Tampilkan data mentah hasil ekstraksi")):
+        p = subparsers.add_parser(name, help=help_text)
+        p.add_argument("stego", help="File WAV stego ('-' untuk stdin)")
+        p.add_argument("--info", help="Path file .info (default <stego>.info)")
+        p.add_argument("--keystore", help="Direktori keystore")
+        p.add_argument("--key-id", help="key_id di keystore (default dari chunk metadata atau path file stego)")
+        p.add_argument("--index", help="File SQLite indeks job (parameter dicari di sini dahulu)")
+        p.add_argument("--bits", type=int, help="Jumlah bit yang akan diekstrak")
+        p.add_argument("--alpha", type=float, help="Parameter DWT")
+        if name == "extract":
+            p.add_argument("-o", "--output", default="-", help="File pesan ('-' untuk stdout)")
+            p.add_argument("--dtype", choices=DTYPES, default="float64",
+                           help="Tipe sampel pemrosesan (default float64; mode integer "
+                                "diambil dari .info)")
+            p.add_argument("--transform", choices=TRANSFORMS,
+                           help="Backend transformasi wavelet (default dari .info)")
+            p.add_argument("--soft", action="store_true",
+                           help="Ekstraksi soft-decision: keyakinan setiap bit dipakai decoder FEC "
+                                "dan ringkasannya dilaporkan")
+        p.set_defaults(func=func)
+
+    p = subparsers.add_parser("margin", help="Histogram keyakinan bit (jarak sisa ke ambang ekstraksi)")
+    p.add_argument("stego", help="File WAV stego ('-' untuk stdin)")
+    p.add_argument("--info", help="Path file .info (default <stego>.info)")
+    p.add_argument("--keystore", help="Direktori keystore")
+    p.add_argument("--key-id", help="key_id di keystore (default dari chunk metadata atau path file stego)")
+    p.add_argument("--index", help="File SQLite indeks job (parameter dicari di sini dahulu)")
+    p.add_argument("--bits", type=int, help="Jumlah bit yang akan diperiksa")
+    p.add_argument("--alpha", type=float, help="Parameter DWT")
+    p.add_argument("--bins", type=int, default=10, help="Jumlah bin histogram (default 10)")
+    p.add_argument("--json", action="store_true", help="Tampilkan hasil dalam format JSON")
+    p.set_defaults(func=cmd_margin)
+
+    p = subparsers.add_parser("capacity", help="Hitung kapasitas penyisipan audio carrier")
+    p.add_argument("carrier", help="File WAV carrier ('-' untuk stdin)")
+    p.add_argument("--json", action="store_true", help="Tampilkan hasil dalam format JSON")
+    p.add_argument("--dtype", choices=DTYPES, default="float64",
+                   help="Tipe sampel pemrosesan (default float64; int16/int32 memakai "
+                        "lifting integer yang eksak)")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet (default pywt)")
+    p.add_argument("--level", type=int, default=1,
+                   help="Level dekomposisi; >1 menampilkan kapasitas per band")
+    p.set_defaults(func=cmd_capacity)
+
+    p = subparsers.add_parser("sweep", help="Evaluasi grid alpha (SNR, BER round-trip, margin) dan "
+                                            "rekomendasikan alpha terkecil yang memenuhi target")
+    p.add_argument("carrier", help="File WAV carrier ('-' untuk stdin)")
+    p.add_argument("-m", "--message", help="Pesan uji (dienkripsi seperti pada embed)")
+    p.add_argument("--message-file", help="File berisi pesan uji ('-' untuk stdin)")
+    p.add_argument("--bits", type=int, help="Payload acak sepanjang N bit sebagai pengganti pesan")
+    p.add_argument("--seed", type=int, default=0, help="Seed payload acak (default 0)")
+    p.add_argument("--fec", choices=tuple(FEC_CODES), help="Kodekan payload dengan kode FEC sebelum sweep")
+    p.add_argument("--alphas", help="Daftar alpha dipisah koma (menggantikan grid logaritmik)")
+    p.add_argument("--alpha-min", type=float, default=1e-5, help="Alpha terkecil grid (default 1e-5)")
+    p.add_argument("--alpha-max", type=float, default=1e-2, help="Alpha terbesar grid (default 1e-2)")
+    p.add_argument("--steps", type=int, default=25, help="Jumlah alpha pada grid (default 25)")
+    p.add_argument("--subtype", choices=OUTPUT_SUBTYPES, default="PCM_16",
+                   help="Subtype WAV output untuk round-trip kuantisasi (default PCM_16)")
+    p.add_argument("--target-ber", type=float, default=0.0, help="BER maksimum (default 0)")
+    p.add_argument("--target-snr", type=float, help="SNR minimum dalam dB")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet (default pywt)")
+    p.add_argument("--csv", help="Simpan tabel hasil sebagai CSV")
+    p.add_argument("--json-file", help="Simpan hasil dan rekomendasi sebagai file JSON")
+    p.add_argument("--chart", help="Simpan grafik SNR/BER terhadap alpha (PNG, memerlukan matplotlib)")
+    p.add_argument("--json", action="store_true", help="Tampilkan hasil dalam format JSON")
+    p.set_defaults(func=cmd_sweep)
+
+    p = subparsers.add_parser("scan", help="Ekstraksi batch dari direktori atau pola glob")
+    p.add_argument("inputs", nargs="+", help="Direktori, pola glob, atau file stego")
+    p.add_argument("--jsonl", help="File JSONL untuk hasil ('-' untuk stdout)")
+    p.add_argument("--output-dir", help="Direktori untuk menyimpan pesan hasil ekstraksi")
+    p.add_argument("--workers", type=int, help="Jumlah proses worker")
+    p.add_argument("--max-in-flight", type=int, help="Batas file yang didekode bersamaan")
+    p.add_argument("--keystore", help="Direktori keystore untuk file tanpa sidecar .info")
+    p.add_argument("--index", help="File SQLite indeks job untuk parameter, deduplikasi, dan laporan")
+    p.set_defaults(func=cmd_scan)
+
+    p = subparsers.add_parser("jobs", help="Ringkasan atau pencarian job di indeks job")
+    p.add_argument("index", help="File SQLite indeks job")
+    p.add_argument("--path", help="Tampilkan job terbaru untuk file stego ini")
+    p.add_argument("--fingerprint", help="Tampilkan semua job dengan sidik jari kunci ini")
+    p.add_argument("--json", action="store_true", help="Ringkasan dalam satu baris JSON")
+    p.set_defaults(func=cmd_jobs)
+
+    p = subparsers.add_parser("bench", help="Ukur waktu embed dan extract di memori")
+    p.add_argument("carrier", nargs="?", help="File WAV carrier ('-' untuk stdin, default audio sampel)")
+    p.add_argument("-m", "--message", default="Pesan rahasia untuk benchmark", help="Pesan uji")
+    p.add_argument("--alpha", type=float, default=0.001, help="Parameter DWT (default 0.001)")
+    p.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan (default 3)")
+    p.add_argument("--duration", type=float, default=10, help="Durasi audio sampel dalam detik")
+    p.add_argument("--dtype", choices=DTYPES, default="float64",
+                   help="Tipe sampel pemrosesan (default float64; int16/int32 memakai "
+                        "lifting integer yang eksak)")
+    p.add_argument("--validate", action="store_true", help="Validasi round-trip setiap penyisipan")
+    p.add_argument("--transform", choices=TRANSFORMS, help="Backend transformasi wavelet (default pywt)")
+    p.set_defaults(func=cmd_bench)
+
+    p = subparsers.add_parser("daemon", help="Jalankan daemon lokal dengan job API lewat UNIX socket")
+    p.add_argument("--socket", required=True, help="Path UNIX socket")
+    p.add_argument("--workers", type=int, help="Jumlah worker (default jumlah CPU)")
+    p.add_argument("--max-pending", type=int, help="Batas job bersamaan (default 2 x workers)")
+    p.add_argument("--timeout", type=float, default=60.0, help="Batas waktu per job dalam detik")
+    p.add_argument("--keystore", help="Direktori keystore yang dipegang daemon")
+    p.add_argument("--threads", action="store_true", help="Gunakan thread alih-alih proses worker")
+    p.set_defaults(func=cmd_daemon)
+
+    return parser
+
+def interactive_menu():
+    """Menu interaktif CLI."""
     while True:
         print("\n===== STEGANOGRAFI AUDIO DENGAN ENKRIPSI GANDA ECC+RSA DAN DWT =====")
         print("1. Sisipkan pesan ke dalam file audio")
         print("2. Ekstrak pesan dari file audio")
         print("3. Debug ekstraksi")
         print("4. Keluar")
-        
+
         choice = input("\nPilih menu (1-4): ")
-        
+
         if choice == '1':
             embed_message()
         elif choice == '2':
@@ -26,5 +771,29 @@ def main():
         else:
             print("Pilihan tidak valid. Silakan pilih 1-4.")
 
+def main(argv=None):
+    """Fungsi utama CLI."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        interactive_menu()
+        return 0
+
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        build_parser().print_help()
+        return 2
+
+    # Log proses dialihkan ke stderr agar stdout hanya berisi data (audio/pesan)
+    stdout = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            if args.command == "debug":
+                with contextlib.redirect_stdout(stdout):
+                    return args.func(args, stdout)
+            return args.func(args, stdout)
+        except (ValueError, FileNotFoundError) as e:
+            print(f"Error: {str(e)}")
+            return 1
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
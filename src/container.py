@@ -0,0 +1,386 @@
+"""
+Kontainer multi-pesan: satu carrier memuat beberapa pesan terenkripsi yang
+independen, masing-masing untuk penerima (pasangan kunci ECC+RSA) berbeda.
+
+Tata letak bit pada koefisien detail (mode satu band berurutan):
+
+    [jumlah entri: 16 bit][jumlah slot: 16 bit][entri TOC x slot][segmen 1][segmen 2]...
+
+Setiap entri TOC berisi sidik jari kunci publik RSA penerima (64 bit), offset
+segmen dalam koefisien detail (32 bit), dan panjang segmen (32 bit). Slot TOC
+yang belum terisi disediakan untuk pesan yang ditambahkan kemudian (lihat
+append_container). Setiap segmen adalah payload standar (lihat
+core.prepare_message). Ekstraktor membaca TOC, mencari entri dengan sidik jari
+kuncinya, lalu hanya mentransformasi jendela sampel segmen tersebut dan hanya
+mendekripsi segmen itu; segmen milik penerima lain tidak pernah diekstrak
+maupun didekripsi.
+"""
+import hashlib
+
+from steg import AudioDWT, kernels, quantize_samples, OUTPUT_SUBTYPES
+from core import (prepare_message, build_stego_info, embed_bits_in_audio, verify_embedding,
+                  decode_payload_bits, _output_subtype, _fit_integer_range)
+
+# Lebar field TOC dalam bit
+COUNT_BITS = 16
+FINGERPRINT_BITS = 64
+FIELD_BITS = 32
+ENTRY_BITS = FINGERPRINT_BITS + 2 * FIELD_BITS
+
+def recipient_fingerprint(rsa_public_key):
+    """Sidik jari 64 bit kunci publik RSA (PEM) penerima."""
+    digest = hashlib.sha256(rsa_public_key.strip().encode('utf-8')).digest()
+    return int.from_bytes(digest[:FINGERPRINT_BITS // 8], 'big')
+
+def toc_length(slots):
+    """Panjang TOC dalam bit untuk `slots` slot entri."""
+    return 2 * COUNT_BITS + slots * ENTRY_BITS
+
+def encode_toc(entries, slots=None):
+    """
+    Mengodekan TOC sampai entri terakhir yang terisi (tanpa slot kosong).
+
+    Args:
+        entries (list): (sidik jari, offset, panjang) untuk setiap segmen
+        slots (int, optional): Jumlah slot TOC (default sama dengan jumlah entri)
+
+    Returns:
+        str: String bit TOC
+    """
+    slots = len(entries) if slots is None else slots
+    if not 1 <= len(entries) <= slots < 1 << COUNT_BITS:
+        raise ValueError(f"Jumlah pesan harus 1..{(1 << COUNT_BITS) - 1} dan tidak melebihi jumlah slot")
+    bits = [format(len(entries), f'0{COUNT_BITS}b'), format(slots, f'0{COUNT_BITS}b')]
+    for fingerprint, offset, length in entries:
+        if offset + length >= 1 << FIELD_BITS:
+            raise ValueError("Kontainer melebihi batas offset 32 bit")
+        bits.append(format(fingerprint, f'0{FINGERPRINT_BITS}b'))
+        bits.append(format(offset, f'0{FIELD_BITS}b'))
+        bits.append(format(length, f'0{FIELD_BITS}b'))
+    return "".join(bits)
+
+def _recipient_info(message, alpha):
+    """Mengenkripsi satu pesan dengan pasangan kunci baru; mengembalikan (bit, info)."""
+    bits, ecc_crypto, rsa_crypto = prepare_message(message)
+    info = build_stego_info(bits, ecc_crypto, rsa_crypto, message, alpha)
+    info["container"] = True
+    return bits, info
+
+def _record_dwt(info, dwt, subtype=None):
+    if subtype is not None:
+        info["subtype"] = subtype
+    if dwt.transform.name != 'pywt':
+        info["transform"] = dwt.transform.name
+    if dwt.integer:
+        info["dtype"] = dwt.dtype
+
+def build_container(messages, alpha=0.001, slots=None):
+    """
+    Mengenkripsi setiap pesan dengan pasangan kunci barunya sendiri dan
+    menyusun bit kontainer.
+
+    Args:
+        messages (list): Pesan untuk setiap penerima
+        alpha (float, optional): Parameter DWT yang dicatat di info
+        slots (int, optional): Jumlah slot TOC, termasuk slot cadangan untuk
+            append_container (default sama dengan jumlah pesan)
+
+    Returns:
+        tuple: (all_bits, infos) - bit kontainer dan informasi ekstraksi per
+            penerima (lihat core.build_stego_info) dengan info["container"]
+            dan info["entry"]
+    """
+    if not messages or any(not message for message in messages):
+        raise ValueError("Pesan tidak boleh kosong")
+
+    slots = max(len(messages), slots or 0)
+    segments, infos = [], []
+    for message in messages:
+        bits, info = _recipient_info(message, alpha)
+        info["entry"] = len(infos)
+        segments.append(bits)
+        infos.append(info)
+
+    entries = []
+    offset = toc_length(slots)
+    for bits, info in zip(segments, infos):
+        entries.append((recipient_fingerprint(info["rsa_public_key"]), offset, len(bits)))
+        offset += len(bits)
+    # Slot kosong diisi nol dan ditimpa oleh append_container
+    toc = encode_toc(entries, slots)
+    padding = "0" * (toc_length(slots) - len(toc))
+    return toc + padding + "".join(segments), infos
+
+def embed_container(input_file, output_file, messages, alpha=0.001, dwt=None, sample_rate=None,
+                    subtype=None, verify=False, workers=None, cache=None, slots=None):
+    """
+    Menyisipkan beberapa pesan untuk penerima berbeda ke satu carrier.
+
+    Args:
+        input_file (str, file-like, bytes-like, or numpy.ndarray): Audio input
+        output_file (str or file-like): Path atau objek file audio output
+        messages (list): Pesan untuk setiap penerima
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        sample_rate (int, optional): Sample rate, wajib jika input berupa array
+        subtype (str, optional): Subtype output (lihat core.embed_payload)
+        verify (bool, optional): Verifikasi seluruh kontainer di memori sebelum menulis
+        workers (int, optional): Jumlah proses untuk mode sharding
+        cache (CarrierCache, optional): Cache carrier (lihat steg.cache)
+        slots (int, optional): Jumlah slot TOC, termasuk cadangan untuk append_container
+
+    Returns:
+        list: Informasi ekstraksi untuk setiap penerima, sesuai urutan pesan
+
+    Raises:
+        ValueError: Jika pesan kosong, kontainer melebihi kapasitas, atau verifikasi gagal
+    """
+    import os
+
+    all_bits, infos = build_container(messages, alpha, slots)
+    print(f"Kontainer {len(messages)} pesan dengan panjang: {len(all_bits)} bit")
+
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    coeffs = None
+    if cache is not None and isinstance(input_file, (str, os.PathLike, bytes, bytearray, memoryview)):
+        audio_data, sample_rate, coeffs = cache.load(input_file, dwt, sample_rate)
+    else:
+        audio_data, sample_rate = dwt.read_audio(input_file, sample_rate)
+
+    reconstructed_data = embed_bits_in_audio(audio_data, all_bits, alpha=alpha, dwt=dwt,
+                                             subtype=subtype, workers=workers, coeffs=coeffs)
+    if verify:
+        report = verify_embedding(reconstructed_data, all_bits, alpha=alpha, dwt=dwt,
+                                  subtype=_output_subtype(output_file, subtype))
+        if report["bit_errors"]:
+            raise ValueError(f"Verifikasi gagal: BER {report['ber']:.6f} "
+                             f"({report['bit_errors']} dari {report['bits']} bit salah); "
+                             f"output tidak ditulis")
+    dwt.save_audio(output_file, reconstructed_data, sample_rate, subtype=subtype)
+
+    for info in infos:
+        _record_dwt(info, dwt, subtype)
+    return infos
+
+def _extract_range(stego_data, dwt, start, count, alpha):
+    detail = dwt.detail_range(stego_data, start, start + count)
+    if len(detail) < count:
+        raise ValueError("Data yang diekstrak tidak lengkap! Segmen melewati akhir audio.")
+    return kernels.array_to_bits(
+        kernels.extract_coefficients(detail, count, dwt.embedding_step(alpha), dwt.backend))
+
+def read_toc(read_bits):
+    """
+    Membaca TOC kontainer.
+
+    Args:
+        read_bits (callable): read_bits(awal, jumlah) mengembalikan string bit
+            dari koefisien detail [awal, awal + jumlah)
+
+    Returns:
+        tuple: (entri, slot) - (sidik jari, offset, panjang) untuk setiap
+            segmen, dan jumlah slot TOC
+
+    Raises:
+        ValueError: Jika TOC tidak valid
+    """
+    header = read_bits(0, 2 * COUNT_BITS)
+    count, slots = int(header[:COUNT_BITS], 2), int(header[COUNT_BITS:], 2)
+    if not 1 <= count <= slots:
+        raise ValueError(f"TOC kontainer tidak valid: {count} entri untuk {slots} slot")
+    bits = read_bits(2 * COUNT_BITS, count * ENTRY_BITS)
+    entries = []
+    for i in range(0, len(bits), ENTRY_BITS):
+        fingerprint = int(bits[i:i + FINGERPRINT_BITS], 2)
+        offset = int(bits[i + FINGERPRINT_BITS:i + FINGERPRINT_BITS + FIELD_BITS], 2)
+        length = int(bits[i + FINGERPRINT_BITS + FIELD_BITS:i + ENTRY_BITS], 2)
+        if offset < toc_length(slots):
+            raise ValueError("TOC kontainer tidak valid: segmen tumpang tindih dengan TOC")
+        entries.append((fingerprint, offset, length))
+    return entries, slots
+
+def extract_container_message(stego_file, rsa_public_key, ecc_private_key=None, rsa_private_key=None,
+                              alpha=0.001, dwt=None, sample_rate=None):
+    """
+    Mengekstrak dan mendekripsi hanya segmen milik satu penerima.
+
+    Args:
+        stego_file (str, file-like, bytes-like, or numpy.ndarray): Audio stego
+        rsa_public_key (str): Kunci publik RSA penerima (info["rsa_public_key"])
+        ecc_private_key (str, optional): Kunci privat ECC penerima
+        rsa_private_key (str, optional): Kunci privat RSA penerima
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        sample_rate (int, optional): Sample rate, wajib jika input berupa array
+
+    Returns:
+        str: Pesan yang didekripsi
+
+    Raises:
+        ValueError: Jika kontainer tidak memuat segmen untuk penerima ini,
+            atau segmen tidak dapat didekripsi
+    """
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    stego_data, sample_rate = dwt.read_audio(stego_file, sample_rate)
+
+    fingerprint = recipient_fingerprint(rsa_public_key)
+    entries, _ = read_toc(lambda start, count: _extract_range(stego_data, dwt, start, count, alpha))
+    for entry_fingerprint, offset, length in entries:
+        if entry_fingerprint == fingerprint:
+            bits = _extract_range(stego_data, dwt, offset, length, alpha)
+            return decode_payload_bits(bits, ecc_private_key, rsa_private_key)
+    raise ValueError(f"Kontainer ({len(entries)} entri) tidak memuat pesan untuk kunci ini")
+
+def _frame_window(f, dwt, start, stop):
+    """
+    Membaca hanya frame yang dibutuhkan untuk koefisien detail [start, stop)
+    dan untuk merekonstruksi sampel yang dipengaruhinya (lihat
+    TransformBackend.shard_window).
+
+    Returns:
+        tuple: (frame, koefisien jendela, (s0, s1, inv_start, lengths, fwd_start))
+            dengan [s0, s1) rentang sampel yang dipengaruhi koefisien tersebut
+    """
+    transform = dwt.transform
+    band_level = transform.band_level(1)
+    length = f.frames
+    # Margin dua kali support juga memuat sampel yang digeser _fit_integer_range
+    margin = 2 * transform.support
+    s0 = max(0, (start - margin) << band_level)
+    s1 = min(length, (stop + margin) << band_level)
+    inv_start, _, lengths, fwd_start, fwd_stop = transform.shard_window(s0, s1, length)
+    f.seek(fwd_start)
+    frames = f.read(fwd_stop - fwd_start, dtype=dwt.dtype, always_2d=True)
+    window = _window_coeffs(dwt, frames[:, 0], inv_start, lengths, fwd_start)
+    return frames, window, (s0, s1, inv_start, lengths, fwd_start)
+
+def _window_coeffs(dwt, channel, inv_start, lengths, fwd_start):
+    """Koefisien jendela inverse; identik dengan koefisien global pada posisi yang sama."""
+    import numpy as np
+
+    transform = dwt.transform
+    coeffs = transform.forward(np.ascontiguousarray(channel, dtype=dwt.dtype))
+    window = []
+    for band, band_coeffs in enumerate(coeffs):
+        offset = (inv_start - fwd_start) >> transform.band_level(band)
+        window.append(band_coeffs[offset:offset + lengths[band]])
+    return window
+
+def _read_file_bits(f, dwt, start, count, alpha):
+    _, window, (_, _, inv_start, _, _) = _frame_window(f, dwt, start, start + count)
+    first = start - (inv_start >> dwt.transform.band_level(1))
+    return kernels.array_to_bits(kernels.extract_coefficients(
+        window[1][first:], count, dwt.embedding_step(alpha), dwt.backend))
+
+def _patch_detail(f, dwt, start, bits, alpha):
+    """
+    Menyisipkan bit pada koefisien detail [start, start + len(bits)) dengan
+    hanya membaca, merekonstruksi, dan menulis ulang rentang sampel yang
+    dipengaruhinya. Hasil dikuantisasi ke subtype file dan diverifikasi di
+    memori sebelum ditulis: bit baru harus terbaca dan bit lain di jendela
+    (payload sebelumnya) tidak boleh berubah.
+
+    Raises:
+        ValueError: Jika verifikasi gagal; file tidak diubah
+    """
+    import numpy as np
+
+    transform = dwt.transform
+    step = dwt.embedding_step(alpha)
+    frames, window, (s0, s1, inv_start, lengths, fwd_start) = _frame_window(
+        f, dwt, start, start + len(bits))
+    first = start - (inv_start >> transform.band_level(1))
+    stop = first + len(bits)
+    if first < 0 or stop > len(window[1]):
+        raise ValueError("Segmen melewati akhir audio")
+
+    before = kernels.extract_coefficients(window[1], len(window[1]), step, dwt.backend)
+    modified = list(window)
+    modified[1] = window[1].copy()
+    modified[1][first:stop] = kernels.embed_coefficients(window[1][first:stop], kernels.bits_to_array(bits),
+                                                         step, dwt.backend)
+    if dwt.integer:
+        samples = _fit_integer_range(window, modified, dwt)[s0 - inv_start:s1 - inv_start]
+    else:
+        samples = transform.inverse(modified)[s0 - inv_start:s1 - inv_start]
+    if not dwt.integer and f.subtype in OUTPUT_SUBTYPES:
+        samples = quantize_samples(samples, f.subtype)
+
+    channel = frames[:, 0].copy()
+    channel[s0 - fwd_start:s1 - fwd_start] = samples
+    after = kernels.extract_coefficients(_window_coeffs(dwt, channel, inv_start, lengths, fwd_start)[1],
+                                         len(window[1]), step, dwt.backend)
+    expected = before.copy()
+    expected[first:stop] = kernels.bits_to_array(bits)
+    if not np.array_equal(after, expected):
+        errors = int(np.count_nonzero(after != expected))
+        raise ValueError(f"Verifikasi append gagal: {errors} bit salah setelah kuantisasi "
+                         f"ke {f.subtype}; file tidak diubah")
+
+    block = frames[s0 - fwd_start:s1 - fwd_start].copy()
+    block[:, 0] = samples
+    f.seek(s0)
+    f.write(block)
+    return s1 - s0
+
+def append_container(stego_file, message, alpha=0.001, dwt=None, output_file=None):
+    """
+    Menambahkan satu pesan untuk penerima baru ke kontainer yang sudah ada,
+    tanpa menyisipkan ulang dari carrier asli.
+
+    TOC dibaca dari jendela sampel di awal audio, segmen baru disisipkan pada
+    offset bebas berikutnya, lalu hanya rentang sampel yang dipengaruhi segmen
+    baru dan entri TOC-nya yang direkonstruksi dan ditulis ulang di tempat.
+    Biayanya sebanding dengan panjang pesan baru, bukan panjang audio.
+
+    Args:
+        stego_file (str): Path file WAV kontainer (ditulis di tempat)
+        message (str): Pesan untuk penerima baru
+        alpha (float, optional): Alpha kontainer, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang sama dengan saat penyisipan
+        output_file (str, optional): Tulis ke salinan ini alih-alih mengubah stego_file
+
+    Returns:
+        dict: Informasi ekstraksi penerima baru (lihat build_container)
+
+    Raises:
+        ValueError: Jika pesan kosong, slot TOC penuh, kapasitas tidak cukup,
+            atau verifikasi gagal
+    """
+    import shutil
+    import soundfile as sf
+
+    if not message:
+        raise ValueError("Pesan tidak boleh kosong")
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    if output_file is not None:
+        shutil.copyfile(stego_file, output_file)
+        stego_file = output_file
+
+    with sf.SoundFile(stego_file, 'r+') as f:
+        if f.format != 'WAV':
+            raise ValueError("Append hanya didukung untuk file WAV")
+        entries, slots = read_toc(lambda start, count: _read_file_bits(f, dwt, start, count, alpha))
+        if len(entries) >= slots:
+            raise ValueError(f"Slot TOC kontainer penuh ({slots} slot); buat kontainer dengan --slots lebih besar")
+
+        bits, info = _recipient_info(message, alpha)
+        offset = max(entry_offset + length for _, entry_offset, length in entries)
+        capacity = dwt.transform.band_lengths(f.frames)[1]
+        if offset + len(bits) > capacity:
+            raise ValueError(f"Pesan terlalu panjang! Sisa kapasitas kontainer: {capacity - offset} bit, "
+                             f"Pesan terenkripsi: {len(bits)} bit")
+
+        # Segmen ditulis lebih dahulu: jika gagal, TOC lama tetap konsisten
+        entries.append((recipient_fingerprint(info["rsa_public_key"]), offset, len(bits)))
+        samples = _patch_detail(f, dwt, offset, bits, alpha)
+        samples += _patch_detail(f, dwt, 0, encode_toc(entries, slots), alpha)
+        print(f"Pesan ditambahkan pada offset {offset} ({len(bits)} bit); "
+              f"{samples} sampel ditulis ulang dari {f.frames}")
+
+    info["entry"] = len(entries) - 1
+    _record_dwt(info, dwt)
+    return info
@@ -5,19 +5,27 @@ Modul inti untuk steganografi audio dengan ECC dan RSA (tanpa AES).
 import os
 import json
 import base64
-import numpy as np
-import soundfile as sf
+import time
+import secrets
 import traceback
 
-from steg import AudioDWT
-from crypto import SimplifiedECCCrypto, SimpleRSACrypto
+from steg import AudioDWT, quantize_samples, PCM_SUBTYPE_STEPS, INTEGER_SUBTYPES, INTEGER_DTYPES, kernels
+from steg import append_metadata_chunk, read_metadata_chunk, METADATA_VERSION
+from steg import fec as fec_codec
+from crypto import SimplifiedECCCrypto, SimpleRSACrypto, path_key_id
 from utils import text_to_bits, bits_to_text, bytes_to_bits, bits_to_bytes
 
 def generate_audio(output_file, duration=10, sample_rate=44100):
     """Membuat file audio sampel dengan gelombang sinus sederhana."""
+    import numpy as np
+    import soundfile as sf
+    
     t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
     audio_data = 0.5 * np.sin(2 * np.pi * 440 * t)
-    sf.write(output_file, audio_data, sample_rate)
+    if isinstance(output_file, str):
+        sf.write(output_file, audio_data, sample_rate)
+    else:
+        sf.write(output_file, audio_data, sample_rate, format='WAV')
     print(f"File audio sampel dibuat: {output_file}")
     return output_file
 
@@ -77,7 +85,702 @@ def prepare_message(message):
     
     return all_bits, ecc_crypto, rsa_crypto
 
-def embed_message(input_file=None, output_file=None, message=None, alpha=0.001):
+def dwt_from_info(info=None, dtype='float64'):
+    """
+    Membuat AudioDWT (db2, level 1) dengan backend transformasi yang tercatat
+    pada informasi ekstraksi, sehingga ekstraksi memakai transformasi yang sama
+    dengan penyisipan. Mode integer (info["dtype"] 'int16'/'int32') selalu
+    memakai lifting integer, dan level dekomposisi mode multi-band diambil
+    dari info["level"].
+    """
+    info = info or {}
+    dtype = info.get("dtype", dtype)
+    default_transform = "lifting" if dtype in INTEGER_DTYPES else "pywt"
+    transform = info.get("transform", default_transform)
+    return AudioDWT(wavelet='db2', level=info.get("level", 1), dtype=dtype, transform=transform)
+
+def audio_capacity(audio_data, dwt=None):
+    """
+    Menghitung kapasitas penyisipan (dalam bit) dari data audio.
+    
+    Args:
+        audio_data (numpy.ndarray): Data audio
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        
+    Returns:
+        int: Jumlah bit maksimal yang dapat disisipkan
+    """
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    coeffs = dwt.apply_dwt(audio_data)
+    return len(coeffs[1])
+
+def audio_band_capacities(audio_data, dwt=None):
+    """
+    Menghitung kapasitas penyisipan multi-band per band detail.
+    
+    Args:
+        audio_data (numpy.ndarray): Data audio
+        dwt (AudioDWT, optional): Instance DWT yang digunakan (menentukan level)
+        
+    Returns:
+        dict: {indeks band: kapasitas dalam bit}, 1 = cD_n ... level = cD_1
+    """
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    return dwt.band_capacities(len(audio_data))
+
+# Jumlah putaran koreksi maksimal pada penyisipan sadar-kuantisasi
+QUANTIZATION_ROUNDS = 4
+
+def _bit_margins(detail_coeffs, expected, alpha):
+    """Jarak koefisien ke batas keputusan bit yang diharapkan (negatif berarti bit salah)."""
+    import numpy as np
+    remainder = np.abs(detail_coeffs) % (2 * alpha)
+    one_margin = 0.6 * alpha - np.abs(remainder - alpha)
+    zero_margin = 0.4 * alpha - np.minimum(remainder, 2 * alpha - remainder)
+    return np.where(expected, one_margin, zero_margin)
+
+def _sample_responses(dwt):
+    """
+    Respons impuls koefisien detail terhadap satu sampel, per posisi sampel modulo 2^level.
+    
+    Returns:
+        list: Untuk setiap residu, tuple (offset koefisien relatif terhadap
+              sampel >> level, bobot)
+    """
+    import numpy as np
+    period = 1 << dwt.level
+    responses = []
+    for residue in range(period):
+        impulse = np.zeros(period * 128, dtype=dwt.dtype)
+        impulse[period * 64 + residue] = 1
+        detail = dwt.apply_dwt(impulse)[1]
+        offsets = np.flatnonzero(detail)
+        responses.append((offsets - 64, detail[offsets].astype(np.float64)))
+    return responses
+
+def _repair_quantized_bits(quantized, check, expected, wrong, alpha, dwt, step):
+    """
+    Memperbaiki bit yang salah langsung di kisi integer: untuk setiap bit salah,
+    coba geser satu sampel pendukungnya sebesar +-1 atau +-2 LSB dan pilih
+    geseran yang membuat semua koefisien terdampak benar dengan margin terbesar.
+    """
+    period = 1 << dwt.level
+    responses = _sample_responses(dwt)
+    min_offset = min(int(offsets.min()) for offsets, _ in responses)
+    max_offset = max(int(offsets.max()) for offsets, _ in responses)
+    num_bits = len(expected)
+    lowest, highest = -1.0, 1.0 - step
+    
+    for k in wrong:
+        best = None
+        first = max((k - max_offset) * period, 0)
+        last = min((k - min_offset + 1) * period, len(quantized))
+        for n in range(first, last):
+            offsets, weights = responses[n % period]
+            ks = (n // period) + offsets
+            keep = (ks >= 0) & (ks < num_bits)
+            ks, weights = ks[keep], weights[keep]
+            if k not in ks:
+                continue
+            for delta in (step, -step, 2 * step, -2 * step):
+                if not lowest <= quantized[n] + delta <= highest:
+                    continue
+                margin = _bit_margins(check[ks] + delta * weights, expected[ks], alpha).min()
+                if margin > 0 and (best is None or margin > best[0]):
+                    best = (margin, n, delta, ks, weights)
+        if best is not None:
+            _, n, delta, ks, weights = best
+            quantized[n] += delta
+            check[ks] += delta * weights
+    return quantized
+
+def _embed_quantization_aware(coeffs, all_bits, alpha, dwt, subtype, output_length, stats=None):
+    """
+    Menyisipkan bit sehingga hasil rekonstruksi tetap terbaca setelah dikuantisasi
+    ke subtype output.
+    
+    Setiap putaran merekonstruksi audio, mensimulasikan kuantisasi sf.write,
+    lalu mentransformasi ulang. Koefisien yang bitnya salah digeser sebesar
+    selisih antara koefisien terkuantisasi dan targetnya (error feedback).
+    Bit yang masih salah diperbaiki langsung pada sampel integer, lalu hasil
+    akhirnya diverifikasi dengan transformasi penuh.
+    
+    Returns:
+        numpy.ndarray: Channel stego yang sudah terkuantisasi (float)
+        
+    Raises:
+        ValueError: Jika masih ada bit salah setelah kuantisasi
+    """
+    import numpy as np
+    
+    num_bits = len(all_bits)
+    expected = kernels.bits_to_array(all_bits)
+    modified_coeffs = dwt.embed_bits_in_coefficients(coeffs, all_bits, alpha=alpha)
+    _record_noise(stats, dwt, coeffs, modified_coeffs, num_bits)
+    targets = modified_coeffs[1][:num_bits].copy()
+    
+    for _ in range(QUANTIZATION_ROUNDS):
+        reconstructed = dwt.apply_idwt(modified_coeffs)[:output_length]
+        quantized = quantize_samples(reconstructed, subtype)
+        check = dwt.detail_coefficients(quantized, num_bits)
+        wrong = np.flatnonzero(kernels.extract_coefficients(check, num_bits, alpha, dwt.backend) != expected)
+        if len(wrong) == 0:
+            return quantized
+        modified_coeffs[1][wrong] -= check[wrong] - targets[wrong]
+    
+    step = PCM_SUBTYPE_STEPS.get(subtype)
+    if step is not None:
+        quantized = np.array(quantized, copy=True)
+        for _ in range(QUANTIZATION_ROUNDS):
+            quantized = _repair_quantized_bits(quantized, check.astype(np.float64), expected, wrong,
+                                               alpha, dwt, step / 0x80000000)
+            quantized = quantize_samples(quantized, subtype)
+            check = dwt.detail_coefficients(quantized, num_bits)
+            wrong = np.flatnonzero(kernels.extract_coefficients(check, num_bits, alpha, dwt.backend) != expected)
+            if len(wrong) == 0:
+                return quantized
+    
+    raise ValueError(f"Penyisipan sadar-kuantisasi gagal: {len(wrong)} dari {num_bits} bit "
+                     f"masih salah setelah kuantisasi ke {subtype} (alpha={alpha}); naikkan alpha")
+
+def _check_embed_options(dwt, subtype=None, bands=None, spread=False, workers=None):
+    """
+    Memeriksa kombinasi mode penyisipan, subtype, dan sharding sebelum
+    pekerjaan mahal (pembuatan kunci, DWT) dimulai.
+    
+    Raises:
+        ValueError: Jika kombinasi opsi tidak didukung
+    """
+    if bands is not None and spread:
+        raise ValueError("Mode multi-band dan mode sebar tidak dapat digabungkan")
+    if workers is not None and (dwt.integer or subtype is not None or bands is not None or spread):
+        raise ValueError("Mode sharding hanya mendukung penyisipan satu band berurutan dengan "
+                         "dtype float tanpa subtype")
+    if dwt.integer:
+        if subtype is not None and subtype not in INTEGER_SUBTYPES[dwt.dtype]:
+            raise ValueError(f"Subtype {subtype} tidak dapat menyimpan sampel {dwt.dtype} secara eksak "
+                             f"(pilihan: {', '.join(INTEGER_SUBTYPES[dwt.dtype])})")
+    elif subtype is not None and (bands is not None or spread):
+        raise ValueError("Penyisipan sadar-kuantisasi (subtype) belum didukung untuk mode "
+                         "multi-band dan mode sebar")
+
+def _embed_layout(dwt, coeffs, all_bits, alpha, bands=None, spread_key=None):
+    """Menyisipkan bit sesuai tata letak: multi-band, sebar berkunci, atau satu band berurutan."""
+    if bands is not None and spread_key is not None:
+        raise ValueError("Mode multi-band dan mode sebar tidak dapat digabungkan")
+    if bands is not None:
+        return dwt.embed_bits_in_bands(coeffs, all_bits, alpha=alpha, bands=bands)
+    if spread_key is not None:
+        return dwt.embed_bits_spread(coeffs, all_bits, alpha=alpha, key=spread_key)
+    return dwt.embed_bits_in_coefficients(coeffs, all_bits, alpha=alpha)
+
+def _extract_layout(dwt, coeffs, num_bits, alpha, multiband=False, spread_key=None):
+    """Pasangan ekstraksi dari _embed_layout."""
+    if multiband:
+        return dwt.extract_bits_from_bands(coeffs, num_bits, alpha=alpha)
+    if spread_key is not None:
+        return dwt.extract_bits_spread(coeffs, num_bits, alpha=alpha, key=spread_key)
+    return dwt.extract_bits_from_coefficients(coeffs, num_bits, alpha=alpha)
+
+def coefficient_noise_energy(dwt, coeffs, modified_coeffs, num_bits=None):
+    """
+    Energi noise rekonstruksi yang dihitung langsung dari perubahan koefisien,
+    tanpa rekonstruksi: jumlah kuadrat selisih setiap band dikali
+    synthesis_gain band tersebut (1 untuk db2 ortonormal).
+    
+    Args:
+        dwt (AudioDWT): Instance DWT
+        coeffs (list): Koefisien asli
+        modified_coeffs (list): Koefisien setelah penyisipan
+        num_bits (int, optional): Hanya num_bits koefisien detail pertama yang
+            berubah (mode satu band berurutan); jika None semua band dibandingkan
+        
+    Returns:
+        float: Energi noise dalam satuan sampel kuadrat
+    """
+    import numpy as np
+    
+    transform = dwt.transform
+    if num_bits is not None:
+        delta = modified_coeffs[1][:num_bits].astype(np.float64) - coeffs[1][:num_bits]
+        return transform.synthesis_gain(1) * float(np.dot(delta, delta))
+    energy = 0.0
+    for band, (original, modified) in enumerate(zip(coeffs, modified_coeffs)):
+        if modified is original:
+            continue
+        delta = modified.astype(np.float64) - original
+        energy += transform.synthesis_gain(band) * float(np.dot(delta, delta))
+    return energy
+
+def embedding_snr(audio_data, noise_energy):
+    """
+    SNR analitik channel pertama dari energi noise penyisipan.
+    
+    Returns:
+        dict: signal_energy, noise_energy, dan snr_db (inf jika tanpa noise)
+    """
+    import numpy as np
+    
+    channel = audio_data[:, 0] if audio_data.ndim > 1 else audio_data
+    channel = np.asarray(channel, dtype=np.float64)
+    signal_energy = float(np.dot(channel, channel))
+    if noise_energy <= 0:
+        snr_db = float('inf')
+    else:
+        snr_db = 10 * float(np.log10(signal_energy / noise_energy)) if signal_energy > 0 else float('-inf')
+    return {"signal_energy": signal_energy, "noise_energy": noise_energy, "snr_db": snr_db}
+
+def _record_noise(stats, dwt, coeffs, modified_coeffs, num_bits, sequential=True):
+    if stats is not None:
+        stats["noise_energy"] = coefficient_noise_energy(dwt, coeffs, modified_coeffs,
+                                                         num_bits if sequential else None)
+
+# Jumlah putaran maksimal untuk menarik sampel mode integer kembali ke rentangnya
+INTEGER_RANGE_ROUNDS = 8
+
+def _embed_integer(coeffs, all_bits, alpha, dwt, bands=None, spread_key=None, stats=None):
+    """
+    Penyisipan pada koefisien lifting integer. Rekonstruksinya eksak, sehingga
+    satu-satunya risiko adalah sampel yang melampaui rentang dtype (misalnya
+    pada audio yang ter-clip). Koefisien aproksimasi tidak membawa bit, jadi
+    koefisien di sekitar sampel tersebut digeser sebesar kelebihannya lalu
+    audio direkonstruksi ulang.
+    """
+    modified_coeffs = _embed_layout(dwt, coeffs, all_bits, alpha, bands, spread_key)
+    _record_noise(stats, dwt, coeffs, modified_coeffs, len(all_bits),
+                  bands is None and spread_key is None)
+    return _fit_integer_range(coeffs, modified_coeffs, dwt)
+
+def _fit_integer_range(coeffs, modified_coeffs, dwt):
+    """
+    Merekonstruksi koefisien lifting integer yang telah dimodifikasi, dengan
+    menggeser koefisien aproksimasi di sekitar sampel yang melampaui rentang
+    dtype (lihat _embed_integer).
+    """
+    import numpy as np
+    
+    limits = np.iinfo(dwt.dtype)
+    reconstructed = dwt.transform.inverse(modified_coeffs)
+    for _ in range(INTEGER_RANGE_ROUNDS):
+        if reconstructed.min() >= limits.min and reconstructed.max() <= limits.max:
+            break
+        overflow = np.flatnonzero((reconstructed < limits.min) | (reconstructed > limits.max))
+        values = reconstructed[overflow]
+        excess = values - np.clip(values, limits.min, limits.max)
+        if modified_coeffs[0] is coeffs[0]:
+            modified_coeffs[0] = coeffs[0].copy()
+        approx = modified_coeffs[0]
+        # Geser koefisien aproksimasi di kedua sisi sampel (sampel ganjil
+        # bergantung pada keduanya)
+        for index in (overflow >> dwt.level, (overflow + 1) >> dwt.level):
+            valid = index < len(approx)
+            np.subtract.at(approx, index[valid], excess[valid])
+        reconstructed = dwt.transform.inverse(modified_coeffs)
+    return dwt.to_samples(reconstructed)
+
+# Batas keyakinan bit yang dianggap marginal pada laporan soft-decision
+LOW_CONFIDENCE = 0.1
+
+def confidence_report(confidence, bins=10):
+    """
+    Ringkasan keyakinan bit hasil ekstraksi soft-decision.
+    
+    Args:
+        confidence (numpy.ndarray): Keyakinan per bit (lihat kernels.bit_confidence)
+        bins (int, optional): Jumlah bin histogram di [0, 1]
+        
+    Returns:
+        dict: bits, mean_confidence, min_confidence, low_confidence_bits (di
+            bawah LOW_CONFIDENCE), dan histogram (jumlah bit per bin)
+    """
+    import numpy as np
+    
+    histogram, _ = np.histogram(confidence, bins=bins, range=(0.0, 1.0))
+    return {
+        "bits": len(confidence),
+        "mean_confidence": float(confidence.mean()) if len(confidence) else 0.0,
+        "min_confidence": float(confidence.min()) if len(confidence) else 0.0,
+        "low_confidence_bits": int(np.count_nonzero(confidence < LOW_CONFIDENCE)),
+        "histogram": histogram.tolist(),
+    }
+
+def verify_embedding(stego_data, all_bits, alpha=0.001, dwt=None, subtype=None, bands=None,
+                     spread_key=None):
+    """
+    Memverifikasi hasil penyisipan di memori tanpa menulis atau membaca file.
+    
+    Sampel dikuantisasi seperti sf.write ke subtype output, lalu hanya wilayah
+    sampel yang memuat payload yang ditransformasi ulang dan bitnya
+    dibandingkan dengan payload. Mode multi-band dan mode sebar
+    mentransformasi seluruh channel karena payload tersebar di seluruh audio.
+    
+    Args:
+        stego_data (numpy.ndarray): Audio hasil penyisipan (channel 0 dipakai)
+        all_bits (str): String bit yang disisipkan
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        subtype (str, optional): Subtype output; None berarti tanpa kuantisasi.
+            Sampel mode integer tidak dikuantisasi (lihat INTEGER_SUBTYPES)
+        bands (list, optional): Urutan band mode multi-band
+        spread_key (str, optional): Kunci mode sebar
+        
+    Returns:
+        dict: bits, bit_errors, ber, dan subtype
+    """
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    
+    num_bits = len(all_bits)
+    channel = stego_data[:, 0] if stego_data.ndim > 1 else stego_data
+    spread = bands is not None or spread_key is not None
+    region = channel if spread else channel[:dwt.region_length(num_bits)]
+    if subtype is not None and not dwt.integer:
+        region = quantize_samples(region, subtype)
+    if spread:
+        extracted = kernels.bits_to_array(_extract_layout(dwt, dwt.apply_dwt(region), num_bits, alpha,
+                                                          bands is not None, spread_key))
+    else:
+        detail = dwt.detail_coefficients(region, num_bits)
+        extracted = kernels.extract_coefficients(detail, num_bits, dwt.embedding_step(alpha), dwt.backend)
+    errors = int((extracted != kernels.bits_to_array(all_bits)).sum())
+    return {
+        "bits": num_bits,
+        "bit_errors": errors,
+        "ber": errors / num_bits if num_bits else 0.0,
+        "subtype": subtype,
+    }
+
+def embed_bits_in_audio(audio_data, all_bits, alpha=0.001, dwt=None, validate=False, subtype=None,
+                        bands=None, spread_key=None, workers=None, coeffs=None, stats=None):
+    """
+    Menyisipkan bit ke dalam data audio dan merekonstruksi audio hasil.
+    
+    Args:
+        audio_data (numpy.ndarray): Data audio asli
+        all_bits (str): String bit yang akan disisipkan
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        validate (bool, optional): Ekstrak ulang bit dari hasil rekonstruksi
+            (dengan dtype dwt) untuk memastikan alpha masih round-trip
+        subtype (str, optional): Subtype output (misalnya 'PCM_16'). Jika diisi,
+            koefisien disesuaikan agar bit tetap benar setelah kuantisasi ke
+            subtype tersebut, diverifikasi di memori, dan channel yang
+            dikembalikan sudah terkuantisasi. Pada mode integer subtype hanya
+            diperiksa agar tidak membuang bit sampel (lihat INTEGER_SUBTYPES)
+        bands (list, optional): Aktifkan mode multi-band dengan urutan band ini
+            (lihat steg.bands); kapasitas dihitung per band
+        spread_key (str, optional): Aktifkan mode sebar: bit ditempatkan pada
+            posisi hasil permutasi berkunci (lihat steg.permutation)
+        workers (int, optional): Aktifkan mode sharding: transformasi dan
+            rekonstruksi dikerjakan paralel per segmen waktu oleh proses worker
+            sebanyak ini, dengan hasil identik jalur serial (lihat sharded).
+            Hanya untuk mode satu band berurutan dengan dtype float
+        coeffs (list, optional): Koefisien DWT channel pertama yang sudah
+            dihitung dengan dwt yang sama (misalnya dari steg.cache); tidak
+            diubah, sehingga boleh berupa array memmap read-only
+        stats (dict, optional): Diisi estimasi kualitas analitik tanpa
+            rekonstruksi tambahan: signal_energy (energi channel pertama),
+            noise_energy (lihat coefficient_noise_energy), dan snr_db. Noise
+            kuantisasi subtype output dan koreksi rentang mode integer tidak
+            termasuk
+        
+    Returns:
+        numpy.ndarray: Data audio yang telah disisipi
+        
+    Raises:
+        ValueError: Jika bit melebihi kapasitas audio, validasi gagal, atau
+            subtype tidak dapat menyimpan sampel integer secara eksak
+    """
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    _check_embed_options(dwt, subtype=subtype, bands=bands, spread=spread_key is not None,
+                         workers=workers)
+    
+    # Terapkan DWT dan cek kapasitas (mode multi-band dan sebar memeriksa kapasitasnya sendiri;
+    # mode sharding mentransformasi per segmen sehingga kapasitas dihitung dari panjang audio)
+    if workers is not None:
+        capacity = dwt.transform.band_lengths(len(audio_data))[1]
+    else:
+        if coeffs is None:
+            coeffs = dwt.apply_dwt(audio_data)
+        capacity = len(coeffs[1])
+    if bands is None and spread_key is None and len(all_bits) > capacity:
+        raise ValueError(f"Pesan terlalu panjang! Kapasitas maksimal: {capacity} bit, Pesan terenkripsi: {len(all_bits)} bit")
+    
+    if workers is not None:
+        from sharded import reconstruct_sharded
+        if stats is not None:
+            # Koefisien global tidak dihitung; cukup band detail di wilayah payload
+            head = [None, dwt.detail_coefficients(audio_data, len(all_bits))]
+            _record_noise(stats, dwt, head, dwt.embed_bits_in_coefficients(head, all_bits, alpha=alpha),
+                          len(all_bits))
+        reconstructed_data = reconstruct_sharded(audio_data, all_bits, alpha, dwt, workers=workers)
+    elif dwt.integer:
+        reconstructed_data = _embed_integer(coeffs, all_bits, alpha, dwt, bands, spread_key, stats)
+    elif bands is not None or spread_key is not None:
+        modified_coeffs = _embed_layout(dwt, coeffs, all_bits, alpha, bands, spread_key)
+        _record_noise(stats, dwt, coeffs, modified_coeffs, len(all_bits), sequential=False)
+        reconstructed_data = dwt.apply_idwt(modified_coeffs)
+    elif subtype is not None:
+        # Panjang yang benar-benar ditulis (hasil IDWT bisa lebih panjang satu sampel)
+        reconstructed_data = _embed_quantization_aware(coeffs, all_bits, alpha, dwt, subtype,
+                                                       output_length=len(audio_data), stats=stats)
+    else:
+        # Sisipkan bit dengan alpha kustom
+        modified_coeffs = dwt.embed_bits_in_coefficients(coeffs, all_bits, alpha=alpha)
+        _record_noise(stats, dwt, coeffs, modified_coeffs, len(all_bits))
+        
+        # Terapkan IDWT
+        reconstructed_data = dwt.apply_idwt(modified_coeffs)
+    
+    if validate:
+        report = verify_embedding(reconstructed_data, all_bits, alpha=alpha, dwt=dwt, bands=bands,
+                                  spread_key=spread_key)
+        if report["bit_errors"]:
+            raise ValueError(f"Validasi round-trip gagal: {report['bit_errors']} dari {len(all_bits)} bit salah "
+                             f"(alpha={alpha}, dtype={dwt.dtype})")
+    
+    if stats is not None:
+        stats.update(embedding_snr(audio_data, stats["noise_energy"]))
+    
+    # Jika audio original stereo, buat hasil rekonstruksi juga stereo
+    if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:
+        import numpy as np
+        # Potong jika ukuran berbeda
+        min_len = min(len(reconstructed_data), len(audio_data))
+        reconstructed_stereo = np.zeros((min_len, audio_data.shape[1]), dtype=reconstructed_data.dtype)
+        reconstructed_stereo[:, 0] = reconstructed_data[:min_len]
+        # Salin channel lain dari audio asli
+        for ch in range(1, audio_data.shape[1]):
+            reconstructed_stereo[:, ch] = audio_data[:min_len, ch]
+        reconstructed_data = reconstructed_stereo
+    
+    return reconstructed_data
+
+def build_stego_info(all_bits, ecc_crypto, rsa_crypto, message, alpha):
+    """
+    Menyusun informasi ekstraksi (isi file .info) untuk sebuah hasil penyisipan.
+    
+    Returns:
+        dict: Panjang bit, kunci ECC/RSA, panjang pesan, dan alpha
+    """
+    return {
+        "bits_length": len(all_bits),
+        "ecc_public_key": ecc_crypto.get_public_key(),
+        "ecc_private_key": ecc_crypto.get_private_key(),
+        "rsa_public_key": rsa_crypto.get_public_key(),
+        "rsa_private_key": rsa_crypto.get_private_key(),
+        "message_length": len(message),
+        "alpha": alpha  # Simpan nilai alpha yang digunakan
+    }
+
+# Field informasi ekstraksi yang aman disimpan di dalam file audio
+PUBLIC_METADATA_FIELDS = ("bits_length", "alpha", "subtype", "transform", "dtype", "multiband", "level",
+                          "fec")
+
+def public_metadata(info, key_id=None):
+    """
+    Menyusun metadata publik (chunk RIFF) dari informasi ekstraksi. Kunci
+    privat dan kunci sebar tidak pernah disertakan; keduanya disimpan di
+    keystore dengan key_id yang dicatat di sini.
+    
+    Returns:
+        dict: Versi format, wavelet transformasi yang dipakai (db2, atau 5/3
+            untuk lifting LeGall), dan field PUBLIC_METADATA_FIELDS yang ada
+    """
+    wavelet = dwt_from_info(info).transform.wavelet
+    metadata = {"version": METADATA_VERSION, "wavelet": getattr(wavelet, 'name', wavelet)}
+    metadata.update({field: info[field] for field in PUBLIC_METADATA_FIELDS if field in info})
+    if key_id is not None:
+        metadata["key_id"] = key_id
+    return metadata
+
+def save_key_files(info, key_file=None, info_file=None):
+    """
+    Menyimpan kunci ECC/RSA ke file .key dan informasi ekstraksi ke file .info.
+    
+    Args:
+        info (dict): Informasi ekstraksi dari build_stego_info
+        key_file (str, optional): Path file kunci, dilewati jika None
+        info_file (str, optional): Path file info, dilewati jika None
+    """
+    if key_file is not None:
+        with open(key_file, 'w') as f:
+            f.write("===== KUNCI ECC =====\n\n")
+            f.write(f"PUBLIC KEY ECC:\n{info['ecc_public_key']}\n\n")
+            f.write(f"PRIVATE KEY ECC:\n{info['ecc_private_key']}\n\n")
+            f.write("===== KUNCI RSA =====\n\n")
+            f.write(f"PUBLIC KEY RSA:\n{info['rsa_public_key']}\n\n")
+            f.write(f"PRIVATE KEY RSA:\n{info['rsa_private_key']}\n")
+        print(f"Kunci ECC dan RSA disimpan dalam {key_file}")
+    
+    if info_file is not None:
+        with open(info_file, 'w') as f:
+            json.dump(info, f)
+        print(f"Informasi panjang pesan dan kunci disimpan dalam {info_file}")
+
+def _output_subtype(output_file, subtype=None):
+    """Subtype yang akan dipakai sf.write untuk output (bawaan soundfile jika tidak diisi)."""
+    if subtype is not None:
+        return subtype
+    import soundfile as sf
+    if isinstance(output_file, (str, os.PathLike)):
+        extension = os.path.splitext(output_file)[1][1:].upper()
+        if not extension or extension not in sf.available_formats():
+            return None
+        return sf.default_subtype(extension)
+    return sf.default_subtype('WAV')
+
+def embed_payload(input_file, output_file, message, alpha=0.001, dwt=None, sample_rate=None,
+                  validate=False, subtype=None, verify=False, bands=None, spread=False, workers=None,
+                  metadata_chunk=False, key_id=None, cache=None, fec=None):
+    """
+    Mengenkripsi pesan dan menyisipkannya ke audio tanpa prompt interaktif.
+    
+    Args:
+        input_file (str, file-like, bytes-like, or numpy.ndarray): Audio input
+            (lihat AudioDWT.read_audio)
+        output_file (str or file-like): Path atau objek file audio output
+        message (str): Pesan yang akan disembunyikan
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        sample_rate (int, optional): Sample rate, wajib jika input berupa array
+        validate (bool, optional): Validasi round-trip sebelum menulis output
+        subtype (str, optional): Subtype output (misalnya 'PCM_16'); penyisipan
+            dibuat sadar-kuantisasi dan diverifikasi sebelum file ditulis
+        verify (bool, optional): Verifikasi payload di memori dengan kuantisasi
+            subtype output sebelum menulis; hasilnya (BER) disimpan di info["verify"]
+        bands (list, optional): Urutan band mode multi-band; level dicatat di
+            info["level"] dan urutan band di tabel dalam audio
+        spread (bool, optional): Aktifkan mode sebar dengan kunci acak baru
+            yang disimpan di info["spread_key"] bersama kunci privat lainnya
+        workers (int, optional): Jumlah proses untuk mode sharding (lihat
+            embed_bits_in_audio)
+        metadata_chunk (bool, optional): Tulis metadata publik (lihat
+            public_metadata) sebagai chunk RIFF di WAV output pada handle file
+            yang sama, sehingga file .info tidak diperlukan
+        key_id (str, optional): key_id keystore tempat kunci privat disimpan,
+            dicatat di chunk metadata
+        cache (CarrierCache, optional): Cache sampel dan koefisien carrier
+            (lihat steg.cache); dipakai untuk input berupa path atau bytes
+        fec (str, optional): Kode FEC (lihat steg.fec.FEC_CODES) yang diterapkan
+            pada bit terenkripsi sebelum penyisipan; dicatat di info["fec"] dan
+            info["bits_length"] menjadi panjang aliran terkode
+        
+    Returns:
+        dict: Informasi ekstraksi (lihat build_stego_info), termasuk
+            info["snr_db"] (estimasi analitik, lihat embed_bits_in_audio)
+        
+    Raises:
+        ValueError: Jika pesan kosong, melebihi kapasitas audio, bit tidak
+            bertahan setelah kuantisasi ke subtype output, verifikasi gagal,
+            atau chunk metadata diminta untuk output selain WAV
+    """
+    if not message:
+        raise ValueError("Pesan tidak boleh kosong")
+    if metadata_chunk and isinstance(output_file, (str, os.PathLike)) \
+            and os.path.splitext(output_file)[1].lower() != '.wav':
+        raise ValueError("Chunk metadata hanya didukung untuk output WAV")
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    # Kombinasi opsi yang tidak didukung ditolak sebelum pembuatan kunci ECC/RSA
+    _check_embed_options(dwt, subtype=subtype, bands=bands, spread=spread, workers=workers)
+    
+    # Siapkan pesan dengan enkripsi ganda (ECC kemudian RSA)
+    print("Menyiapkan pesan dengan enkripsi ganda ECC+RSA...")
+    all_bits, ecc_crypto, rsa_crypto = prepare_message(message)
+    print(f"Pesan terenkripsi dengan panjang: {len(all_bits)} bit")
+    if fec is not None:
+        all_bits = fec_codec.encode_bits(all_bits, fec)
+        print(f"Dikodekan dengan FEC {fec}: {len(all_bits)} bit")
+    
+    coeffs = None
+    if cache is not None and isinstance(input_file, (str, os.PathLike, bytes, bytearray, memoryview)):
+        audio_data, sample_rate, coeffs = cache.load(input_file, dwt, sample_rate)
+    else:
+        audio_data, sample_rate = dwt.read_audio(input_file, sample_rate)
+    
+    spread_key = secrets.token_hex(16) if spread else None
+    
+    print(f"\nMenyisipkan pesan ke dalam {output_file}...")
+    quality = {}
+    reconstructed_data = embed_bits_in_audio(audio_data, all_bits, alpha=alpha, dwt=dwt,
+                                             validate=validate, subtype=subtype, bands=bands,
+                                             spread_key=spread_key, workers=workers, coeffs=coeffs,
+                                             stats=quality)
+    print(f"Estimasi SNR penyisipan: {quality['snr_db']:.2f} dB")
+    
+    report = None
+    if verify:
+        report = verify_embedding(reconstructed_data, all_bits, alpha=alpha, dwt=dwt,
+                                  subtype=_output_subtype(output_file, subtype), bands=bands,
+                                  spread_key=spread_key)
+        print(f"Verifikasi: {report['bit_errors']} dari {report['bits']} bit salah "
+              f"(BER {report['ber']:.6f}, subtype {report['subtype']})")
+        if report["bit_errors"]:
+            raise ValueError(f"Verifikasi gagal: BER {report['ber']:.6f} "
+                             f"({report['bit_errors']} dari {report['bits']} bit salah); "
+                             f"output tidak ditulis")
+    
+    info = build_stego_info(all_bits, ecc_crypto, rsa_crypto, message, alpha)
+    if subtype is not None:
+        info["subtype"] = subtype
+    if dwt.transform.name != 'pywt':
+        info["transform"] = dwt.transform.name
+    if dwt.integer:
+        info["dtype"] = dwt.dtype
+    if bands is not None:
+        info["multiband"] = True
+        info["level"] = dwt.level
+    if spread_key is not None:
+        info["spread_key"] = spread_key
+    if fec is not None:
+        info["fec"] = fec
+    if report is not None:
+        info["verify"] = report
+    info["snr_db"] = round(quality["snr_db"], 2)
+    
+    # Simpan audio hasil (beserta chunk metadata pada handle file yang sama)
+    if not metadata_chunk:
+        dwt.save_audio(output_file, reconstructed_data, sample_rate, subtype=subtype)
+    elif isinstance(output_file, (str, os.PathLike)):
+        with open(output_file, 'w+b') as f:
+            dwt.save_audio(f, reconstructed_data, sample_rate, subtype=subtype)
+            append_metadata_chunk(f, public_metadata(info, key_id))
+    else:
+        dwt.save_audio(output_file, reconstructed_data, sample_rate, subtype=subtype)
+        append_metadata_chunk(output_file, public_metadata(info, key_id))
+    return info
+
+def record_job(index, info, input_file, output_file, key_id=None, seconds=None):
+    """
+    Mencatat satu penyisipan ke indeks job.
+    
+    Args:
+        index (JobIndex): Indeks job (lihat jobindex)
+        info (dict): Informasi ekstraksi dari embed_payload
+        input_file (str or bytes-like): Path atau blob carrier
+        output_file (str or file-like): Path atau objek file stego yang sudah ditulis
+        key_id (str, optional): key_id keystore tempat kunci privat disimpan
+        seconds (float, optional): Waktu penyisipan
+        
+    Returns:
+        int: id job
+    """
+    from jobindex import content_hash
+    is_path = isinstance(output_file, (str, os.PathLike))
+    return index.record(
+        info, public_metadata(info, key_id),
+        output_path=output_file if is_path else None,
+        output_hash=content_hash(output_file),
+        carrier_path=input_file if isinstance(input_file, (str, os.PathLike)) else None,
+        carrier_hash=content_hash(input_file),
+        key_id=key_id, timings={"embed_seconds": seconds})
+
+def embed_message(input_file=None, output_file=None, message=None, alpha=0.001, keystore=None,
+                  index=None, cache=None):
     """
     Menyisipkan pesan ke dalam file audio.
     
@@ -86,6 +789,11 @@ def embed_message(input_file=None, output_file=None, message=None, alpha=0.001):
         output_file (str, optional): Path ke file audio output
         message (str, optional): Pesan yang akan disembunyikan
         alpha (float, optional): Parameter DWT, default 0.001
+        keystore (KeyStore, optional): Keystore tambahan untuk menyimpan kunci
+            dengan key_id dari path file output (lihat path_key_id)
+        index (JobIndex, optional): Indeks job tempat penyisipan dicatat
+        cache (CarrierCache, optional): Cache carrier untuk penyisipan berulang
+            ke carrier yang sama
         
     Returns:
         str: Path ke file output, atau None jika gagal
@@ -134,101 +842,292 @@ def embed_message(input_file=None, output_file=None, message=None, alpha=0.001):
         print(f"Menggunakan alpha = {alpha}")
     
     try:
-        # Siapkan pesan dengan enkripsi ganda (ECC kemudian RSA)
-        print("Menyiapkan pesan dengan enkripsi ganda ECC+RSA...")
-        all_bits, ecc_crypto, rsa_crypto = prepare_message(message)
-        print(f"Pesan terenkripsi dengan panjang: {len(all_bits)} bit")
-        
-        # Buat instance DWT
-        dwt = AudioDWT(wavelet='db2', level=1)
-        
-        # Cek kapasitas file audio
-        try:
-            audio_data, sample_rate = dwt.read_audio(input_file)
-            coeffs = dwt.apply_dwt(audio_data)
-            capacity = len(coeffs[1])
-            
-            if len(all_bits) > capacity:
-                print(f"Pesan terlalu panjang! Kapasitas maksimal: {capacity} bit, Pesan terenkripsi: {len(all_bits)} bit")
-                return None
-            
-            # Sembunyikan pesan dalam file audio dengan nilai alpha yang ditentukan
-            print(f"\nMenyisipkan pesan ke dalam {output_file}...")
-            
-            # Terapkan DWT
-            coeffs = dwt.apply_dwt(audio_data)
-            
-            # Sisipkan bit dengan alpha kustom
-            modified_coeffs = dwt.embed_bits_in_coefficients(coeffs, all_bits, alpha=alpha)
-            
-            # Terapkan IDWT
-            reconstructed_data = dwt.apply_idwt(modified_coeffs)
-            
-            # Jika audio original stereo, buat hasil rekonstruksi juga stereo
-            if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:
-                # Potong jika ukuran berbeda
-                min_len = min(len(reconstructed_data), len(audio_data))
-                reconstructed_stereo = np.zeros((min_len, audio_data.shape[1]))
-                reconstructed_stereo[:, 0] = reconstructed_data[:min_len]
-                # Salin channel lain dari audio asli
-                for ch in range(1, audio_data.shape[1]):
-                    reconstructed_stereo[:, ch] = audio_data[:min_len, ch]
-                reconstructed_data = reconstructed_stereo
-            
-            # Simpan audio hasil
-            dwt.save_audio(output_file, reconstructed_data, sample_rate)
-            
-            print(f"Pesan berhasil disembunyikan dalam file: {output_file}")
-            
-            try:
-                # Buat file untuk menyimpan kunci
-                key_file = output_file + ".key"
-                with open(key_file, 'w') as f:
-                    f.write("===== KUNCI ECC =====\n\n")
-                    f.write(f"PUBLIC KEY ECC:\n{ecc_crypto.get_public_key()}\n\n")
-                    f.write(f"PRIVATE KEY ECC:\n{ecc_crypto.get_private_key()}\n\n")
-                    f.write("===== KUNCI RSA =====\n\n")
-                    f.write(f"PUBLIC KEY RSA:\n{rsa_crypto.get_public_key()}\n\n")
-                    f.write(f"PRIVATE KEY RSA:\n{rsa_crypto.get_private_key()}\n")
-                print(f"Kunci ECC dan RSA disimpan dalam {key_file}")
-                
-                # Tambahkan informasi panjang pesan dan kunci ke file info
-                info_file = output_file + ".info"
-                info = {
-                    "bits_length": len(all_bits),
-                    "ecc_public_key": ecc_crypto.get_public_key(),
-                    "ecc_private_key": ecc_crypto.get_private_key(),
-                    "rsa_public_key": rsa_crypto.get_public_key(),
-                    "rsa_private_key": rsa_crypto.get_private_key(),
-                    "message_length": len(message),
-                    "alpha": alpha  # Simpan nilai alpha yang digunakan
-                }
-                
-                with open(info_file, 'w') as f:
-                    json.dump(info, f)
-                print(f"Informasi panjang pesan dan kunci disimpan dalam {info_file}")
-                print("PENTING: Dalam aplikasi nyata, kunci privat harus disimpan dengan aman!")
-            except Exception as e:
-                print(f"Peringatan: Terjadi masalah saat menyimpan file kunci: {str(e)}")
-                print("Pesan tetap tersimpan dalam file audio, tetapi kunci mungkin tidak tersimpan dengan benar.")
-            
-            return output_file
-            
-        except Exception as e:
-            print(f"Error saat mengakses atau memproses file audio: {str(e)}")
-            return None
-            
+        start_time = time.perf_counter()
+        info = embed_payload(input_file, output_file, message, alpha=alpha, cache=cache)
+        seconds = time.perf_counter() - start_time
+    except ValueError as e:
+        print(str(e))
+        return None
     except Exception as e:
-        print(f"Terjadi kesalahan saat menyiapkan pesan: {str(e)}")
+        print(f"Terjadi kesalahan saat menyisipkan pesan: {str(e)}")
         traceback.print_exc()
         return None
+    
+    print(f"Pesan berhasil disembunyikan dalam file: {output_file}")
+    
+    try:
+        save_key_files(info, key_file=output_file + ".key", info_file=output_file + ".info")
+        
+        if keystore is not None:
+            keystore.put(path_key_id(output_file), info)
+            print(f"Kunci juga disimpan dalam keystore: {keystore.root}")
+        if index is not None:
+            key_id = path_key_id(output_file) if keystore is not None else None
+            job_id = record_job(index, info, input_file, output_file, key_id=key_id, seconds=seconds)
+            print(f"Job dicatat dalam indeks {index.path} dengan id {job_id}")
+        print("PENTING: Dalam aplikasi nyata, kunci privat harus disimpan dengan aman!")
+    except Exception as e:
+        print(f"Peringatan: Terjadi masalah saat menyimpan file kunci: {str(e)}")
+        print("Pesan tetap tersimpan dalam file audio, tetapi kunci mungkin tidak tersimpan dengan benar.")
+    
+    return output_file
 
-def extract_message(stego_file=None):
+def read_stego_info(stego_file):
+    """
+    Membaca file sidecar .info milik file stego tanpa prompt interaktif.
+    
+    Args:
+        stego_file (str): Path ke file audio stego
+        
+    Returns:
+        dict: Isi file info, atau None jika file info tidak ada
+        
+    Raises:
+        ValueError: Jika file info ada tetapi tidak valid
+    """
+    info_file = stego_file + ".info"
+    if not os.path.exists(info_file):
+        return None
+    try:
+        with open(info_file, 'r') as f:
+            info = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"File info tidak valid: {info_file}") from e
+    if "bits_length" not in info:
+        raise ValueError(f"File info tidak memiliki bits_length: {info_file}")
+    return info
+
+def _keystore_entry(keystore, stego_file, key_id=None):
+    """
+    Entri keystore untuk key_id, atau untuk key_id bawaan dari path file stego
+    (path_key_id, lalu nama file untuk entri lama); None jika tidak ada.
+    """
+    if keystore is None:
+        return None
+    if key_id is not None:
+        return keystore.get(key_id)
+    if not isinstance(stego_file, (str, os.PathLike)):
+        return None
+    return keystore.get(path_key_id(stego_file)) or keystore.get(os.path.basename(stego_file))
+
+def resolve_stego_info(stego_file, keystore=None, key_id=None, index=None):
+    """
+    Mencari informasi ekstraksi: job terbaru di indeks job (jika diberikan),
+    file sidecar .info, lalu chunk metadata di dalam WAV, lalu entri keystore
+    dengan key_id/nama file. Parameter dari indeks dan chunk metadata digabung
+    dengan kunci privat dari keystore sesuai key_id yang tercatat.
+    
+    Args:
+        stego_file (str, file-like, or bytes-like): File audio stego; sidecar
+            dan indeks hanya dicari untuk path
+        keystore (KeyStore, optional): Keystore kunci privat
+        key_id (str, optional): key_id keystore (default: dari indeks atau
+            chunk metadata, atau path_key_id file stego)
+        index (JobIndex, optional): Indeks job (lihat jobindex)
+        
+    Returns:
+        dict: Informasi ekstraksi, atau None jika tidak ditemukan
+        
+    Raises:
+        ValueError: Jika file info atau chunk metadata tidak valid
+    """
+    is_path = isinstance(stego_file, (str, os.PathLike))
+    job = index.lookup(stego_file) if index is not None and is_path else None
+    if job is not None:
+        entry = _keystore_entry(keystore, stego_file, key_id or job["key_id"])
+        if entry is None:
+            # Kunci privat dari sidecar jika tidak ada di keystore
+            entry = read_stego_info(stego_file)
+        return {**(entry or {}), **job["params"]}
+    
+    if is_path:
+        info = read_stego_info(stego_file)
+        if info is not None:
+            return info
+    
+    metadata = read_metadata_chunk(stego_file)
+    if metadata is not None:
+        if metadata.get("version", 1) > METADATA_VERSION:
+            raise ValueError(f"Versi chunk metadata tidak didukung: {metadata['version']}")
+        if "bits_length" not in metadata:
+            raise ValueError("Chunk metadata tidak memiliki bits_length")
+        key_id = key_id or metadata.get("key_id")
+    
+    entry = _keystore_entry(keystore, stego_file, key_id)
+    if metadata is None:
+        return entry
+    # Field publik dari chunk menentukan cara ekstraksi; kunci privat dari keystore
+    return {**(entry or {}), **metadata}
+
+def decode_payload_bits(all_extracted_bits, ecc_private_key=None, rsa_private_key=None):
+    """
+    Mendekode dan mendekripsi bit hasil ekstraksi menjadi pesan asli.
+    
+    Args:
+        all_extracted_bits (str): Bit hasil ekstraksi (panjang header + header + pesan)
+        ecc_private_key (str, optional): Kunci privat ECC dalam format PEM
+        rsa_private_key (str, optional): Kunci privat RSA dalam format PEM
+        
+    Returns:
+        str: Pesan yang didekripsi
+        
+    Raises:
+        ValueError: Jika data rusak, tidak lengkap, atau kunci tidak cocok
+    """
+    if len(all_extracted_bits) < 32:
+        raise ValueError("Data yang diekstrak terlalu pendek! Tidak bisa membaca header.")
+    
+    # Baca panjang header (32 bit pertama)
+    header_length_bits = all_extracted_bits[:32]
+    try:
+        header_length = int(header_length_bits, 2)
+    except ValueError:
+        raise ValueError(f"Bit header panjang tidak valid: {header_length_bits}")
+    
+    # Pastikan data cukup panjang
+    if len(all_extracted_bits) < 32 + header_length:
+        raise ValueError("Data yang diekstrak tidak lengkap! Header tidak lengkap.")
+    
+    # Ekstrak header
+    header_bits = all_extracted_bits[32:32+header_length]
+    header_json = bits_to_text(header_bits)
+    
+    try:
+        # Parse header
+        header = json.loads(header_json)
+        rsa_key_base64 = header["rsa_key"]
+    except (json.JSONDecodeError, KeyError) as e:
+        raise ValueError(f"Error saat parsing header: {str(e)}. Header JSON: {header_json[:100]}...")
+    
+    # Pastikan data cukup panjang untuk pesan
+    if len(all_extracted_bits) < 32 + header_length + 8:  # minimal 1 byte pesan
+        raise ValueError("Data yang diekstrak tidak lengkap! Pesan tidak ditemukan.")
+    
+    # Ekstrak data terenkripsi
+    message_bits = all_extracted_bits[32+header_length:]
+    message_json = bits_to_text(message_bits)
+    
+    try:
+        rsa_encrypted_data_base64 = json.loads(message_json)
+    except json.JSONDecodeError:
+        raise ValueError(f"Error saat parsing pesan terenkripsi. Data mungkin rusak. Data terenkripsi: {message_json[:100]}...")
+    
+    # Dekripsi layer pertama (RSA), kunci tersimpan dimuat tanpa membuat kunci baru
+    if rsa_private_key:
+        print("Mencoba memuat kunci RSA yang tersimpan...")
+    rsa_crypto = SimpleRSACrypto(private_key=rsa_private_key)
+    
+    try:
+        print("Mencoba mendekripsi dengan RSA...")
+        combined_message = rsa_crypto.decrypt_text(rsa_encrypted_data_base64, rsa_key_base64)
+    except Exception as e:
+        raise ValueError(f"Gagal mendekripsi pesan pada layer RSA: {str(e)}. "
+                         "Kemungkinan alasannya: kunci privat RSA tidak cocok atau data rusak") from e
+    
+    try:
+        combined_data = json.loads(combined_message)
+        ecc_encrypted_data_base64 = combined_data["ecc_data"]
+        ecc_key_base64 = combined_data["ecc_key"]
+    except json.JSONDecodeError:
+        raise ValueError(f"Error saat parsing data ECC. Data RSA terdekripsi tetapi format tidak valid. "
+                         f"Data hasil dekripsi RSA: {combined_message[:100]}...")
+    except KeyError as e:
+        raise ValueError(f"Kunci tidak ditemukan dalam data ECC: {str(e)}")
+    
+    # Dekripsi layer kedua (ECC)
+    if ecc_private_key:
+        print("Mencoba memuat kunci ECC yang tersimpan...")
+    ecc_crypto = SimplifiedECCCrypto(private_key=ecc_private_key)
+    
+    print("Mencoba mendekripsi dengan ECC...")
+    return ecc_crypto.decrypt_text(ecc_encrypted_data_base64, ecc_key_base64)
+
+def _recipient_key(info):
+    """Kunci publik RSA penerima jika info milik kontainer multi-pesan."""
+    info = info or {}
+    return info.get("rsa_public_key") if info.get("container") else None
+
+def extract_payload(stego_file, num_bits, alpha=0.001, ecc_private_key=None, rsa_private_key=None,
+                    dwt=None, sample_rate=None, multiband=False, spread_key=None, recipient_key=None,
+                    fec=None, stats=None, soft=False):
+    """
+    Mengekstrak dan mendekripsi pesan dari audio tanpa prompt interaktif.
+    
+    Args:
+        stego_file (str, file-like, bytes-like, or numpy.ndarray): Audio stego
+            (lihat AudioDWT.read_audio)
+        num_bits (int): Jumlah bit yang akan diekstrak
+        alpha (float, optional): Parameter DWT, default 0.001
+        ecc_private_key (str, optional): Kunci privat ECC dalam format PEM
+        rsa_private_key (str, optional): Kunci privat RSA dalam format PEM
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        sample_rate (int, optional): Sample rate, wajib jika input berupa array
+        multiband (bool, optional): Payload disisipkan dalam mode multi-band;
+            urutan band dibaca dari tabel di awal band 1
+        spread_key (str, optional): Kunci mode sebar (info["spread_key"])
+        recipient_key (str, optional): Kunci publik RSA penerima pada kontainer
+            multi-pesan; hanya segmen penerima ini yang diekstrak dan num_bits
+            diabaikan (lihat container)
+        fec (str, optional): Kode FEC payload (info["fec"]); bit hasil ekstraksi
+            dikoreksi sebelum didekripsi
+        stats (dict, optional): Diisi statistik ekstraksi, yaitu
+            stats["fec_corrected"] (jumlah bit yang dikoreksi FEC) dan, pada
+            ekstraksi soft-decision, stats["confidence"] (lihat confidence_report)
+        soft (bool, optional): Ekstraksi soft-decision: keyakinan setiap bit
+            dihitung dari jarak sisa ke ambang dan dipakai decoder FEC (lihat
+            steg.fec). Hanya untuk mode satu band berurutan
+        
+    Returns:
+        str: Pesan yang didekripsi
+        
+    Raises:
+        ValueError: Jika pesan tidak dapat diekstrak atau didekripsi
+    """
+    if recipient_key is not None:
+        from container import extract_container_message
+        return extract_container_message(stego_file, recipient_key, ecc_private_key, rsa_private_key,
+                                         alpha=alpha, dwt=dwt, sample_rate=sample_rate)
+    
+    if soft and (multiband or spread_key is not None):
+        raise ValueError("Ekstraksi soft-decision hanya mendukung mode satu band berurutan")
+    
+    # Buat instance DWT
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    
+    # Baca file audio stego dan terapkan DWT
+    stego_data, sample_rate = dwt.read_audio(stego_file, sample_rate)
+    coeffs = dwt.apply_dwt(stego_data)
+    
+    # Ekstrak bit dengan nilai alpha yang diberikan
+    confidence = None
+    if soft:
+        all_extracted_bits, confidence = dwt.extract_soft_from_coefficients(coeffs, num_bits, alpha=alpha)
+        report = confidence_report(confidence)
+        print(f"Keyakinan bit: rata-rata {report['mean_confidence']:.3f}, "
+              f"{report['low_confidence_bits']} bit di bawah {LOW_CONFIDENCE}")
+        if stats is not None:
+            stats["confidence"] = report
+    else:
+        all_extracted_bits = _extract_layout(dwt, coeffs, num_bits, alpha, multiband, spread_key)
+    if fec is not None:
+        all_extracted_bits, corrected = fec_codec.decode_bits(all_extracted_bits, fec, confidence)
+        print(f"FEC {fec}: {corrected} bit dikoreksi")
+        if stats is not None:
+            stats["fec_corrected"] = corrected
+    
+    return decode_payload_bits(all_extracted_bits, ecc_private_key, rsa_private_key)
+
+def extract_message(stego_file=None, keystore=None, index=None):
     """
     Mengekstrak pesan dari file audio.
     
     Args:
         stego_file (str, optional): Path ke file audio stego
+        keystore (KeyStore, optional): Keystore kunci privat untuk file tanpa
+            sidecar .info (misalnya file dengan chunk metadata)
+        index (JobIndex, optional): Indeks job; parameter ekstraksi diambil dari
+            job terbaru untuk file ini sebelum mencari sidecar
         
     Returns:
         str: Pesan yang diekstrak, atau None jika gagal
@@ -242,39 +1141,29 @@ def extract_message(stego_file=None):
         return None
     
     # Cek apakah ada file info
-    info_file = stego_file + ".info"
     ecc_private_key = None
     rsa_private_key = None
     alpha = 0.001  # Default alpha
     
-    if os.path.exists(info_file):
-        try:
-            with open(info_file, 'r') as f:
-                info = json.load(f)
-            num_bits = info["bits_length"]
-            ecc_private_key = info.get("ecc_private_key")
-            rsa_private_key = info.get("rsa_private_key")
-            
-            # Ambil nilai alpha jika tersedia
-            if "alpha" in info:
-                alpha = info["alpha"]
-                print(f"Menggunakan nilai alpha dari file info: {alpha}")
-            else:
-                print(f"Nilai alpha tidak ditemukan di file info, menggunakan default: {alpha}")
-                
-            print(f"Mengekstrak {num_bits} bit dari file...")
-        except json.JSONDecodeError:
-            print("File info tidak valid. Mohon masukkan jumlah bit secara manual.")
-            num_bits = int(input("Masukkan jumlah bit pesan yang akan diekstrak: "))
+    try:
+        info = resolve_stego_info(stego_file, keystore=keystore, index=index)
+    except ValueError:
+        print("File info tidak valid. Mohon masukkan jumlah bit secara manual.")
+        info = None
+    
+    if info is not None:
+        num_bits = info["bits_length"]
+        ecc_private_key = info.get("ecc_private_key")
+        rsa_private_key = info.get("rsa_private_key")
+        
+        # Ambil nilai alpha jika tersedia
+        if "alpha" in info:
+            alpha = info["alpha"]
+            print(f"Menggunakan nilai alpha dari file info: {alpha}")
+        else:
+            print(f"Nilai alpha tidak ditemukan di file info, menggunakan default: {alpha}")
             
-            # Tanya nilai alpha jika file info tidak valid
-            alpha_str = input("Masukkan nilai alpha untuk DWT (default 0.001): ").strip()
-            if alpha_str:
-                try:
-                    alpha = float(alpha_str)
-                    print(f"Menggunakan alpha = {alpha}")
-                except ValueError:
-                    print(f"Nilai alpha tidak valid, menggunakan default 0.001")
+        print(f"Mengekstrak {num_bits} bit dari file...")
     else:
         num_bits = int(input("Masukkan jumlah bit pesan yang akan diekstrak: "))
         
@@ -292,144 +1181,54 @@ def extract_message(stego_file=None):
     if os.path.exists(key_file):
         print(f"File kunci ditemukan: {key_file}")
     
-    # Buat instance DWT
-    dwt = AudioDWT(wavelet='db2', level=1)
-    
     try:
         # Ekstrak semua bit dari file audio
         print(f"\nMengekstrak pesan dari {stego_file}...")
-        
-        # Baca file audio stego
-        stego_data, sample_rate = dwt.read_audio(stego_file)
-        
-        # Terapkan DWT
-        coeffs = dwt.apply_dwt(stego_data)
-        
-        # Ekstrak bit dengan nilai alpha yang diberikan
-        all_extracted_bits = dwt.extract_bits_from_coefficients(coeffs, num_bits, alpha=alpha)
-        
-        if len(all_extracted_bits) < 32:
-            print("Data yang diekstrak terlalu pendek! Tidak bisa membaca header.")
-            return None
-        
-        # Baca panjang header (32 bit pertama)
-        header_length_bits = all_extracted_bits[:32]
-        try:
-            header_length = int(header_length_bits, 2)
-        except ValueError:
-            print(f"Error: Bit header panjang tidak valid: {header_length_bits}")
-            return None
-        
-        # Pastikan data cukup panjang
-        if len(all_extracted_bits) < 32 + header_length:
-            print("Data yang diekstrak tidak lengkap! Header tidak lengkap.")
-            return None
-        
-        # Ekstrak header
-        header_bits = all_extracted_bits[32:32+header_length]
-        header_json = bits_to_text(header_bits)
-        
-        try:
-            # Parse header
-            header = json.loads(header_json)
-            ecc_public_key = header["ecc_public_key"]
-            rsa_public_key = header["rsa_public_key"]
-            message_length = header["message_length"]
-            rsa_key_base64 = header["rsa_key"]
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error saat parsing header: {str(e)}")
-            print(f"Header JSON: {header_json[:100]}...")  # Hanya tampilkan sebagian
-            return None
-        
-        # Pastikan data cukup panjang untuk pesan
-        if len(all_extracted_bits) < 32 + header_length + 8:  # minimal 1 byte pesan
-            print("Data yang diekstrak tidak lengkap! Pesan tidak ditemukan.")
-            return None
-        
-        # Ekstrak data terenkripsi
-        message_bits = all_extracted_bits[32+header_length:]
-        message_json = bits_to_text(message_bits)
-        
-        try:
-            rsa_encrypted_data_base64 = json.loads(message_json)
-        except json.JSONDecodeError:
-            print(f"Error saat parsing pesan terenkripsi. Data mungkin rusak.")
-            print(f"Data terenkripsi: {message_json[:100]}...")  # Hanya tampilkan sebagian
-            return None
-        
-        # Dekripsi dengan RSA terlebih dahulu
-        rsa_crypto = SimpleRSACrypto()
-        
-        # Load kunci RSA jika tersedia
-        if rsa_private_key:
-            print("Mencoba memuat kunci RSA yang tersimpan...")
-            if rsa_crypto.load_key(rsa_private_key):
-                print("Kunci RSA berhasil dimuat!")
-        
-        try:
-            # Dekripsi layer pertama (RSA)
-            print("Mencoba mendekripsi dengan RSA...")
-            combined_message = rsa_crypto.decrypt_text(rsa_encrypted_data_base64, rsa_key_base64)
-            
-            try:
-                combined_data = json.loads(combined_message)
-                
-                ecc_encrypted_data_base64 = combined_data["ecc_data"]
-                ecc_key_base64 = combined_data["ecc_key"]
-                
-                # Buat instance ECC
-                ecc_crypto = SimplifiedECCCrypto()
-                
-                # Load kunci ECC jika tersedia
-                if ecc_private_key:
-                    print("Mencoba memuat kunci ECC yang tersimpan...")
-                    if ecc_crypto.load_key(ecc_private_key):
-                        print("Kunci ECC berhasil dimuat!")
-                
-                # Dekripsi layer kedua (ECC)
-                print("Mencoba mendekripsi dengan ECC...")
-                decrypted_message = ecc_crypto.decrypt_text(ecc_encrypted_data_base64, ecc_key_base64)
-                
-                print(f"\nPesan yang diekstrak: {decrypted_message}")
-                
-                return decrypted_message
-                
-            except json.JSONDecodeError:
-                print(f"Error saat parsing data ECC. Data RSA terdekripsi tetapi format tidak valid.")
-                print(f"Data hasil dekripsi RSA: {combined_message[:100]}...")
-                return None
-            except KeyError as e:
-                print(f"Kunci tidak ditemukan dalam data ECC: {str(e)}")
-                return None
-            
-        except Exception as e:
-            print(f"Gagal mendekripsi pesan pada layer RSA: {str(e)}")
-            print("Kemungkinan alasannya: kunci privat RSA tidak cocok atau data rusak")
-            return None
-        
+        decrypted_message = extract_payload(stego_file, num_bits, alpha=alpha,
+                                            ecc_private_key=ecc_private_key,
+                                            rsa_private_key=rsa_private_key,
+                                            dwt=dwt_from_info(info),
+                                            multiband=(info or {}).get("multiband", False),
+                                            spread_key=(info or {}).get("spread_key"),
+                                            fec=(info or {}).get("fec"),
+                                            recipient_key=_recipient_key(info))
+        print(f"\nPesan yang diekstrak: {decrypted_message}")
+        return decrypted_message
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+        return None
     except Exception as e:
         print(f"Terjadi kesalahan saat mengekstrak pesan: {str(e)}")
         traceback.print_exc()
         return None
 
-def debug_extract(stego_file=None, num_bits=None):
+def debug_extract(stego_file=None, num_bits=None, alpha=0.001, dwt=None, multiband=False,
+                  spread_key=None, fec=None):
     """
     Fungsi debug untuk mengekstrak dan menampilkan data mentah.
     
     Args:
-        stego_file (str, optional): Path ke file audio stego
+        stego_file (str or file-like, optional): Path atau objek file audio stego
         num_bits (int, optional): Jumlah bit yang akan diekstrak
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT sesuai info (lihat dwt_from_info)
+        multiband (bool, optional): Payload disisipkan dalam mode multi-band
+        spread_key (str, optional): Kunci permutasi mode sebar
+        fec (str, optional): Kode FEC payload; bit hasil ekstraksi didekode dahulu
     """
     # Tanya nama file audio stego jika tidak diberikan
     if stego_file is None:
         stego_file = input("Masukkan path file audio yang akan di-debug: ").strip()
     
-    if not stego_file or not os.path.exists(stego_file):
+    is_path = isinstance(stego_file, str)
+    if is_path and (not stego_file or not os.path.exists(stego_file)):
         print("File tidak ditemukan")
         return
     
     # Cek apakah ada file info untuk mendapatkan jumlah bit
-    if num_bits is None:
+    if num_bits is None and not is_path:
+        num_bits = int(input("Masukkan jumlah bit yang akan diekstrak untuk debug: "))
+    elif num_bits is None:
         info_file = stego_file + ".info"
         if os.path.exists(info_file):
             try:
@@ -437,6 +1236,12 @@ def debug_extract(stego_file=None, num_bits=None):
                     info = json.load(f)
                 num_bits = info["bits_length"]
                 print(f"Jumlah bit dari file info: {num_bits}")
+                # Tata letak dan transformasi penyisipan juga diambil dari info
+                alpha = info.get("alpha", alpha)
+                dwt = dwt or dwt_from_info(info)
+                multiband = info.get("multiband", False)
+                spread_key = info.get("spread_key")
+                fec = info.get("fec")
             except Exception as e:
                 print(f"Error membaca file info: {str(e)}")
                 num_bits = int(input("Masukkan jumlah bit yang akan diekstrak untuk debug: "))
@@ -444,7 +1249,8 @@ def debug_extract(stego_file=None, num_bits=None):
             num_bits = int(input("Masukkan jumlah bit yang akan diekstrak untuk debug: "))
     
     # Buat instance DWT
-    dwt = AudioDWT(wavelet='db2', level=1)
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
     
     try:
         # Ekstrak bit dari file audio
@@ -456,11 +1262,13 @@ def debug_extract(stego_file=None, num_bits=None):
         # Terapkan DWT
         coeffs = dwt.apply_dwt(stego_data)
         
-        # Ekstrak bit dengan alpha default
-        alpha = 0.001  # Nilai alpha default untuk debug
-        all_extracted_bits = dwt.extract_bits_from_coefficients(coeffs, num_bits, alpha=alpha)
+        # Ekstrak bit dengan alpha dan tata letak yang diberikan
+        all_extracted_bits = _extract_layout(dwt, coeffs, num_bits, alpha, multiband, spread_key)
         
         print(f"Jumlah bit yang berhasil diekstrak: {len(all_extracted_bits)}")
+        if fec is not None:
+            all_extracted_bits, corrected = fec_codec.decode_bits(all_extracted_bits, fec)
+            print(f"FEC {fec}: {corrected} bit dikoreksi, {len(all_extracted_bits)} bit payload")
         
         if len(all_extracted_bits) < 32:
             print("ERROR: Data terlalu pendek! Minimal 32 bit diperlukan untuk header.")
@@ -2,4 +2,5 @@
 Package untuk enkripsi dan dekripsi dengan berbagai algoritma kriptografi.
 """
 from .ecc import SimplifiedECCCrypto
-from .rsa import SimpleRSACrypto
\ No newline at end of file
+from .rsa import SimpleRSACrypto
+from .keystore import KeyStore, path_key_id
\ No newline at end of file
@@ -5,23 +5,27 @@ Tanpa ketergantungan pada DiffieHellman
 import os
 import hashlib
 import base64
-from Cryptodome.PublicKey import ECC
-from Cryptodome.Random import get_random_bytes
-from Cryptodome.Cipher import AES
-from Cryptodome.Util.Padding import pad, unpad
+
+# Modul Cryptodome diimpor di dalam method agar import paket crypto tetap ringan
 
 class SimplifiedECCCrypto:
-    def __init__(self):
+    def __init__(self, private_key=None):
         """
         Inisialisasi ECC sederhana
+        
+        Args:
+            private_key (str, optional): Kunci privat PEM yang dimuat alih-alih
+                membuat pasangan kunci baru
         """
         self.key = None
-        self.generate_key()
+        if private_key is None or not self.load_key(private_key):
+            self.generate_key()
     
     def generate_key(self):
         """
         Menghasilkan pasangan kunci ECC
         """
+        from Cryptodome.PublicKey import ECC
         self.key = ECC.generate(curve='P-256')
         return self.key
     
@@ -42,6 +46,10 @@ class SimplifiedECCCrypto:
         return self.key.export_key(format='PEM')
     
     def encrypt_text(self, plaintext):
+        from Cryptodome.Random import get_random_bytes
+        from Cryptodome.Cipher import AES
+        from Cryptodome.Util.Padding import pad
+        
         # Buat kunci sesi acak untuk AES
         session_key = get_random_bytes(16)
         
@@ -73,6 +81,7 @@ class SimplifiedECCCrypto:
         Returns:
             bool: True jika berhasil, False jika gagal
         """
+        from Cryptodome.PublicKey import ECC
         try:
             if is_private:
                 self.key = ECC.import_key(key_str)
@@ -84,6 +93,9 @@ class SimplifiedECCCrypto:
             return False
     
     def decrypt_text(self, encrypted_data_base64, session_key_base64):
+        from Cryptodome.Cipher import AES
+        from Cryptodome.Util.Padding import unpad
+        
         try:
             # Dekode dari base64
             encrypted_data = base64.b64decode(encrypted_data_base64)
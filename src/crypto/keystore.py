@@ -0,0 +1,105 @@
+"""
+Keystore sederhana berbasis direktori untuk menyimpan kunci privat dan
+parameter ekstraksi per file stego, sebagai alternatif file sidecar .info
+"""
+import os
+import re
+import json
+import hashlib
+import tempfile
+
+_KEY_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]+$')
+
+def path_key_id(path):
+    """
+    key_id bawaan untuk sebuah file stego: nama file ditambah hash path
+    absolut yang dinormalisasi, sehingga file bernama sama di direktori
+    berbeda tidak berbagi entri keystore.
+
+    Args:
+        path (str): Path file stego (atau direktori output shard)
+
+    Returns:
+        str: key_id, misalnya "stego.wav.1a2b3c4d5e6f"
+    """
+    normalized = os.path.normcase(os.path.abspath(path))
+    digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:12]
+    name = re.sub(r'[^A-Za-z0-9._-]', '_', os.path.basename(normalized)).strip('.') or "stego"
+    return f"{name}.{digest}"
+
+class KeyStore:
+    def __init__(self, root):
+        """
+        Inisialisasi keystore pada sebuah direktori.
+
+        Args:
+            root (str): Direktori tempat entri keystore disimpan
+        """
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def _entry_path(self, key_id):
+        """
+        Mendapatkan path file entri untuk sebuah key_id
+        """
+        if not key_id or not _KEY_ID_PATTERN.match(key_id) or key_id in ('.', '..'):
+            raise ValueError(f"key_id tidak valid: {key_id!r}")
+        return os.path.join(self.root, key_id + ".json")
+
+    def put(self, key_id, entry, overwrite=False):
+        """
+        Menyimpan entri keystore secara atomik. File sementara dibuat unik
+        (mkstemp) di direktori keystore, sehingga penulisan bersamaan tidak
+        saling bertabrakan.
+
+        Args:
+            key_id (str): Identitas entri (lihat path_key_id)
+            entry (dict): Data entri, minimal berisi kunci privat ECC dan RSA
+            overwrite (bool): Ganti entri yang sudah ada dengan key_id yang sama
+
+        Raises:
+            ValueError: Jika key_id tidak valid, atau sudah ada dan overwrite False
+        """
+        path = self._entry_path(key_id)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{key_id}.", suffix=".tmp", dir=self.root)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            if overwrite:
+                os.replace(tmp_path, path)
+            else:
+                # link gagal secara atomik jika entri sudah ada, sehingga kunci lama tidak hilang
+                try:
+                    os.link(tmp_path, path)
+                except FileExistsError:
+                    raise ValueError(f"key_id sudah ada di keystore: {key_id} "
+                                     f"(gunakan key_id lain)") from None
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, key_id):
+        """
+        Mengambil entri keystore.
+
+        Args:
+            key_id (str): Identitas entri
+
+        Returns:
+            dict: Data entri, atau None jika tidak ada
+        """
+        path = self._entry_path(key_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def __contains__(self, key_id):
+        return os.path.exists(self._entry_path(key_id))
+
+    def key_ids(self):
+        """
+        Mendapatkan daftar key_id yang tersimpan
+        """
+        return sorted(name[:-len(".json")] for name in os.listdir(self.root)
+                      if name.endswith(".json"))
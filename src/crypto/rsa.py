@@ -4,28 +4,29 @@ Implementasi RSA sederhana untuk enkripsi dan dekripsi pesan
 import os
 import base64
 import hashlib
-from Cryptodome.PublicKey import RSA
-from Cryptodome.Cipher import PKCS1_OAEP
-from Cryptodome.Random import get_random_bytes
-from Cryptodome.Cipher import AES
-from Cryptodome.Util.Padding import pad, unpad
+
+# Modul Cryptodome diimpor di dalam method agar import paket crypto tetap ringan
 
 class SimpleRSACrypto:
-    def __init__(self, key_size=2048):
+    def __init__(self, key_size=2048, private_key=None):
         """
         Inisialisasi RSA sederhana
         
         Args:
             key_size (int): Ukuran kunci dalam bit (default: 2048)
+            private_key (str, optional): Kunci privat PEM yang dimuat alih-alih
+                membuat pasangan kunci baru
         """
         self.key_size = key_size
         self.key = None
-        self.generate_key()
+        if private_key is None or not self.load_key(private_key):
+            self.generate_key()
     
     def generate_key(self):
         """
         Menghasilkan pasangan kunci RSA
         """
+        from Cryptodome.PublicKey import RSA
         self.key = RSA.generate(self.key_size)
         return self.key
     
@@ -56,6 +57,10 @@ class SimpleRSACrypto:
         Returns:
             tuple: (encrypted_data_base64, encrypted_session_key_base64)
         """
+        from Cryptodome.Cipher import PKCS1_OAEP, AES
+        from Cryptodome.Random import get_random_bytes
+        from Cryptodome.Util.Padding import pad
+        
         # Buat kunci sesi untuk AES
         session_key = get_random_bytes(16)
         
@@ -87,6 +92,7 @@ class SimpleRSACrypto:
         Returns:
             bool: True jika berhasil, False jika gagal
         """
+        from Cryptodome.PublicKey import RSA
         try:
             if is_private:
                 self.key = RSA.import_key(key_str)
@@ -108,6 +114,9 @@ class SimpleRSACrypto:
         Returns:
             str: Teks yang didekripsi
         """
+        from Cryptodome.Cipher import PKCS1_OAEP, AES
+        from Cryptodome.Util.Padding import unpad
+        
         try:
             # Dekode dari base64
             encrypted_data = base64.b64decode(encrypted_data_base64)
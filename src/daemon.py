@@ -0,0 +1,418 @@
+"""
+Daemon lokal yang menjaga interpreter tetap hangat dan melayani job
+embed, extract, dan scan melalui UNIX socket, beserta client sederhananya.
+
+Protokol: setiap request adalah satu baris JSON
+{"op": ..., "params": {...}, "timeout": detik} dan dijawab dengan satu
+baris JSON {"ok": true, "result": ...} atau
+{"ok": false, "error": ..., "code": "busy"|"timeout"|"invalid"|"failed"}.
+"""
+import os
+import sys
+import json
+import time
+import importlib
+import socket
+import threading
+import socketserver
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from core import embed_payload, extract_payload, save_key_files, resolve_stego_info
+from crypto import KeyStore, path_key_id
+from steg import TRANSFORMS, INTEGER_DTYPES
+from utils import suppress_stdout
+
+# Modul berat yang diimpor sekali per worker saat pool dibuat
+_WARM_MODULES = ("numpy", "soundfile", "Cryptodome.PublicKey.RSA", "Cryptodome.PublicKey.ECC",
+                 "Cryptodome.Cipher.AES", "Cryptodome.Cipher.PKCS1_OAEP")
+
+# Instance DWT yang sudah dihangatkan di setiap worker, per (backend transformasi, dtype, level)
+_worker_dwts = {}
+
+def _warm_worker(wavelet='db2', level=1):
+    """
+    Mengimpor modul berat dan menyiapkan objek wavelet pywt sekali per worker.
+    """
+    import pywt
+    from steg import AudioDWT
+
+    # Diimpor hanya untuk pemanasan: job pertama tidak menanggung waktu import modul berat
+    for name in _WARM_MODULES:
+        importlib.import_module(name)
+
+    _worker_dwts[('pywt', 'float64', level)] = AudioDWT(wavelet=pywt.Wavelet(wavelet), level=level)
+
+def _get_worker_dwt(info=None):
+    """
+    Instance DWT worker untuk backend transformasi, dtype, dan level yang
+    tercatat pada informasi job (lihat dwt_from_info).
+    """
+    info = info or {}
+    dtype = info.get("dtype", "float64")
+    transform = info.get("transform", "lifting" if dtype in INTEGER_DTYPES else "pywt")
+    key = (transform, dtype, info.get("level", 1))
+    if key not in _worker_dwts:
+        from core import dwt_from_info
+        _worker_dwts[key] = dwt_from_info(info)
+    return _worker_dwts[key]
+
+def _run_embed(params):
+    """Job embed yang dijalankan di worker."""
+    with suppress_stdout():
+        return embed_payload(params["input_file"], params["output_file"], params["message"],
+                             alpha=params["alpha"],
+                             dwt=_get_worker_dwt({"transform": params.get("transform", "pywt")}))
+
+def _run_extract(params):
+    """Job extract yang dijalankan di worker."""
+    info = params["info"]
+    with suppress_stdout():
+        return extract_payload(params["stego_file"], info["bits_length"],
+                               alpha=info.get("alpha", 0.001),
+                               ecc_private_key=info.get("ecc_private_key"),
+                               rsa_private_key=info.get("rsa_private_key"),
+                               dwt=_get_worker_dwt(info),
+                               multiband=info.get("multiband", False),
+                               spread_key=info.get("spread_key"),
+                               recipient_key=info.get("rsa_public_key") if info.get("container") else None,
+                               fec=info.get("fec"))
+
+class DaemonError(Exception):
+    """Error job daemon beserta kodenya (busy, timeout, invalid, failed)."""
+    def __init__(self, message, code="failed"):
+        super().__init__(message)
+        self.code = code
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                response = {"ok": False, "error": "Request bukan JSON yang valid", "code": "invalid"}
+            else:
+                response = self.server.stego_daemon.handle_request(request)
+            self.wfile.write((json.dumps(response) + "\n").encode('utf-8'))
+            self.wfile.flush()
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class StegoDaemon:
+    def __init__(self, socket_path, workers=None, max_pending=None, job_timeout=60.0,
+                 keystore_root=None, use_threads=False):
+        """
+        Inisialisasi daemon.
+
+        Args:
+            socket_path (str): Path UNIX socket
+            workers (int, optional): Jumlah worker (default: jumlah CPU)
+            max_pending (int, optional): Batas job yang diterima bersamaan,
+                termasuk yang sedang berjalan (default: 2 x workers). Job baru
+                ditolak dengan kode "busy" jika batas tercapai.
+            job_timeout (float): Batas waktu default per job dalam detik
+            keystore_root (str, optional): Direktori keystore yang dipegang daemon
+            use_threads (bool): Gunakan thread alih-alih proses worker
+        """
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        self.job_timeout = job_timeout
+        self.keystore = KeyStore(keystore_root) if keystore_root else None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._server = None
+        self._thread = None
+
+        if use_threads:
+            _warm_worker()
+            self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+
+        self._handlers = {
+            "ping": self._handle_ping,
+            "embed": self._handle_embed,
+            "extract": self._handle_extract,
+            "scan": self._handle_scan,
+            "shutdown": self._handle_shutdown,
+        }
+
+    def _submit(self, fn, params, blocking=False, timeout=None):
+        """
+        Mengirim job ke pool worker. Slot dilepas saat job selesai atau
+        dibatalkan, sehingga job yang melewati timeout tetap dihitung sampai
+        worker benar-benar bebas.
+        """
+        acquire_timeout = timeout if blocking else None
+        if not self._slots.acquire(blocking=blocking, timeout=acquire_timeout):
+            raise DaemonError("Daemon sibuk: antrean job penuh", code="busy")
+        try:
+            future = self.executor.submit(fn, params)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _wait(self, future, timeout):
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise DaemonError(f"Job melebihi batas waktu {timeout} detik", code="timeout")
+
+    def _resolve_extract_params(self, stego_file, params):
+        """
+        Mencari parameter ekstraksi dari request, sidecar, chunk metadata, atau
+        keystore. Seluruh info diteruskan ke worker sehingga dtype, level, dan
+        mode penyisipan yang tercatat ikut dipakai saat ekstraksi.
+        """
+        info = None
+        key_id = params.get("key_id")
+        if key_id is None:
+            info = resolve_stego_info(stego_file, keystore=self.keystore)
+        elif self.keystore is not None:
+            info = self.keystore.get(key_id)
+        info = dict(info or {})
+        for name in ("bits_length", "alpha"):
+            if params.get(name) is not None:
+                info[name] = params[name]
+        if "bits_length" not in info:
+            raise DaemonError(f"Parameter ekstraksi tidak ditemukan untuk {stego_file}", code="invalid")
+        return {"stego_file": stego_file, "info": info}
+
+    def _handle_ping(self, params, timeout):
+        return {"pid": os.getpid(), "workers": self.workers, "max_pending": self.max_pending}
+
+    def _handle_embed(self, params, timeout):
+        for name in ("input_file", "output_file", "message"):
+            if not params.get(name):
+                raise DaemonError(f"Parameter {name} wajib diisi", code="invalid")
+        job = {
+            "input_file": params["input_file"],
+            "output_file": params["output_file"],
+            "message": params["message"],
+            "alpha": params.get("alpha", 0.001),
+            "transform": params.get("transform", "pywt"),
+        }
+        if job["transform"] not in TRANSFORMS:
+            raise DaemonError(f"Backend transformasi tidak dikenal: {job['transform']}", code="invalid")
+        key_id = None
+        if self.keystore is not None:
+            key_id = params.get("key_id") or path_key_id(job["output_file"])
+            if key_id in self.keystore:
+                raise DaemonError(f"key_id sudah ada di keystore: {key_id}", code="invalid")
+        info = self._wait(self._submit(_run_embed, job), timeout)
+
+        output_file = job["output_file"]
+        result = {"output_file": output_file, "bits_length": info["bits_length"], "alpha": info["alpha"]}
+        with suppress_stdout():
+            if params.get("sidecars", True):
+                save_key_files(info, key_file=output_file + ".key", info_file=output_file + ".info")
+        if self.keystore is not None:
+            self.keystore.put(key_id, info)
+            result["key_id"] = key_id
+        return result
+
+    def _handle_extract(self, params, timeout):
+        if not params.get("stego_file"):
+            raise DaemonError("Parameter stego_file wajib diisi", code="invalid")
+        job = self._resolve_extract_params(params["stego_file"], params)
+        return {"message": self._wait(self._submit(_run_extract, job), timeout)}
+
+    def _handle_scan(self, params, timeout):
+        from batch import collect_stego_files
+
+        deadline = time.monotonic() + timeout
+        jobs = []
+        for stego_file in collect_stego_files(params.get("inputs") or []):
+            try:
+                job = self._resolve_extract_params(stego_file, {})
+                remaining = max(0.0, deadline - time.monotonic())
+                jobs.append((stego_file, self._submit(_run_extract, job, blocking=True, timeout=remaining)))
+            except DaemonError as e:
+                jobs.append((stego_file, e))
+
+        results = []
+        for stego_file, job in jobs:
+            try:
+                if isinstance(job, DaemonError):
+                    raise job
+                message = self._wait(job, max(0.0, deadline - time.monotonic()))
+                results.append({"file": stego_file, "ok": True, "message": message})
+            except Exception as e:
+                results.append({"file": stego_file, "ok": False, "error": f"{type(e).__name__}: {str(e)}"})
+        return results
+
+    def _handle_shutdown(self, params, timeout):
+        threading.Thread(target=self.stop, daemon=True).start()
+        return {"stopping": True}
+
+    def handle_request(self, request):
+        """
+        Memproses satu request dan mengembalikan response-nya.
+
+        Args:
+            request (dict): Request dengan kunci op, params, dan timeout (opsional)
+
+        Returns:
+            dict: Response dengan kunci ok dan result, atau error dan code
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Request harus berupa objek JSON", "code": "invalid"}
+        response = {"id": request.get("id")} if "id" in request else {}
+        try:
+            handler = self._handlers.get(request.get("op"))
+            if handler is None:
+                raise DaemonError(f"Operasi tidak dikenal: {request.get('op')}", code="invalid")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise DaemonError("params harus berupa objek JSON", code="invalid")
+            timeout = request.get("timeout") or self.job_timeout
+            response.update(ok=True, result=handler(params, timeout))
+        except DaemonError as e:
+            response.update(ok=False, error=str(e), code=e.code)
+        except Exception as e:
+            response.update(ok=False, error=f"{type(e).__name__}: {str(e)}", code="failed")
+        return response
+
+    def _bind(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._server = _UnixServer(self.socket_path, _RequestHandler)
+        self._server.stego_daemon = self
+        os.chmod(self.socket_path, 0o600)
+
+    def serve_forever(self):
+        """Menjalankan daemon sampai dihentikan (blocking)."""
+        self._bind()
+        print(f"Daemon siap di {self.socket_path} ({self.workers} worker, "
+              f"maksimal {self.max_pending} job)", file=sys.stderr)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+    def start(self):
+        """Menjalankan daemon di thread latar belakang dan mengembalikan self."""
+        self._bind()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Menghentikan daemon dan pool worker."""
+        if self._server is not None:
+            self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._close()
+
+    def _close(self):
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+class DaemonClient:
+    def __init__(self, socket_path, timeout=None):
+        """
+        Client sederhana untuk StegoDaemon.
+
+        Args:
+            socket_path (str): Path UNIX socket daemon
+            timeout (float, optional): Timeout socket dalam detik
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+
+    def _connect(self):
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(self.timeout)
+            self._sock.connect(self.socket_path)
+            self._file = self._sock.makefile('rwb')
+        return self._file
+
+    def request(self, op, params=None, timeout=None):
+        """
+        Mengirim satu request dan menunggu response-nya.
+
+        Returns:
+            Hasil job
+
+        Raises:
+            DaemonError: Jika daemon mengembalikan error
+        """
+        stream = self._connect()
+        request = {"op": op, "params": params or {}}
+        if timeout is not None:
+            request["timeout"] = timeout
+        stream.write((json.dumps(request) + "\n").encode('utf-8'))
+        stream.flush()
+        line = stream.readline()
+        if not line:
+            self.close()
+            raise DaemonError("Koneksi ke daemon terputus")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise DaemonError(response["error"], code=response.get("code", "failed"))
+        return response["result"]
+
+    def ping(self):
+        return self.request("ping")
+
+    def embed(self, input_file, output_file, message, alpha=0.001, key_id=None, sidecars=True,
+              transform='pywt', timeout=None):
+        params = {
+            "input_file": os.path.abspath(input_file),
+            "output_file": os.path.abspath(output_file),
+            "message": message,
+            "alpha": alpha,
+            "transform": transform,
+            "key_id": key_id,
+            "sidecars": sidecars,
+        }
+        return self.request("embed", params, timeout=timeout)
+
+    def extract(self, stego_file, key_id=None, bits_length=None, alpha=None, timeout=None):
+        params = {
+            "stego_file": os.path.abspath(stego_file),
+            "key_id": key_id,
+            "bits_length": bits_length,
+            "alpha": alpha,
+        }
+        return self.request("extract", params, timeout=timeout)["message"]
+
+    def scan(self, inputs, timeout=None):
+        return self.request("scan", {"inputs": [os.path.abspath(item) for item in inputs]},
+                            timeout=timeout)
+
+    def shutdown(self):
+        return self.request("shutdown")
+
+    def close(self):
+        if self._sock is not None:
+            self._file.close()
+            self._sock.close()
+            self._sock = None
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
@@ -0,0 +1,93 @@
+import io
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+# Add the parent directory to sys.path to import project modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from steg import AudioDWT, INTEGER_DTYPES
+from core import embed_bits_in_audio
+
+def make_carrier(duration: float, sample_rate: int = 44100, channels: int = 2) -> bytes:
+    """Create a PCM_16 stereo WAV blob with a few tones plus noise."""
+    import soundfile as sf
+
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    left = 0.4 * np.sin(2 * np.pi * 440 * t) + 0.05 * np.random.randn(len(t))
+    audio = np.stack([left * (0.8 ** ch) for ch in range(channels)], axis=1)
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format='WAV', subtype='PCM_16')
+    return buffer.getvalue()
+
+def run_pipeline(carrier: bytes, bits: str, alpha: float, dtype: str) -> dict:
+    """Decode, transform, embed, reconstruct, validate and encode once, tracking peak memory."""
+    transform = 'lifting' if dtype in INTEGER_DTYPES else 'pywt'
+    dwt = AudioDWT(wavelet='db2', level=1, dtype=dtype, transform=transform)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    audio_data, sample_rate = dwt.read_audio(carrier)
+    stego = embed_bits_in_audio(audio_data, bits, alpha=alpha, dwt=dwt, validate=True)
+    output = io.BytesIO()
+    dwt.save_audio(output, stego, sample_rate)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"dtype": dtype, "seconds": elapsed, "peak_mb": peak / 2**20, "validated": True}
+
+def run_dtype_benchmark(duration: float = 300, payload_bits: int = 20000, alpha: float = 0.001,
+                        runs: int = 3) -> list:
+    """Compare float64, float32 and integer lifting (int16) on the same carrier and payload."""
+    carrier = make_carrier(duration)
+    bits = "".join(random.choice("01") for _ in range(payload_bits))
+
+    results = []
+    for dtype in ("float64", "float32", "int16"):
+        runs_results = [run_pipeline(carrier, bits, alpha, dtype) for _ in range(runs)]
+        results.append({
+            "dtype": dtype,
+            "seconds": min(r["seconds"] for r in runs_results),
+            "peak_mb": min(r["peak_mb"] for r in runs_results),
+            "validated": all(r["validated"] for r in runs_results),
+        })
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="float64 vs float32 vs int16 processing benchmark")
+    parser.add_argument("--duration", type=float, default=300, help="Carrier duration in seconds")
+    parser.add_argument("--bits", type=int, default=20000, help="Payload size in bits")
+    parser.add_argument("--alpha", type=float, default=0.001, help="Embedding alpha")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per dtype, best is kept")
+    args = parser.parse_args()
+
+    print("===== FLOAT64 VS FLOAT32 VS INT16 PROCESSING BENCHMARK =====")
+    print(f"Carrier: {args.duration:.0f} s stereo PCM_16, payload: {args.bits} bits, alpha: {args.alpha}\n")
+
+    results = run_dtype_benchmark(args.duration, args.bits, args.alpha, args.runs)
+
+    print(f"{'dtype':<10} {'time (s)':>10} {'peak (MB)':>12} {'round-trip':>12}")
+    for result in results:
+        print(f"{result['dtype']:<10} {result['seconds']:>10.3f} {result['peak_mb']:>12.1f} "
+              f"{'OK' if result['validated'] else 'FAIL':>12}")
+
+    base = results[0]
+    print()
+    for fast in results[1:]:
+        print(f"{fast['dtype']} saves {100 * (1 - fast['peak_mb'] / base['peak_mb']):.1f}% peak memory "
+              f"and {100 * (1 - fast['seconds'] / base['seconds']):.1f}% time")
+
+    output_dir = "evaluations/output/dtype"
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = f"{output_dir}/dtype_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w') as f:
+        json.dump({"parameters": vars(args), "results": results}, f, indent=2)
+    print(f"Results saved to: {output_file}")
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from collections import Counter
 from typing import Dict, List, Union, Tuple, Callable
 import os
@@ -193,6 +192,7 @@ class EntropyAnalyzer:
     
     def visualize_encryption_evaluation(self, results, title="Entropy Analysis by Plaintext Length", output_file=None):
         """Visualize encryption entropy evaluation results."""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 7))
         
         # Create subplot 1: Traditional entropy comparison
@@ -238,6 +238,7 @@ class EntropyAnalyzer:
     
     def visualize_entropy(self, title: str = "Entropy Analysis", output_file: str = None) -> None:
         """Visualize entropy comparison."""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 8))
         
         # Bar chart for average entropy
@@ -293,6 +294,7 @@ class EntropyAnalyzer:
             print(f"No block entropy data found for {file_or_name}")
             return
             
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 6))
         
         block_numbers = range(1, len(result['block_entropy']) + 1)
@@ -0,0 +1,93 @@
+import os
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+# Directory containing the project modules (src/)
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry-point modules whose cold-start import time is checked
+DEFAULT_MODULES = ["cli", "core", "batch"]
+
+# Budget for the cumulative import time of each module, in milliseconds
+DEFAULT_BUDGET_MS = 100.0
+
+# Modules that must only be imported by the code path that needs them
+HEAVY_MODULES = ("numpy", "pywt", "soundfile", "scipy", "Cryptodome",
+                 "matplotlib", "librosa", "numba")
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, str]]:
+    """
+    Parse the output of ``python -X importtime``.
+    Returns a list of (self_us, cumulative_us, module_name) tuples.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in
+                                           line.replace("import time:", "|", 1).split("|")]
+        entries.append((int(self_us), int(cumulative_us), name))
+    return entries
+
+def measure_import(module: str, runs: int = 5) -> Dict:
+    """
+    Import a module in a fresh interpreter several times and keep the fastest run.
+    """
+    best_us = None
+    imported = set()
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=SRC_DIR, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+
+        entries = parse_importtime(proc.stderr)
+        total_us = next(cumulative for _, cumulative, name in entries if name == module)
+        if best_us is None or total_us < best_us:
+            best_us = total_us
+        imported = {name.split(".")[0] for _, _, name in entries}
+
+    return {
+        "module": module,
+        "import_ms": best_us / 1000,
+        "heavy_imports": sorted(imported.intersection(HEAVY_MODULES)),
+    }
+
+def check_import_budget(modules: List[str] = None, budget_ms: float = DEFAULT_BUDGET_MS,
+                        runs: int = 5) -> List[Dict]:
+    """
+    Measure every module and mark it as failed when it exceeds the budget
+    or eagerly imports one of the heavy modules.
+    """
+    results = []
+    for module in modules or DEFAULT_MODULES:
+        result = measure_import(module, runs=runs)
+        result["passed"] = result["import_ms"] <= budget_ms and not result["heavy_imports"]
+        results.append(result)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start import time regression check")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Import time budget per module (default {DEFAULT_BUDGET_MS} ms)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module, fastest is kept")
+    args = parser.parse_args()
+
+    print("===== COLD-START IMPORT TIME CHECK =====")
+    print(f"Budget: {args.budget_ms:.1f} ms per module, best of {args.runs} runs\n")
+
+    results = check_import_budget(args.modules, budget_ms=args.budget_ms, runs=args.runs)
+    for result in results:
+        status = "OK" if result["passed"] else "FAIL"
+        heavy = ", ".join(result["heavy_imports"]) or "-"
+        print(f"[{status:>4}] {result['module']:<10} {result['import_ms']:8.2f} ms   heavy imports: {heavy}")
+
+    if not all(result["passed"] for result in results):
+        print("\nImport time regression detected.")
+        sys.exit(1)
+    print("\nAll modules within budget.")
@@ -0,0 +1,100 @@
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+
+import numpy as np
+
+# Add the parent directory to sys.path to import project modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from steg import AudioDWT, kernels
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Pure-Python loops become impractically slow beyond this payload size
+PYTHON_MAX_BITS = 100_000
+
+def time_best(fn, runs: int) -> float:
+    """Run fn several times and return the fastest wall-clock time in seconds."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def warm_up_numba() -> float:
+    """Load (or compile) the cached numba kernels once and return how long it took."""
+    start = time.perf_counter()
+    dwt = AudioDWT(backend="numba")
+    coeffs = [np.zeros(16), np.zeros(16)]
+    embedded = dwt.embed_bits_in_coefficients(coeffs, "0101", alpha=0.001)
+    dwt.extract_bits_from_coefficients(embedded, 4, alpha=0.001)
+    dwt.bytes_to_bits(dwt.bits_to_bytes("0101"))
+    return time.perf_counter() - start
+
+def benchmark_backend(backend: str, num_bits: int, alpha: float, runs: int, seed: int = 0) -> dict:
+    """Time coefficient embed/extract and bit pack/unpack for one backend and payload size."""
+    rng = np.random.default_rng(seed)
+    dwt = AudioDWT(wavelet="db2", level=1, backend=backend)
+    coeffs = [rng.standard_normal(num_bits) * 0.1, rng.standard_normal(num_bits) * 0.05]
+    bits = "".join(rng.choice(["0", "1"], num_bits))
+    packed = dwt.bits_to_bytes(bits)
+    embedded = dwt.embed_bits_in_coefficients(coeffs, bits, alpha=alpha)
+
+    return {
+        "backend": backend,
+        "bits": num_bits,
+        "embed_s": time_best(lambda: dwt.embed_bits_in_coefficients(coeffs, bits, alpha=alpha), runs),
+        "extract_s": time_best(lambda: dwt.extract_bits_from_coefficients(embedded, num_bits, alpha=alpha), runs),
+        "pack_s": time_best(lambda: dwt.bits_to_bytes(bits), runs),
+        "unpack_s": time_best(lambda: dwt.bytes_to_bits(packed), runs),
+        "round_trip_ok": dwt.extract_bits_from_coefficients(embedded, num_bits, alpha=alpha) == bits,
+    }
+
+def run_kernel_benchmark(sizes=None, alpha: float = 0.001, runs: int = 5) -> dict:
+    """Compare the pure-Python, NumPy and numba backends across payload sizes."""
+    sizes = sizes or DEFAULT_SIZES
+    backends = kernels.available_backends()
+    numba_warmup_s = warm_up_numba() if "numba" in backends else None
+
+    results = []
+    for num_bits in sizes:
+        for backend in backends:
+            if backend == "python" and num_bits > PYTHON_MAX_BITS:
+                continue
+            results.append(benchmark_backend(backend, num_bits, alpha, runs))
+    return {"backends": backends, "numba_warmup_s": numba_warmup_s, "results": results}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Embed/extract and bit packing kernel benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Payload sizes in bits")
+    parser.add_argument("--alpha", type=float, default=0.001, help="Embedding alpha")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement, best is kept")
+    args = parser.parse_args()
+
+    print("===== KERNEL BACKEND BENCHMARK =====")
+    report = run_kernel_benchmark(args.sizes, args.alpha, args.runs)
+    print(f"Backends: {', '.join(report['backends'])}")
+    if report["numba_warmup_s"] is not None:
+        print(f"numba kernel load/compile: {report['numba_warmup_s'] * 1000:.1f} ms "
+              f"(cached on disk after the first run)")
+    else:
+        print("numba is not installed, skipping the numba backend")
+
+    print(f"\n{'bits':>10} {'backend':<8} {'embed (ms)':>11} {'extract (ms)':>13} "
+          f"{'pack (ms)':>10} {'unpack (ms)':>12} {'ok':>4}")
+    for r in report["results"]:
+        print(f"{r['bits']:>10} {r['backend']:<8} {r['embed_s'] * 1000:>11.3f} {r['extract_s'] * 1000:>13.3f} "
+              f"{r['pack_s'] * 1000:>10.3f} {r['unpack_s'] * 1000:>12.3f} {'OK' if r['round_trip_ok'] else 'FAIL':>4}")
+
+    output_dir = "evaluations/output/kernels"
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = f"{output_dir}/kernel_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w') as f:
+        json.dump({"parameters": vars(args), **report}, f, indent=2)
+    print(f"Results saved to: {output_file}")
@@ -0,0 +1,80 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from datetime import datetime
+
+import numpy as np
+
+# Add the parent directory to sys.path to import project modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from steg import AudioDWT, TRANSFORMS
+from core import embed_bits_in_audio
+
+def make_carrier(duration: float, sample_rate: int = 44100) -> np.ndarray:
+    """Create a mono float64 carrier with a tone plus noise."""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    return 0.4 * np.sin(2 * np.pi * 440 * t) + 0.05 * np.random.randn(len(t))
+
+def time_embed(audio: np.ndarray, bits: str, alpha: float, dwt: AudioDWT, workers, runs: int):
+    """Best-of-runs time for one embed, returning the output of the last run."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        stego = embed_bits_in_audio(audio, bits, alpha=alpha, dwt=dwt, workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best, stego
+
+def run_shard_benchmark(duration: float = 3600, payload_bits: int = 100000, alpha: float = 0.001,
+                        worker_counts=(1, 2, 4, 8), transform: str = "pywt", dtype: str = "float64",
+                        runs: int = 2) -> dict:
+    """Compare the serial embed path with time-sharded embedding across worker counts."""
+    audio = make_carrier(duration)
+    bits = "".join(random.choice("01") for _ in range(payload_bits))
+    dwt = AudioDWT(wavelet='db2', level=1, dtype=dtype, transform=transform)
+
+    serial_seconds, serial = time_embed(audio, bits, alpha, dwt, None, runs)
+    results = []
+    for workers in worker_counts:
+        seconds, sharded = time_embed(audio, bits, alpha, dwt, workers, runs)
+        results.append({
+            "workers": workers,
+            "seconds": seconds,
+            "speedup": serial_seconds / seconds,
+            "identical": bool(sharded.dtype == serial.dtype and np.array_equal(sharded, serial)),
+        })
+    return {"samples": len(audio), "serial_seconds": serial_seconds, "results": results}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serial vs time-sharded parallel embedding benchmark")
+    parser.add_argument("--duration", type=float, default=3600, help="Carrier duration in seconds")
+    parser.add_argument("--bits", type=int, default=100000, help="Payload size in bits")
+    parser.add_argument("--alpha", type=float, default=0.001, help="Embedding alpha")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts")
+    parser.add_argument("--transform", choices=TRANSFORMS, default="pywt", help="Wavelet transform backend")
+    parser.add_argument("--dtype", choices=("float64", "float32"), default="float64", help="Processing dtype")
+    parser.add_argument("--runs", type=int, default=2, help="Runs per configuration, best is kept")
+    args = parser.parse_args()
+
+    print("===== TIME-SHARDED EMBEDDING BENCHMARK =====")
+    print(f"Carrier: {args.duration:.0f} s mono, payload: {args.bits} bits, transform: {args.transform}, "
+          f"dtype: {args.dtype}, CPUs: {os.cpu_count()}\n")
+
+    summary = run_shard_benchmark(args.duration, args.bits, args.alpha, args.workers,
+                                  args.transform, args.dtype, args.runs)
+
+    print(f"{'workers':<10} {'time (s)':>10} {'speedup':>10} {'identical':>10}")
+    print(f"{'serial':<10} {summary['serial_seconds']:>10.3f} {1.0:>10.2f} {'-':>10}")
+    for result in summary["results"]:
+        print(f"{result['workers']:<10} {result['seconds']:>10.3f} {result['speedup']:>10.2f} "
+              f"{'YES' if result['identical'] else 'NO':>10}")
+
+    output_dir = "evaluations/output/shards"
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = f"{output_dir}/shard_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w') as f:
+        json.dump({"parameters": vars(args), "cpu_count": os.cpu_count(), **summary}, f, indent=2)
+    print(f"Results saved to: {output_file}")
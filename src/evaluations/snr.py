@@ -1,7 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import soundfile as sf
-import librosa
 import os
 import sys
 from typing import Tuple, Dict, Union, List
@@ -19,6 +16,7 @@ class AudioSNREvaluator:
         
     def load_audio(self, file_path: str) -> Tuple[np.ndarray, int]:
         """Load audio file and return signal and sample rate."""
+        import librosa
         try:
             signal, sample_rate = librosa.load(file_path, sr=None, mono=True)
             return signal, sample_rate
@@ -67,6 +65,7 @@ class AudioSNREvaluator:
             print(f"Warning: Sample rates differ - original: {sr_original}Hz, stego: {sr_stego}Hz")
             # Resample if needed
             if len(stego) > 0 and sr_stego > 0:
+                import librosa
                 stego = librosa.resample(stego, orig_sr=sr_stego, target_sr=sr_original)
         
         # Calculate SNR
@@ -106,6 +105,7 @@ class AudioSNREvaluator:
         time = np.arange(0, len(original_signal)) / sample_rate
         
         # Create figure with subplots
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(14, 10))
         
         # Plot 1: Original audio waveform
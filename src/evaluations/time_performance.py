@@ -1,5 +1,4 @@
 import time
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 import sys
@@ -120,6 +119,7 @@ def run_simple_benchmark():
         print(f"  Average: Enc: {avg_enc:.4f}s, Dec: {avg_dec:.4f}s")
     
     # Buat grafik batang sederhana
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(12, 8))
     
     x = np.arange(len(message_lengths))
@@ -0,0 +1,103 @@
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+
+import numpy as np
+
+# Add the parent directory to sys.path to import project modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from steg import get_transform, TRANSFORMS
+
+DEFAULT_DURATIONS = [10, 60, 300]
+
+def time_best(fn, runs: int) -> float:
+    """Run fn several times and return the fastest wall-clock time in seconds."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def make_signal(duration: float, sample_rate: int = 44100, seed: int = 0) -> np.ndarray:
+    """Create a PCM_16-quantized test tone with noise, as float64 in [-1, 1)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    signal = 0.4 * np.sin(2 * np.pi * 440 * t) + 0.05 * rng.standard_normal(len(t))
+    return np.round(signal * 32767) / 32768
+
+def benchmark_transform(name: str, signal: np.ndarray, wavelet: str, level: int, runs: int,
+                        payload_bits: int) -> dict:
+    """Time full forward/inverse and a payload-sized forward_range for one backend."""
+    transform = get_transform(name, wavelet, level)
+    if name == "lifting":
+        # The lifting backend is integer-to-integer on PCM samples
+        signal = np.round(signal * 32768).astype(np.int16)
+
+    coeffs = transform.forward(signal)
+    reconstructed = transform.inverse(coeffs)
+    error = float(np.max(np.abs(reconstructed[:len(signal)].astype(np.float64) - signal)))
+
+    return {
+        "transform": name,
+        "samples": len(signal),
+        "forward_s": time_best(lambda: transform.forward(signal), runs),
+        "inverse_s": time_best(lambda: transform.inverse(coeffs), runs),
+        "range_s": time_best(lambda: transform.forward_range(signal, 0, payload_bits), runs),
+        "max_reconstruction_error": error,
+    }
+
+def compare_with_pywt(signal: np.ndarray, wavelet: str, level: int) -> float:
+    """Largest coefficient difference between the convolution backend and pywt."""
+    reference = get_transform("pywt", wavelet, level).forward(signal)
+    candidate = get_transform("conv", wavelet, level).forward(signal)
+    return float(max(np.max(np.abs(a - b)) for a, b in zip(reference, candidate)))
+
+def run_transform_benchmark(durations=None, wavelet: str = "db2", level: int = 1, runs: int = 5,
+                            payload_bits: int = 20000) -> dict:
+    """Compare the pywt, convolution and lifting backends across signal lengths."""
+    durations = durations or DEFAULT_DURATIONS
+    results = []
+    conv_difference = None
+    for duration in durations:
+        signal = make_signal(duration)
+        conv_difference = compare_with_pywt(signal, wavelet, level)
+        for name in TRANSFORMS:
+            result = benchmark_transform(name, signal, wavelet, level, runs, payload_bits)
+            result["duration"] = duration
+            results.append(result)
+    return {"conv_vs_pywt_max_diff": conv_difference, "results": results}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Wavelet transform backend benchmark")
+    parser.add_argument("--durations", type=float, nargs="+", default=DEFAULT_DURATIONS,
+                        help="Signal durations in seconds (44.1 kHz mono)")
+    parser.add_argument("--wavelet", default="db2", help="Wavelet for the pywt and conv backends")
+    parser.add_argument("--level", type=int, default=1, help="Decomposition level")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement, best is kept")
+    parser.add_argument("--payload-bits", type=int, default=20000,
+                        help="Coefficient count for the forward_range measurement")
+    args = parser.parse_args()
+
+    print("===== TRANSFORM BACKEND BENCHMARK =====")
+    report = run_transform_benchmark(args.durations, args.wavelet, args.level, args.runs, args.payload_bits)
+    print(f"Wavelet: {args.wavelet}, level: {args.level}, "
+          f"conv vs pywt max coefficient difference: {report['conv_vs_pywt_max_diff']:.2e}\n")
+
+    print(f"{'duration':>9} {'backend':<8} {'forward (ms)':>13} {'inverse (ms)':>13} "
+          f"{'range (ms)':>11} {'max error':>10}")
+    for r in report["results"]:
+        print(f"{r['duration']:>8.0f}s {r['transform']:<8} {r['forward_s'] * 1000:>13.3f} "
+              f"{r['inverse_s'] * 1000:>13.3f} {r['range_s'] * 1000:>11.3f} {r['max_reconstruction_error']:>10.1e}")
+
+    output_dir = "evaluations/output/transforms"
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = f"{output_dir}/transform_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w') as f:
+        json.dump({"parameters": vars(args), **report}, f, indent=2)
+    print(f"Results saved to: {output_file}")
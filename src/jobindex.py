@@ -0,0 +1,203 @@
+"""
+Indeks metadata job penyisipan berbasis SQLite (append-only).
+
+Setiap penyisipan dicatat sebagai satu baris: hash carrier, path dan hash
+output, parameter publik ekstraksi (alpha, wavelet, jumlah bit, mode), sidik
+jari kunci, key_id keystore, dan waktu proses. Baris tidak pernah diubah atau
+dihapus; pencarian per path selalu mengambil job terbaru. Kunci privat tidak
+disimpan di indeks, melainkan tetap di sidecar .info atau keystore.
+"""
+import os
+import json
+import time
+import hashlib
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    carrier_path TEXT,
+    carrier_hash TEXT,
+    output_path TEXT,
+    output_hash TEXT,
+    alpha REAL NOT NULL,
+    wavelet TEXT NOT NULL,
+    payload_bits INTEGER NOT NULL,
+    key_fingerprint TEXT,
+    key_id TEXT,
+    params TEXT NOT NULL,
+    embed_seconds REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_output_path ON jobs (output_path);
+CREATE INDEX IF NOT EXISTS jobs_key_fingerprint ON jobs (key_fingerprint);
+CREATE INDEX IF NOT EXISTS jobs_output_hash ON jobs (output_hash);
+CREATE TRIGGER IF NOT EXISTS jobs_no_update BEFORE UPDATE ON jobs
+BEGIN SELECT RAISE(ABORT, 'jobs bersifat append-only'); END;
+CREATE TRIGGER IF NOT EXISTS jobs_no_delete BEFORE DELETE ON jobs
+BEGIN SELECT RAISE(ABORT, 'jobs bersifat append-only'); END;
+"""
+
+# Ukuran blok pembacaan saat menghitung hash file
+HASH_BLOCK_SIZE = 1 << 20
+
+def content_hash(source):
+    """
+    Menghitung SHA-256 isi audio.
+
+    Args:
+        source (str, bytes-like, or file-like): Path, blob, atau objek file
+            biner yang dapat di-seek (posisinya dikembalikan)
+
+    Returns:
+        str: Digest heksadesimal
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        digest.update(source)
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+    else:
+        start = source.tell()
+        source.seek(0)
+        for block in iter(lambda: source.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+        source.seek(start)
+    return digest.hexdigest()
+
+def key_fingerprint(info):
+    """
+    Sidik jari pasangan kunci publik ECC dan RSA dari informasi ekstraksi.
+
+    Returns:
+        str: 32 karakter heksadesimal, atau None jika kunci publik tidak ada
+    """
+    if not info.get("ecc_public_key") or not info.get("rsa_public_key"):
+        return None
+    digest = hashlib.sha256()
+    digest.update(info["ecc_public_key"].encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(info["rsa_public_key"].encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+def _normalize_path(path):
+    return os.path.realpath(path) if path is not None else None
+
+class JobIndex:
+    """
+    Indeks job penyisipan pada sebuah file SQLite.
+
+    Args:
+        path (str): Path file database (dibuat jika belum ada)
+    """
+    def __init__(self, path):
+        import sqlite3
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, info, params, output_path=None, output_hash=None, carrier_path=None,
+               carrier_hash=None, key_id=None, timings=None):
+        """
+        Menambahkan satu job penyisipan.
+
+        Args:
+            info (dict): Informasi ekstraksi (lihat core.build_stego_info)
+            params (dict): Parameter publik ekstraksi (lihat core.public_metadata)
+            output_path (str, optional): Path file stego (None untuk stdout)
+            output_hash (str, optional): SHA-256 file stego
+            carrier_path (str, optional): Path carrier
+            carrier_hash (str, optional): SHA-256 carrier
+            key_id (str, optional): key_id keystore tempat kunci privat disimpan
+            timings (dict, optional): Waktu proses, kunci embed_seconds
+
+        Returns:
+            int: id job
+        """
+        timings = timings or {}
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (created_at, carrier_path, carrier_hash, output_path, output_hash, "
+                "alpha, wavelet, payload_bits, key_fingerprint, key_id, params, embed_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), _normalize_path(carrier_path), carrier_hash,
+                 _normalize_path(output_path), output_hash, params["alpha"],
+                 params.get("wavelet", "db2"), params["bits_length"], key_fingerprint(info),
+                 key_id, json.dumps(params), timings.get("embed_seconds")))
+        return cursor.lastrowid
+
+    @staticmethod
+    def _row(row):
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        return job
+
+    def lookup(self, output_path, output_hash=None):
+        """
+        Mengambil job terbaru untuk sebuah file stego: berdasarkan path, lalu
+        berdasarkan hash isi file (untuk file yang dipindah atau disalin).
+
+        Args:
+            output_path (str): Path file stego
+            output_hash (str, optional): SHA-256 file jika sudah dihitung
+
+        Returns:
+            dict: Baris job (params sudah didekode), atau None jika tidak ada
+        """
+        row = self._conn.execute(
+            "SELECT * FROM jobs WHERE output_path = ? ORDER BY id DESC LIMIT 1",
+            (_normalize_path(output_path),)).fetchone()
+        if row is None:
+            if output_hash is None and os.path.isfile(output_path):
+                output_hash = content_hash(output_path)
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE output_hash = ? ORDER BY id DESC LIMIT 1",
+                (output_hash,)).fetchone()
+        return self._row(row)
+
+    def find_by_fingerprint(self, fingerprint):
+        """Semua job dengan sidik jari kunci tertentu, dari yang terlama."""
+        rows = self._conn.execute("SELECT * FROM jobs WHERE key_fingerprint = ? ORDER BY id",
+                                  (fingerprint,))
+        return [self._row(row) for row in rows]
+
+    def find_by_output_hash(self, output_hash):
+        """Semua job yang menghasilkan file stego dengan hash tertentu, dari yang terlama."""
+        rows = self._conn.execute("SELECT * FROM jobs WHERE output_hash = ? ORDER BY id",
+                                  (output_hash,))
+        return [self._row(row) for row in rows]
+
+    def report(self):
+        """
+        Ringkasan isi indeks.
+
+        Returns:
+            dict: Jumlah job, carrier, output, dan kunci unik, total bit payload,
+                rata-rata waktu, serta jumlah job per wavelet dan alpha
+        """
+        totals = self._conn.execute(
+            "SELECT COUNT(*) AS jobs, COUNT(DISTINCT carrier_hash) AS carriers, "
+            "COUNT(DISTINCT output_path) AS outputs, COUNT(DISTINCT key_fingerprint) AS keys, "
+            "COALESCE(SUM(payload_bits), 0) AS payload_bits, AVG(embed_seconds) AS mean_embed_seconds "
+            "FROM jobs").fetchone()
+        groups = self._conn.execute(
+            "SELECT wavelet, alpha, COUNT(*) AS jobs FROM jobs GROUP BY wavelet, alpha "
+            "ORDER BY jobs DESC")
+        return {**dict(totals), "by_parameters": [dict(row) for row in groups]}
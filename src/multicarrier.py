@@ -0,0 +1,297 @@
+"""
+Sharding payload ke beberapa carrier untuk pesan yang melebihi kapasitas satu
+carrier.
+
+Pesan dienkripsi sekali (satu pasangan kunci ECC+RSA), lalu bitstream hasil
+enkripsi dibagi menjadi shard. Perencana kapasitas memilih carrier terbesar
+sampai kapasitas totalnya cukup dan membagi payload sebanding kapasitas
+masing-masing, sehingga distorsi tersebar merata. Setiap carrier memuat satu
+shard (mode satu band berurutan):
+
+    [indeks shard: 16 bit][jumlah shard: 16 bit][panjang shard: 32 bit][SHA-256 payload: 256 bit][bit shard]
+
+Shard disisipkan paralel di proses worker. Ekstraktor membaca header setiap
+file audio di direktori secara paralel, mengelompokkan shard berdasarkan hash
+payload, menyusun ulang sesuai indeks, lalu memverifikasi hash sebelum
+mendekripsi.
+"""
+import os
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+from steg import AudioDWT
+from core import prepare_message, build_stego_info, decode_payload_bits, _output_subtype
+from container import _extract_range, _record_dwt
+
+# Lebar field header shard dalam bit
+INDEX_BITS = 16
+LENGTH_BITS = 32
+HASH_BITS = 256
+HEADER_BITS = 2 * INDEX_BITS + LENGTH_BITS + HASH_BITS
+
+def payload_hash(all_bits):
+    """SHA-256 (heksadesimal) bitstream payload terenkripsi."""
+    return hashlib.sha256(all_bits.encode('ascii')).hexdigest()
+
+def encode_shard_header(index, count, length, digest):
+    """Mengodekan header shard menjadi string bit HEADER_BITS."""
+    return (format(index, f'0{INDEX_BITS}b') + format(count, f'0{INDEX_BITS}b')
+            + format(length, f'0{LENGTH_BITS}b') + format(int(digest, 16), f'0{HASH_BITS}b'))
+
+def decode_shard_header(bits):
+    """
+    Mendekode header shard.
+
+    Returns:
+        tuple: (indeks, jumlah, panjang, hash heksadesimal)
+
+    Raises:
+        ValueError: Jika header tidak valid
+    """
+    index = int(bits[:INDEX_BITS], 2)
+    count = int(bits[INDEX_BITS:2 * INDEX_BITS], 2)
+    length = int(bits[2 * INDEX_BITS:2 * INDEX_BITS + LENGTH_BITS], 2)
+    digest = format(int(bits[2 * INDEX_BITS + LENGTH_BITS:HEADER_BITS], 2), f'0{HASH_BITS // 4}x')
+    if not index < count or length == 0:
+        raise ValueError(f"Header shard tidak valid: shard {index} dari {count}, panjang {length}")
+    return index, count, length, digest
+
+def carrier_capacity(carrier, dwt):
+    """Kapasitas (bit) carrier dari jumlah frame saja, tanpa mendekode audio."""
+    import soundfile as sf
+    return dwt.transform.band_lengths(sf.info(carrier).frames)[1]
+
+def plan_shards(capacities, payload_bits):
+    """
+    Memilih carrier dan membagi payload di antaranya.
+
+    Carrier dengan kapasitas terbesar dipilih lebih dahulu sampai kapasitas
+    bersihnya (tanpa header shard) mencukupi; payload lalu dibagi sebanding
+    kapasitas bersih carrier terpilih.
+
+    Args:
+        capacities (list): Kapasitas setiap carrier dalam bit
+        payload_bits (int): Panjang payload dalam bit
+
+    Returns:
+        list: (indeks carrier, offset, panjang) untuk setiap shard, sesuai urutan shard
+
+    Raises:
+        ValueError: Jika kapasitas total tidak mencukupi
+    """
+    usable = [max(0, capacity - HEADER_BITS) for capacity in capacities]
+    order = sorted(range(len(usable)), key=lambda i: usable[i], reverse=True)
+    chosen, total = [], 0
+    for i in order:
+        if total >= payload_bits or usable[i] == 0:
+            break
+        chosen.append(i)
+        total += usable[i]
+    if total < payload_bits:
+        raise ValueError(f"Pesan terlalu panjang! Kapasitas total {len(capacities)} carrier: "
+                         f"{total} bit, Pesan terenkripsi: {payload_bits} bit")
+    if len(chosen) >= 1 << INDEX_BITS:
+        raise ValueError(f"Jumlah shard melebihi batas {(1 << INDEX_BITS) - 1}")
+
+    lengths = [payload_bits * usable[i] // total for i in chosen]
+    # Sisa pembulatan dibagikan ke carrier yang masih punya ruang
+    for k, i in enumerate(chosen):
+        extra = min(payload_bits - sum(lengths), usable[i] - lengths[k])
+        lengths[k] += extra
+    plan, offset = [], 0
+    for i, length in zip(chosen, lengths):
+        plan.append((i, offset, length))
+        offset += length
+    return [shard for shard in plan if shard[2] > 0]
+
+def _dwt_params(dwt):
+    return {
+        "wavelet": getattr(dwt.wavelet, 'name', dwt.wavelet),
+        "level": dwt.level,
+        "dtype": dwt.dtype,
+        "backend": dwt.backend,
+        "transform": dwt.transform.name,
+    }
+
+def _embed_shard(task):
+    """Worker: menyisipkan satu shard ke carrier dan menulis file output."""
+    import io
+    import contextlib
+    from core import embed_bits_in_audio
+
+    start_time = time.perf_counter()
+    dwt = AudioDWT(**task["dwt"])
+    with contextlib.redirect_stdout(io.StringIO()):
+        audio_data, sample_rate = dwt.read_audio(task["carrier"])
+        reconstructed_data = embed_bits_in_audio(audio_data, task["bits"], alpha=task["alpha"],
+                                                 dwt=dwt, subtype=task["subtype"])
+        dwt.save_audio(task["output"], reconstructed_data, sample_rate, subtype=task["subtype"])
+    return {"shard": task["shard"], "carrier": task["carrier"], "output": task["output"],
+            "bits": len(task["bits"]), "seconds": round(time.perf_counter() - start_time, 4)}
+
+def shard_output_path(output_dir, shard, carrier):
+    """Path file shard ke-`shard` untuk sebuah carrier."""
+    return os.path.join(output_dir, f"shard{shard:03d}_{os.path.basename(carrier)}")
+
+def embed_sharded(carriers, output_dir, message, alpha=0.001, dwt=None, subtype=None, workers=None):
+    """
+    Mengenkripsi pesan dan menyisipkannya sebagai shard ke beberapa carrier.
+
+    Args:
+        carriers (list): Path file carrier
+        output_dir (str): Direktori output file shard (lihat shard_output_path)
+        message (str): Pesan yang akan disembunyikan
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        subtype (str, optional): Subtype output (lihat core.embed_payload). Pada
+            dtype float defaultnya subtype bawaan file output, sehingga setiap
+            shard disisipkan sadar-kuantisasi; satu shard rusak menggagalkan
+            seluruh payload
+        workers (int, optional): Jumlah proses worker (default jumlah CPU)
+
+    Returns:
+        tuple: (info, hasil) - informasi ekstraksi (lihat core.build_stego_info)
+            dengan info["shards"] dan info["payload_hash"], serta hasil per
+            shard (shard, carrier, output, bits, seconds)
+
+    Raises:
+        ValueError: Jika pesan kosong atau kapasitas total carrier tidak mencukupi
+    """
+    if not message:
+        raise ValueError("Pesan tidak boleh kosong")
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+
+    all_bits, ecc_crypto, rsa_crypto = prepare_message(message)
+    plan = plan_shards([carrier_capacity(carrier, dwt) for carrier in carriers], len(all_bits))
+    digest = payload_hash(all_bits)
+    print(f"Payload {len(all_bits)} bit dibagi menjadi {len(plan)} shard")
+
+    os.makedirs(output_dir, exist_ok=True)
+    if subtype is None and not dwt.integer:
+        subtype = _output_subtype(shard_output_path(output_dir, 0, carriers[0]))
+    tasks = []
+    for shard, (carrier_index, offset, length) in enumerate(plan):
+        carrier = carriers[carrier_index]
+        header = encode_shard_header(shard, len(plan), length, digest)
+        tasks.append({
+            "shard": shard, "carrier": carrier, "output": shard_output_path(output_dir, shard, carrier),
+            "bits": header + all_bits[offset:offset + length], "alpha": alpha,
+            "dwt": _dwt_params(dwt), "subtype": subtype,
+        })
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers < 1:
+        raise ValueError("workers harus minimal 1")
+    if workers == 1:
+        results = [_embed_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_embed_shard, tasks))
+    for result in results:
+        print(f"Shard {result['shard']}: {result['bits']} bit -> {result['output']}")
+
+    info = build_stego_info(all_bits, ecc_crypto, rsa_crypto, message, alpha)
+    info["shards"] = len(plan)
+    info["payload_hash"] = digest
+    _record_dwt(info, dwt, subtype)
+    return info, results
+
+def _read_shard(task):
+    """Worker: membaca header dan bit shard dari satu file; None jika bukan shard."""
+    dwt = AudioDWT(**task["dwt"])
+    try:
+        stego_data, _ = dwt.read_audio(task["file"])
+        index, count, length, digest = decode_shard_header(
+            _extract_range(stego_data, dwt, 0, HEADER_BITS, task["alpha"]))
+        if task["payload_hash"] is not None and digest != task["payload_hash"]:
+            return None
+        bits = _extract_range(stego_data, dwt, HEADER_BITS, length, task["alpha"])
+    except (ValueError, RuntimeError):
+        return None
+    return {"file": task["file"], "shard": index, "count": count, "hash": digest, "bits": bits}
+
+def collect_shards(inputs, alpha=0.001, dwt=None, expected_hash=None, workers=None):
+    """
+    Membaca shard dari direktori, pola glob, atau file secara paralel dan
+    menyusun ulang payload.
+
+    Args:
+        inputs (list): Direktori, pola glob, atau path file (lihat batch.collect_stego_files)
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan
+        expected_hash (str, optional): Hash payload yang dicari (info["payload_hash"]);
+            jika None, harus ada tepat satu set shard lengkap
+        workers (int, optional): Jumlah proses worker (default jumlah CPU)
+
+    Returns:
+        str: Bitstream payload yang hash-nya sudah diverifikasi
+
+    Raises:
+        ValueError: Jika shard tidak lengkap, ganda, atau hash tidak cocok
+    """
+    from batch import collect_stego_files
+
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    files = collect_stego_files(inputs)
+    if not files:
+        raise ValueError("Tidak ada file audio untuk dibaca")
+    tasks = [{"file": path, "alpha": alpha, "dwt": _dwt_params(dwt), "payload_hash": expected_hash}
+             for path in files]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        shards = [_read_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(_read_shard, tasks))
+
+    groups = {}
+    for shard in shards:
+        if shard is not None:
+            groups.setdefault(shard["hash"], []).append(shard)
+    if expected_hash is None:
+        complete = [digest for digest, group in groups.items()
+                    if {shard["shard"] for shard in group} == set(range(group[0]["count"]))]
+        if len(complete) != 1:
+            raise ValueError(f"Ditemukan {len(complete)} set shard lengkap dari {len(files)} file; "
+                             f"gunakan payload_hash dari file info")
+        expected_hash = complete[0]
+    group = groups.get(expected_hash, [])
+    if not group:
+        raise ValueError(f"Tidak ada shard untuk payload ini di antara {len(files)} file")
+
+    count = group[0]["count"]
+    by_index = {}
+    for shard in group:
+        if shard["count"] != count:
+            raise ValueError(f"Jumlah shard tidak konsisten pada {shard['file']}")
+        if shard["shard"] in by_index and by_index[shard["shard"]]["bits"] != shard["bits"]:
+            raise ValueError(f"Shard {shard['shard']} ganda dengan isi berbeda: "
+                             f"{by_index[shard['shard']]['file']}, {shard['file']}")
+        by_index[shard["shard"]] = shard
+    missing = sorted(set(range(count)) - set(by_index))
+    if missing:
+        raise ValueError(f"Shard tidak lengkap: {count - len(missing)} dari {count}, "
+                         f"hilang {', '.join(map(str, missing))}")
+
+    all_bits = "".join(by_index[index]["bits"] for index in range(count))
+    if payload_hash(all_bits) != expected_hash:
+        raise ValueError("Hash payload hasil penyusunan ulang tidak cocok; shard rusak")
+    print(f"Payload {len(all_bits)} bit disusun dari {count} shard")
+    return all_bits
+
+def extract_sharded(inputs, ecc_private_key=None, rsa_private_key=None, alpha=0.001, dwt=None,
+                    expected_hash=None, workers=None):
+    """
+    Menyusun ulang payload dari shard (lihat collect_shards) lalu mendekripsinya.
+
+    Returns:
+        str: Pesan yang didekripsi
+
+    Raises:
+        ValueError: Jika shard tidak lengkap, hash tidak cocok, atau dekripsi gagal
+    """
+    all_bits = collect_shards(inputs, alpha=alpha, dwt=dwt, expected_hash=expected_hash, workers=workers)
+    return decode_payload_bits(all_bits, ecc_private_key, rsa_private_key)
@@ -0,0 +1,145 @@
+"""
+Penyisipan paralel per segmen waktu untuk carrier yang panjang.
+
+Carrier dibagi menjadi segmen waktu yang sejajar 2^level. Setiap worker membaca
+audio dari multiprocessing.shared_memory, mentransformasi jendela segmennya
+(dengan overlap selebar support wavelet), menyisipkan bit untuk koefisien yang
+jatuh di jendela tersebut, merekonstruksi, lalu menulis sampel inti segmennya
+ke buffer output bersama. Setiap koefisien dan sampel dihitung dari jendela
+yang memuat seluruh support filternya, sehingga hasilnya identik bit-per-bit
+dengan jalur serial embed_bits_in_audio.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from steg import AudioDWT, kernels
+
+def segment_bounds(length, segments, block=1):
+    """
+    Membagi [0, length) menjadi paling banyak `segments` segmen yang batasnya
+    sejajar `block`.
+
+    Returns:
+        list: Pasangan (awal, akhir) setiap segmen
+    """
+    size = -(-length // max(1, segments))
+    size = max(block, -(-size // block) * block)
+    bounds = list(range(0, length, size)) + [length]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _embed_segment(task):
+    """Worker: transformasi, penyisipan, dan rekonstruksi satu segmen."""
+    import numpy as np
+
+    dwt = AudioDWT(**task["dwt"])
+    transform = dwt.transform
+    length, start, stop = task["length"], task["start"], task["stop"]
+    source = SharedMemory(name=task["input"])
+    target = SharedMemory(name=task["output"])
+    try:
+        data = np.ndarray((length,), dtype=dwt.dtype, buffer=source.buf)
+        output = np.ndarray((task["capacity"],), dtype=dwt.dtype, buffer=target.buf)
+
+        inv_start, inv_stop, lengths, fwd_start, fwd_stop = transform.shard_window(start, stop, length)
+        coeffs = transform.forward(data[fwd_start:fwd_stop])
+        window = []
+        for band, band_coeffs in enumerate(coeffs):
+            offset = (inv_start - fwd_start) >> transform.band_level(band)
+            window.append(band_coeffs[offset:offset + lengths[band]])
+
+        if task["bits"]:
+            window[1] = kernels.embed_coefficients(window[1], kernels.bits_to_array(task["bits"]),
+                                                   dwt.embedding_step(task["alpha"]), dwt.backend)
+        reconstructed = transform.inverse(window)
+
+        # Segmen terakhir membawa seluruh ekor hasil rekonstruksi (bisa lebih panjang dari input)
+        end = inv_start + len(reconstructed) if task["last"] else stop
+        output[start:end] = reconstructed[start - inv_start:end - inv_start]
+        del data, output
+        return end
+    finally:
+        source.close()
+        target.close()
+
+def reconstruct_sharded(audio_data, all_bits, alpha=0.001, dwt=None, workers=None, segments=None):
+    """
+    Menyisipkan bit (mode satu band berurutan) dan merekonstruksi channel
+    pertama secara paralel per segmen waktu.
+
+    Args:
+        audio_data (numpy.ndarray): Data audio asli (channel 0 dipakai)
+        all_bits (str): String bit yang akan disisipkan
+        alpha (float, optional): Parameter DWT, default 0.001
+        dwt (AudioDWT, optional): Instance DWT yang digunakan (dtype float)
+        workers (int, optional): Jumlah proses worker (default jumlah CPU)
+        segments (int, optional): Jumlah segmen (default sama dengan workers)
+
+    Returns:
+        numpy.ndarray: Channel hasil rekonstruksi, identik dengan
+            dwt.apply_idwt(dwt.embed_bits_in_coefficients(...)) pada jalur serial
+
+    Raises:
+        ValueError: Jika dtype integer atau workers kurang dari 1
+    """
+    import numpy as np
+
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    if dwt.integer:
+        raise ValueError("Mode sharding hanya mendukung dtype float")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers harus minimal 1")
+
+    channel = audio_data[:, 0] if audio_data.ndim > 1 else audio_data
+    length = len(channel)
+    bounds = segment_bounds(length, segments or workers, 1 << dwt.level)
+    if len(bounds) <= 1:
+        # Satu segmen tidak perlu shared memory maupun proses worker
+        coeffs = dwt.apply_dwt(channel)
+        return dwt.apply_idwt(dwt.embed_bits_in_coefficients(coeffs, all_bits, alpha=alpha))
+
+    itemsize = np.dtype(dwt.dtype).itemsize
+    # Hasil IDWT bisa lebih panjang dari input hingga satu blok 2^level
+    capacity = length + (1 << dwt.level)
+    params = {
+        "wavelet": getattr(dwt.wavelet, 'name', dwt.wavelet),
+        "level": dwt.level,
+        "dtype": dwt.dtype,
+        "backend": dwt.backend,
+        "transform": dwt.transform.name,
+    }
+
+    source = SharedMemory(create=True, size=max(1, length * itemsize))
+    target = SharedMemory(create=True, size=capacity * itemsize)
+    try:
+        np.ndarray((length,), dtype=dwt.dtype, buffer=source.buf)[:] = channel
+
+        detail_level = dwt.transform.band_level(1)
+        tasks = []
+        for index, (start, stop) in enumerate(bounds):
+            inv_start, _, lengths, _, _ = dwt.transform.shard_window(start, stop, length)
+            first = inv_start >> detail_level
+            tasks.append({
+                "dwt": params, "input": source.name, "output": target.name,
+                "length": length, "capacity": capacity, "start": start, "stop": stop,
+                "last": index == len(bounds) - 1,
+                "bits": all_bits[first:first + lengths[1]], "alpha": alpha,
+            })
+
+        if workers == 1:
+            ends = [_embed_segment(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                ends = list(executor.map(_embed_segment, tasks))
+
+        output = np.ndarray((capacity,), dtype=dwt.dtype, buffer=target.buf)
+        result = output[:max(ends, default=0)].copy()
+        del output
+        return result
+    finally:
+        source.close()
+        source.unlink()
+        target.close()
+        target.unlink()
@@ -1,4 +1,9 @@
 """
 Package untuk steganografi audio.
 """
-from .dwt import AudioDWT
\ No newline at end of file
+from .dwt import AudioDWT, DTYPES, INTEGER_DTYPES
+from .wav import quantize_samples, OUTPUT_SUBTYPES, PCM_SUBTYPE_STEPS, INTEGER_SUBTYPES
+from .wav import append_metadata_chunk, read_metadata_chunk, METADATA_VERSION
+from .transforms import get_transform, TRANSFORMS
+from .cache import CarrierCache, DEFAULT_CACHE_BYTES
+from .fec import FEC_CODES
@@ -0,0 +1,56 @@
+"""
+Kernel numba untuk steg.kernels. Modul ini hanya diimpor jika numba terpasang;
+hasil kompilasi di-cache ke disk (cache=True) sehingga hanya proses pertama
+yang membayar waktu kompilasi.
+"""
+import numpy as np
+from numba import njit
+
+# alpha/step dikirim dengan tipe yang sama seperti koefisien sehingga aritmetika
+# float32 tidak dipromosikan ke float64 (sama seperti NumPy dan loop Python)
+
+@njit(cache=True)
+def embed_coefficients(detail_coeffs, bits, alpha):
+    modified = detail_coeffs.copy()
+    step = alpha + alpha
+    zero = alpha - alpha
+    for i in range(bits.shape[0]):
+        coeff_abs = abs(modified[i])
+        remainder = coeff_abs % step
+        target = alpha if bits[i] != 0 else zero
+        adjusted = coeff_abs + (target - remainder)
+        modified[i] = adjusted if modified[i] >= 0 else -adjusted
+    return modified
+
+@njit(cache=True)
+def extract_coefficients(detail_coeffs, num_bits, step, threshold_low, threshold_high):
+    count = min(num_bits, detail_coeffs.shape[0])
+    bits = np.zeros(count, dtype=np.uint8)
+    for i in range(count):
+        remainder = abs(detail_coeffs[i]) % step
+        if remainder >= threshold_low and remainder <= threshold_high:
+            bits[i] = 1
+    return bits
+
+@njit(cache=True)
+def pack_bits(bits):
+    count = bits.shape[0]
+    packed = np.zeros((count + 7) // 8, dtype=np.uint8)
+    for i in range(packed.shape[0]):
+        byte = 0
+        for j in range(8):
+            index = i * 8 + j
+            byte <<= 1
+            if index < count:
+                byte |= bits[index] & 1
+        packed[i] = byte
+    return packed
+
+@njit(cache=True)
+def unpack_bits(data):
+    bits = np.empty(data.shape[0] * 8, dtype=np.uint8)
+    for i in range(data.shape[0]):
+        byte = data[i]
+        for j in range(8):
+            bits[i * 8 + j] = (byte >> (7 - j)) & 1
+    return bits
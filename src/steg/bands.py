@@ -0,0 +1,187 @@
+"""
+Penyisipan multi-band: payload disebar ke beberapa band detail dekomposisi level-N.
+
+Indeks band mengikuti tata letak koefisien [cA_n, cD_n, ..., cD_1], yaitu
+1 = cD_n (paling kasar) sampai n = cD_1 (paling halus). Tabel band (jumlah
+band lalu indeks setiap band, masing-masing 8 bit) selalu disisipkan di awal
+band 1, kemudian payload mengisi band sesuai urutan tabel sampai kapasitas
+masing-masing. Karena tabel berada di lokasi tetap, ekstraktor cukup
+mengetahui level dekomposisi untuk menemukan pilihan dan urutan band.
+
+Koefisien sepanjang support filter di kedua tepi setiap band dilewati, karena
+koefisien batas transformasi redundan (pywt/conv) tidak bertahan setelah
+rekonstruksi.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from . import kernels
+
+# Lebar field tabel band (jumlah band dan indeks band)
+BAND_FIELD_BITS = 8
+
+def default_bands(level):
+    """Urutan band bawaan: dari band paling halus (kapasitas terbesar) ke paling kasar."""
+    return list(range(level, 0, -1))
+
+def validate_bands(bands, level):
+    """
+    Memeriksa pilihan band.
+
+    Raises:
+        ValueError: Jika kosong, ganda, atau di luar 1..level
+    """
+    bands = [int(band) for band in bands]
+    if not bands:
+        raise ValueError("Minimal satu band harus dipilih")
+    if len(set(bands)) != len(bands):
+        raise ValueError(f"Band tidak boleh ganda: {bands}")
+    invalid = [band for band in bands if not 1 <= band <= level]
+    if invalid:
+        raise ValueError(f"Band {invalid} di luar rentang 1..{level} untuk level {level}")
+    return bands
+
+def table_length(bands):
+    """Panjang tabel band dalam bit."""
+    return BAND_FIELD_BITS * (1 + len(bands))
+
+def encode_band_table(bands):
+    """Mengodekan jumlah dan urutan band menjadi string bit."""
+    return "".join(format(value, f'0{BAND_FIELD_BITS}b') for value in [len(bands)] + list(bands))
+
+def band_capacities(band_lengths, support):
+    """
+    Kapasitas setiap band detail setelah tepi band dilewati.
+
+    Args:
+        band_lengths (list): Panjang setiap band [cA_n, cD_n, ..., cD_1]
+        support (int): Panjang filter backend transformasi
+
+    Returns:
+        dict: {indeks band: kapasitas dalam bit}
+    """
+    return {band: max(0, length - 2 * support) for band, length in enumerate(band_lengths) if band}
+
+def plan_bands(capacities, bands, num_bits, support):
+    """
+    Membagi payload ke band sesuai urutan.
+
+    Returns:
+        list: (band, awal koefisien, jumlah bit) untuk setiap band yang terisi
+
+    Raises:
+        ValueError: Jika tabel atau payload melebihi kapasitas band
+    """
+    table_bits = table_length(bands)
+    if capacities.get(1, 0) < table_bits:
+        raise ValueError(f"Band 1 terlalu pendek untuk tabel band ({table_bits} bit)")
+
+    plan = []
+    remaining = num_bits
+    for band in bands:
+        if remaining == 0:
+            break
+        start = support + (table_bits if band == 1 else 0)
+        available = capacities[band] - (table_bits if band == 1 else 0)
+        count = min(remaining, available)
+        if count > 0:
+            plan.append((band, start, count))
+            remaining -= count
+    if remaining:
+        capacity = sum(capacities[band] for band in bands) - (table_bits if 1 in bands else 0)
+        raise ValueError(f"Pesan terlalu panjang! Kapasitas band {bands}: {capacity} bit, "
+                         f"Pesan terenkripsi: {num_bits} bit")
+    return plan
+
+def embed_bands(coeffs, bits, step, bands, support, backend='numpy'):
+    """
+    Menyisipkan tabel band dan payload ke band detail.
+
+    Args:
+        coeffs (list): Koefisien wavelet [cA_n, cD_n, ..., cD_1]
+        bits (str): String bit payload
+        step (float or int): Alpha, atau langkah integer pada mode integer
+        bands (list): Urutan band (lihat validate_bands)
+        support (int): Panjang filter backend transformasi
+        backend (str): Backend kernel (lihat steg.kernels)
+
+    Returns:
+        list: Koefisien wavelet yang telah dimodifikasi
+    """
+    level = len(coeffs) - 1
+    bands = validate_bands(bands, level)
+    capacities = band_capacities([len(c) for c in coeffs], support)
+    plan = plan_bands(capacities, bands, len(bits), support)
+
+    modified = list(coeffs)
+    payload = kernels.bits_to_array(bits)
+    table = kernels.bits_to_array(encode_band_table(bands))
+
+    def write(band, start, values):
+        if modified[band] is coeffs[band]:
+            modified[band] = coeffs[band].copy()
+        stop = start + len(values)
+        modified[band][start:stop] = kernels.embed_coefficients(
+            coeffs[band][start:stop], values, step, backend)
+
+    write(1, support, table)
+    offset = 0
+    for band, start, count in plan:
+        write(band, start, payload[offset:offset + count])
+        offset += count
+    return modified
+
+def read_band_table(coeffs, step, support, backend='numpy'):
+    """
+    Membaca urutan band dari tabel di awal band 1.
+
+    Raises:
+        ValueError: Jika tabel tidak valid untuk level dekomposisi koefisien
+    """
+    level = len(coeffs) - 1
+    detail = coeffs[1][support:]
+    count = int(kernels.array_to_bits(
+        kernels.extract_coefficients(detail, BAND_FIELD_BITS, step, backend)), 2)
+    if not 1 <= count <= level:
+        raise ValueError(f"Tabel band tidak valid: {count} band untuk level {level}")
+    values = kernels.array_to_bits(
+        kernels.extract_coefficients(detail, table_length(range(count)), step, backend))
+    bands = [int(values[i:i + BAND_FIELD_BITS], 2)
+             for i in range(BAND_FIELD_BITS, len(values), BAND_FIELD_BITS)]
+    try:
+        return validate_bands(bands, level)
+    except ValueError as e:
+        raise ValueError(f"Tabel band tidak valid: {e}") from e
+
+def extract_bands(coeffs, num_bits, step, support, backend='numpy', workers=None):
+    """
+    Mengekstrak payload multi-band; setiap band diekstrak secara bersamaan.
+
+    Args:
+        coeffs (list): Koefisien wavelet [cA_n, cD_n, ..., cD_1]
+        num_bits (int): Jumlah bit payload
+        step (float or int): Alpha, atau langkah integer pada mode integer
+        support (int): Panjang filter backend transformasi
+        backend (str): Backend kernel (lihat steg.kernels)
+        workers (int, optional): Jumlah thread (default: satu per band)
+
+    Returns:
+        str: String bit payload
+    """
+    import numpy as np
+
+    bands = read_band_table(coeffs, step, support, backend)
+    capacities = band_capacities([len(c) for c in coeffs], support)
+    plan = plan_bands(capacities, bands, num_bits, support)
+
+    def extract(entry):
+        band, start, count = entry
+        return kernels.extract_coefficients(coeffs[band][start:], count, step, backend)
+
+    if len(plan) > 1:
+        with ThreadPoolExecutor(max_workers=workers or len(plan)) as executor:
+            parts = list(executor.map(extract, plan))
+    else:
+        parts = [extract(entry) for entry in plan]
+    if not parts:
+        return ""
+    return kernels.array_to_bits(np.concatenate(parts))
@@ -0,0 +1,169 @@
+"""
+Cache carrier berbasis isi: sampel hasil dekode dan koefisien DWT disimpan
+sebagai file .npy dan dibuka kembali dengan np.load(mmap_mode='r').
+
+Kunci cache adalah SHA-256 isi file carrier ditambah wavelet, level, dtype,
+dan backend transformasi, sehingga penyisipan berulang ke carrier yang sama
+melewati dekode dan transformasi maju sepenuhnya. Setiap entri adalah satu
+direktori yang ditulis ke direktori sementara lalu di-rename secara atomik.
+Ukuran total dibatasi; entri yang paling lama tidak dipakai (mtime meta.json,
+diperbarui setiap hit) dihapus lebih dahulu.
+"""
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+# Batas ukuran cache bawaan (byte)
+DEFAULT_CACHE_BYTES = 1 << 30
+
+# Ukuran blok pembacaan saat menghitung hash carrier
+HASH_BLOCK_SIZE = 1 << 20
+
+class CarrierCache:
+    """
+    Cache sampel dan koefisien DWT carrier di sebuah direktori.
+
+    Args:
+        root (str): Direktori cache (dibuat jika belum ada)
+        max_bytes (int, optional): Batas ukuran total entri cache
+    """
+    def __init__(self, root, max_bytes=DEFAULT_CACHE_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("Batas ukuran cache harus positif")
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def content_key(source, dwt):
+        """
+        Kunci cache untuk carrier dan konfigurasi DWT.
+
+        Args:
+            source (str or bytes-like): Path atau blob carrier
+            dwt (AudioDWT): Instance DWT
+
+        Returns:
+            str: Digest heksadesimal
+        """
+        digest = hashlib.sha256()
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                    digest.update(block)
+        else:
+            digest.update(source)
+        wavelet = getattr(dwt.wavelet, 'name', dwt.wavelet)
+        digest.update(f"|{wavelet}|{dwt.level}|{dwt.dtype}|{dwt.transform.name}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.root, key)
+
+    def get(self, key):
+        """
+        Membuka entri cache sebagai memmap read-only.
+
+        Returns:
+            tuple: (sampel, sample_rate, koefisien), atau None jika tidak ada
+        """
+        import numpy as np
+
+        entry = self._entry_dir(key)
+        meta_path = os.path.join(entry, "meta.json")
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            samples = np.load(os.path.join(entry, "samples.npy"), mmap_mode='r')
+            coeffs = [np.load(os.path.join(entry, f"coeffs_{band}.npy"), mmap_mode='r')
+                      for band in range(meta["bands"])]
+        except (OSError, ValueError, KeyError):
+            return None
+        # Tandai sebagai baru dipakai untuk kebijakan LRU
+        os.utime(meta_path)
+        return samples, meta["sample_rate"], coeffs
+
+    def put(self, key, samples, sample_rate, coeffs):
+        """Menyimpan entri cache secara atomik, lalu menegakkan batas ukuran."""
+        import numpy as np
+
+        tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.root)
+        try:
+            np.save(os.path.join(tmp_dir, "samples.npy"), samples)
+            for band, band_coeffs in enumerate(coeffs):
+                np.save(os.path.join(tmp_dir, f"coeffs_{band}.npy"), band_coeffs)
+            with open(os.path.join(tmp_dir, "meta.json"), 'w') as f:
+                json.dump({"sample_rate": sample_rate, "bands": len(coeffs)}, f)
+            try:
+                os.rename(tmp_dir, self._entry_dir(key))
+            except OSError:
+                # Proses lain sudah menulis entri yang sama
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        self.evict()
+
+    def _entries(self):
+        """Entri cache sebagai list (waktu akses, ukuran, path)."""
+        entries = []
+        for entry in os.scandir(self.root):
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            try:
+                files = list(os.scandir(entry.path))
+                size = sum(f.stat().st_size for f in files)
+                accessed = os.stat(os.path.join(entry.path, "meta.json")).st_mtime
+            except OSError:
+                continue
+            entries.append((accessed, size, entry.path))
+        return entries
+
+    def size(self):
+        """Ukuran total entri cache dalam byte."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Menghapus entri yang paling lama tidak dipakai sampai ukuran total
+        tidak melebihi max_bytes.
+
+        Returns:
+            int: Jumlah entri yang dihapus
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def load(self, source, dwt, sample_rate=None):
+        """
+        Membaca carrier beserta koefisien DWT channel pertamanya, dari cache
+        jika ada; jika tidak, carrier didekode, ditransformasi, dan disimpan.
+
+        Args:
+            source (str or bytes-like): Path atau blob carrier
+            dwt (AudioDWT): Instance DWT
+            sample_rate (int, optional): Diteruskan ke AudioDWT.read_audio
+
+        Returns:
+            tuple: (sampel, sample_rate, koefisien); pada hit berupa memmap read-only
+        """
+        key = self.content_key(source, dwt)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        samples, sample_rate = dwt.read_audio(source, sample_rate)
+        coeffs = dwt.apply_dwt(samples)
+        self.put(key, samples, sample_rate, coeffs)
+        cached = self.get(key)
+        # Entri bisa langsung tergusur jika lebih besar dari batas cache
+        return cached if cached is not None else (samples, sample_rate, coeffs)
@@ -1,43 +1,120 @@
-import numpy as np
-import pywt
-import soundfile as sf
-from scipy import signal
+import os
+import io
+
+from .wav import wav_buffer_view, samples_to_float, samples_to_int, PCM_FULL_SCALE
+from . import kernels, bands as band_layout, permutation
+from .transforms import get_transform
+
+# numpy, pywt, dan soundfile diimpor di dalam method agar import paket steg
+# tetap ringan untuk CLI yang berumur pendek
+
+# Tipe sampel yang didukung; tipe integer memakai lifting integer yang eksak
+DTYPES = ('float64', 'float32', 'int16', 'int32')
+INTEGER_DTYPES = ('int16', 'int32')
 
 class AudioDWT:
-    def __init__(self, wavelet='db1', level=1):
+    def __init__(self, wavelet='db1', level=1, dtype='float64', backend='auto', transform='pywt'):
         """
         Inisialisasi AudioDWT dengan tipe wavelet dan level dekomposisi.
         
         Args:
-            wavelet (str): Tipe wavelet yang digunakan (default: 'db1')
+            wavelet (str or pywt.Wavelet): Tipe wavelet yang digunakan (default: 'db1')
             level (int): Level dekomposisi DWT (default: 1)
+            dtype (str): Tipe float untuk dekode, transformasi, penyisipan, dan
+                rekonstruksi ('float64' atau 'float32', default: 'float64').
+                'float32' memangkas memori dan bandwidth menjadi setengahnya.
+                'int16'/'int32' membaca sampel PCM apa adanya dan memakai
+                lifting integer 5/3, sehingga penyisipan dan rekonstruksi
+                eksak tanpa buffer float (wajib transform='lifting').
+            backend (str): Kernel penyisipan/ekstraksi dan pengemasan bit
+                ('auto', 'python', 'numpy', atau 'numba'; lihat steg.kernels).
+                'auto' memakai numba untuk payload besar jika terpasang,
+                selain itu NumPy.
+            transform (str): Backend transformasi ('pywt', 'conv', atau
+                'lifting'; lihat steg.transforms)
         """
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype harus salah satu dari {', '.join(DTYPES)}, bukan {dtype!r}")
+        if dtype in INTEGER_DTYPES and transform != 'lifting':
+            raise ValueError(f"dtype {dtype!r} hanya didukung dengan transform='lifting'")
         self.wavelet = wavelet
         self.level = level
+        self.dtype = dtype
+        self.backend = kernels.resolve_backend(backend)
+        self.transform = get_transform(transform, wavelet, level)
     
-    def read_audio(self, file_path):
+    @property
+    def integer(self):
+        """True jika sampel dan koefisien diproses sebagai integer."""
+        return self.dtype in INTEGER_DTYPES
+    
+    def integer_step(self, alpha):
+        """
+        Langkah integer yang setara dengan alpha pada skala penuh dtype
+        (misalnya alpha=0.001 menjadi 33 untuk int16), minimal 1.
         """
-        Membaca file audio dan mengambil data serta sample rate.
+        return max(1, int(round(alpha * PCM_FULL_SCALE[self.dtype])))
+    
+    def embedding_step(self, alpha):
+        """Nilai alpha yang dipakai kernel: langkah integer pada mode integer."""
+        return self.integer_step(alpha) if self.integer else alpha
+    
+    def read_audio(self, file_path, sample_rate=None):
+        """
+        Membaca audio dan mengambil data serta sample rate.
+        
+        Blob WAV PCM 16/32-bit dan float dibaca langsung dari buffer pemanggil
+        tanpa menyalin bytes; format lain didekode dengan soundfile.
         
         Args:
-            file_path (str): Path ke file audio
+            file_path (str, file-like, bytes-like, or numpy.ndarray): Path, objek
+                file, blob WAV (bytes/bytearray/memoryview), atau array sampel
+            sample_rate (int, optional): Sample rate, wajib jika input berupa array
             
         Returns:
             tuple: (data_audio, sample_rate)
         """
-        data, sample_rate = sf.read(file_path)
+        import numpy as np
+        if isinstance(file_path, np.ndarray):
+            if sample_rate is None:
+                raise ValueError("sample_rate wajib diisi untuk input berupa array")
+            if self.integer:
+                return samples_to_int(file_path, self.dtype), sample_rate
+            return np.asarray(file_path, dtype=self.dtype), sample_rate
+        
+        if isinstance(file_path, (bytes, bytearray, memoryview)):
+            view = wav_buffer_view(file_path)
+            if view is not None:
+                samples, sample_rate = view
+                if self.integer:
+                    return samples_to_int(samples, self.dtype), sample_rate
+                return samples_to_float(samples, self.dtype), sample_rate
+            file_path = io.BytesIO(file_path)
+        
+        import soundfile as sf
+        data, sample_rate = sf.read(file_path, dtype=self.dtype)
         return data, sample_rate
     
-    def save_audio(self, file_path, data, sample_rate):
+    def save_audio(self, file_path, data, sample_rate, subtype=None):
         """
         Menyimpan data audio ke file.
         
         Args:
-            file_path (str): Path untuk menyimpan file audio
+            file_path (str or file-like): Path atau objek file untuk menyimpan
+                file audio (objek file selalu ditulis dalam format WAV)
             data (numpy.ndarray): Data audio
             sample_rate (int): Sample rate audio
+            subtype (str, optional): Subtype output, misalnya 'PCM_16' atau
+                'FLOAT' (default: subtype bawaan soundfile untuk formatnya,
+                atau 'PCM_32' untuk data int32 agar tetap eksak)
         """
-        sf.write(file_path, data, sample_rate)
+        import soundfile as sf
+        if subtype is None and getattr(data, 'dtype', None) == 'int32':
+            subtype = 'PCM_32'
+        if isinstance(file_path, (str, os.PathLike)):
+            sf.write(file_path, data, sample_rate, subtype=subtype)
+        else:
+            sf.write(file_path, data, sample_rate, format='WAV', subtype=subtype)
     
     def apply_dwt(self, audio_data):
         """
@@ -56,10 +133,55 @@ class AudioDWT:
         else:
             data_for_dwt = audio_data
         
-        # Terapkan DWT
-        coeffs = pywt.wavedec(data_for_dwt, self.wavelet, level=self.level)
+        # Terapkan DWT (semua backend mempertahankan float32, sehingga koefisien ikut dtype audio)
+        import numpy as np
+        data_for_dwt = np.asarray(data_for_dwt, dtype=self.dtype)
+        coeffs = self.transform.forward(data_for_dwt)
         return coeffs
     
+    def region_length(self, count):
+        """
+        Jumlah sampel awal yang menentukan `count` koefisien detail pertama.
+        
+        Koefisien ke-k hanya bergantung pada sampel sebelum (k + panjang filter) * 2^level,
+        sehingga ekstensi batas di ujung potongan tidak menyentuh koefisien tersebut.
+        """
+        return (count + self.transform.support) << self.level
+    
+    def detail_coefficients(self, audio_data, count):
+        """
+        Menghitung hanya `count` koefisien detail pertama (coeffs[1]) dari
+        wilayah sampel yang dibutuhkannya, tanpa mentransformasi seluruh audio.
+        Hasilnya identik dengan apply_dwt(audio_data)[1][:count].
+        
+        Args:
+            audio_data (numpy.ndarray): Data audio
+            count (int): Jumlah koefisien detail yang dibutuhkan
+            
+        Returns:
+            numpy.ndarray: Koefisien detail
+        """
+        return self.apply_dwt(audio_data[:self.region_length(count)])[1][:count]
+
+    def detail_range(self, audio_data, start, stop):
+        """
+        Menghitung koefisien detail coeffs[1][start:stop] hanya dari jendela
+        sampel di sekitarnya (lihat TransformBackend.forward_range).
+
+        Args:
+            audio_data (numpy.ndarray): Data audio (channel pertama dipakai)
+            start (int): Indeks koefisien awal
+            stop (int): Indeks koefisien akhir (eksklusif)
+
+        Returns:
+            numpy.ndarray: Koefisien detail, identik dengan apply_dwt(audio_data)[1][start:stop]
+        """
+        import numpy as np
+        if len(audio_data.shape) > 1:
+            audio_data = audio_data[:, 0]
+        data = np.asarray(audio_data, dtype=self.dtype)
+        return self.transform.forward_range(data, start, stop, band=1)
+
     def apply_idwt(self, coeffs):
         """
         Menerapkan Inverse Discrete Wavelet Transform untuk merekonstruksi data audio.
@@ -71,9 +193,28 @@ class AudioDWT:
             numpy.ndarray: Data audio hasil rekonstruksi
         """
         # Rekonstruksi data
-        reconstructed_data = pywt.waverec(coeffs, self.wavelet)
+        reconstructed_data = self.transform.inverse(coeffs)
+        if self.integer:
+            return self.to_samples(reconstructed_data)
         return reconstructed_data
     
+    def to_samples(self, reconstructed_data):
+        """
+        Mengembalikan hasil rekonstruksi integer (int32/int64 dari lifting) ke
+        dtype sampel.
+        
+        Raises:
+            ValueError: Jika ada sampel di luar rentang dtype (clipping akan
+                merusak bit yang disisipkan)
+        """
+        import numpy as np
+        limits = np.iinfo(self.dtype)
+        if len(reconstructed_data) and (reconstructed_data.min() < limits.min or
+                                        reconstructed_data.max() > limits.max):
+            raise ValueError(f"Rekonstruksi melampaui rentang {self.dtype}; "
+                             "turunkan alpha atau volume audio")
+        return reconstructed_data.astype(self.dtype)
+    
     def embed_bits_in_coefficients(self, coeffs, bits, alpha=0.001):
         """
         Menyisipkan bit dalam koefisien detail DWT.
@@ -87,12 +228,18 @@ class AudioDWT:
             list: Koefisien wavelet yang telah dimodifikasi
         """
         # Modifikasi koefisien detail (level 1)
-        detail_coeffs = coeffs[1].copy()  # Buat salinan koefisien untuk mencegah modifikasi langsung
         modified_coeffs = list(coeffs.copy())  # Konversi ke list untuk memudahkan manipulasi
         
         # Pastikan ada cukup koefisien untuk menyisipkan seluruh bit
-        if len(bits) > len(detail_coeffs):
-            raise ValueError(f"Pesan terlalu panjang untuk disisipkan. Maksimal {len(detail_coeffs)} bit")
+        if len(bits) > len(coeffs[1]):
+            raise ValueError(f"Pesan terlalu panjang untuk disisipkan. Maksimal {len(coeffs[1])} bit")
+        
+        if self.backend != 'python' or self.integer:
+            modified_coeffs[1] = kernels.embed_coefficients(coeffs[1], kernels.bits_to_array(bits),
+                                                            self.embedding_step(alpha), self.backend)
+            return modified_coeffs
+        
+        detail_coeffs = coeffs[1].copy()  # Buat salinan koefisien untuk mencegah modifikasi langsung
         
         # Sisipkan bit dalam koefisien detail
         for i in range(len(bits)):
@@ -129,6 +276,11 @@ class AudioDWT:
         """
         # Koefisien detail (level 1)
         detail_coeffs = coeffs[1]
+        if self.backend != 'python' or self.integer:
+            return kernels.array_to_bits(
+                kernels.extract_coefficients(detail_coeffs, num_bits, self.embedding_step(alpha),
+                                             self.backend))
+        
         extracted_bits = ""
         
         # Pastikan kita tidak mencoba mengekstrak lebih banyak bit daripada yang tersedia
@@ -151,6 +303,81 @@ class AudioDWT:
         
         return extracted_bits
     
+    def extract_soft_from_coefficients(self, coeffs, num_bits, alpha=0.001):
+        """
+        Ekstraksi soft-decision: bit yang sama dengan extract_bits_from_coefficients
+        beserta keyakinan setiap bit (lihat kernels.bit_confidence).
+
+        Returns:
+            tuple: (string bit, array keyakinan float32)
+        """
+        step = self.embedding_step(alpha)
+        bits = kernels.extract_coefficients(coeffs[1], num_bits, step, self.backend)
+        return kernels.array_to_bits(bits), kernels.bit_confidence(coeffs[1], num_bits, step, bits)
+    
+    def band_capacities(self, length):
+        """
+        Kapasitas penyisipan multi-band per band detail untuk audio sepanjang
+        `length` sampel (lihat steg.bands).
+        
+        Returns:
+            dict: {indeks band: kapasitas dalam bit}, 1 = cD_n ... level = cD_1
+        """
+        return band_layout.band_capacities(self.transform.band_lengths(length), self.transform.support)
+    
+    def embed_bits_in_bands(self, coeffs, bits, alpha=0.001, bands=None):
+        """
+        Menyisipkan bit ke beberapa band detail sesuai urutan `bands`; pilihan
+        dan urutan band dicatat dalam tabel di awal band 1.
+        
+        Args:
+            coeffs (list): Koefisien wavelet
+            bits (str): String bit yang akan disisipkan
+            alpha (float): Faktor skala untuk penyisipan (default: 0.001)
+            bands (list, optional): Urutan band (default: semua band dari yang
+                paling halus)
+            
+        Returns:
+            list: Koefisien wavelet yang telah dimodifikasi
+        """
+        if bands is None:
+            bands = band_layout.default_bands(len(coeffs) - 1)
+        return band_layout.embed_bands(coeffs, bits, self.embedding_step(alpha), bands,
+                                       self.transform.support, self.backend)
+    
+    def extract_bits_from_bands(self, coeffs, num_bits, alpha=0.001, workers=None):
+        """
+        Mengekstrak bit multi-band; band dibaca dari tabel dan diekstrak
+        bersamaan dengan `workers` thread (default satu per band).
+        """
+        return band_layout.extract_bands(coeffs, num_bits, self.embedding_step(alpha),
+                                         self.transform.support, self.backend, workers)
+    
+    def embed_bits_spread(self, coeffs, bits, alpha=0.001, key=None):
+        """
+        Menyisipkan bit ke koefisien detail (coeffs[1]) pada posisi hasil
+        permutasi berkunci, sehingga payload tersebar di seluruh audio
+        (lihat steg.permutation).
+        
+        Args:
+            coeffs (list): Koefisien wavelet
+            bits (str): String bit yang akan disisipkan
+            alpha (float): Faktor skala untuk penyisipan (default: 0.001)
+            key (str or bytes): Kunci sebar
+            
+        Returns:
+            list: Koefisien wavelet yang telah dimodifikasi
+        """
+        modified_coeffs = list(coeffs)
+        modified_coeffs[1] = permutation.embed_spread(coeffs[1], bits, self.embedding_step(alpha), key,
+                                                      self.transform.support, self.backend)
+        return modified_coeffs
+    
+    def extract_bits_spread(self, coeffs, num_bits, alpha=0.001, key=None):
+        """Mengekstrak bit mode sebar dengan kunci yang sama seperti saat penyisipan."""
+        return permutation.extract_spread(coeffs[1], num_bits, self.embedding_step(alpha), key,
+                                          self.transform.support, self.backend)
+    
     def bits_to_bytes(self, bits):
         """
         Konversi string bit ke bytes.
@@ -161,6 +388,9 @@ class AudioDWT:
         Returns:
             bytes: Data bytes
         """
+        if self.backend != 'python':
+            return kernels.pack_bits(kernels.bits_to_array(bits), self.backend)
+        
         # Pastikan panjang bit adalah kelipatan 8
         padded_bits = bits
         if len(bits) % 8 != 0:
@@ -184,26 +414,39 @@ class AudioDWT:
         Returns:
             str: String bit
         """
+        if self.backend != 'python':
+            return kernels.array_to_bits(kernels.unpack_bits(data, self.backend))
+        
         bits = ""
         for byte in data:
             bits += bin(byte)[2:].zfill(8)  # Hilangkan '0b' di awal dan tambahkan 0 hingga 8 bit
         
         return bits
     
-    def embed_data(self, audio_path, output_path, data_bits):
+    def embed_data(self, audio_path, output_path, data_bits, sample_rate=None):
         """
-        Menyisipkan data bit ke dalam file audio menggunakan DWT.
+        Menyisipkan data bit ke dalam audio menggunakan DWT.
         
         Args:
-            audio_path (str): Path ke file audio asli
-            output_path (str): Path untuk menyimpan file audio yang telah disisipi
+            audio_path (str, file-like, bytes-like, or numpy.ndarray): Audio asli
+                (lihat read_audio)
+            output_path (str or file-like): Tujuan audio yang telah disisipi, atau
+                None untuk mengembalikan hasil dengan tipe yang sama seperti input
             data_bits (str): String bit yang akan disisipkan
+            sample_rate (int, optional): Sample rate, wajib jika input berupa array
             
         Returns:
-            bool: True jika berhasil
+            bool: True jika berhasil ditulis ke output_path; jika output_path None,
+                  numpy.ndarray untuk input array, bytes WAV untuk input bytes-like,
+                  atau io.BytesIO WAV untuk input file-like
         """
-        # Baca file audio
-        audio_data, sample_rate = self.read_audio(audio_path)
+        import numpy as np
+        
+        if output_path is None and isinstance(audio_path, (str, os.PathLike)):
+            raise ValueError("output_path wajib diisi untuk input berupa path")
+        
+        # Baca audio
+        audio_data, sample_rate = self.read_audio(audio_path, sample_rate)
         
         # Terapkan DWT
         coeffs = self.apply_dwt(audio_data)
@@ -218,31 +461,43 @@ class AudioDWT:
         if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:
             # Potong jika ukuran berbeda (seharusnya hampir sama)
             min_len = min(len(reconstructed_data), len(audio_data))
-            reconstructed_stereo = np.zeros((min_len, audio_data.shape[1]))
+            reconstructed_stereo = np.zeros((min_len, audio_data.shape[1]), dtype=reconstructed_data.dtype)
             reconstructed_stereo[:, 0] = reconstructed_data[:min_len]
             # Salin channel lain dari audio asli
             for ch in range(1, audio_data.shape[1]):
                 reconstructed_stereo[:, ch] = audio_data[:min_len, ch]
             reconstructed_data = reconstructed_stereo
         
-        # Simpan audio hasil
-        self.save_audio(output_path, reconstructed_data, sample_rate)
+        if output_path is not None:
+            # Simpan audio hasil
+            self.save_audio(output_path, reconstructed_data, sample_rate)
+            return True
+        
+        if isinstance(audio_path, np.ndarray):
+            return reconstructed_data
         
-        return True
+        buffer = io.BytesIO()
+        self.save_audio(buffer, reconstructed_data, sample_rate)
+        if isinstance(audio_path, (bytes, bytearray, memoryview)):
+            return buffer.getvalue()
+        buffer.seek(0)
+        return buffer
     
-    def extract_data(self, stego_audio_path, num_bits):
+    def extract_data(self, stego_audio_path, num_bits, sample_rate=None):
         """
-        Mengekstrak data bit dari file audio yang telah disisipi.
+        Mengekstrak data bit dari audio yang telah disisipi.
         
         Args:
-            stego_audio_path (str): Path ke file audio yang telah disisipi
+            stego_audio_path (str, file-like, bytes-like, or numpy.ndarray): Audio
+                yang telah disisipi (lihat read_audio)
             num_bits (int): Jumlah bit yang akan diekstrak
+            sample_rate (int, optional): Sample rate, wajib jika input berupa array
             
         Returns:
             str: String bit yang diekstrak
         """
-        # Baca file audio stego
-        stego_data, sample_rate = self.read_audio(stego_audio_path)
+        # Baca audio stego
+        stego_data, sample_rate = self.read_audio(stego_audio_path, sample_rate)
         
         # Terapkan DWT
         coeffs = self.apply_dwt(stego_data)
@@ -0,0 +1,177 @@
+"""
+Forward error correction opsional antara enkripsi dan penyisipan.
+
+Kode Hamming sistematik (2^m - 1, 2^m - 1 - m) dengan block interleaver.
+Bit yang salah ekstrak biasanya koefisien dengan sisa di dekat ambang
+0.4*alpha/1.6*alpha, sehingga kesalahan tersebar acak dan tiap codeword
+cukup mengoreksi satu bit; interleaver (codeword ditulis per baris, dikirim
+per kolom) memisahkan kesalahan yang berdekatan ke codeword berbeda.
+
+Encode dan decode sepenuhnya vektor: paritas dihitung dengan perkalian matriks
+mod 2 untuk semua blok sekaligus, dan posisi bit salah diambil dari tabel
+sindrom. Jika keyakinan per bit tersedia (ekstraksi soft-decision), decoder
+memakai algoritma Chase: bit dengan keyakinan terendah di setiap codeword
+dibalik dalam semua kombinasi, setiap kandidat didekode keras, dan dipilih
+codeword dengan total keyakinan bit yang diubah paling kecil, sehingga dua
+kesalahan di dekat ambang dalam satu codeword tetap dapat dikoreksi. Aliran yang dikodekan diawali panjang payload 32 bit sehingga padding
+blok terakhir dapat dibuang tanpa informasi tambahan.
+"""
+import functools
+
+from . import kernels
+
+# Nama kode FEC dan parameter m-nya
+FEC_CODES = {"hamming7": 3, "hamming15": 4, "hamming31": 5}
+
+# Panjang prefiks panjang payload dalam bit
+LENGTH_BITS = 32
+
+# Jumlah bit berkeyakinan terendah per codeword yang dicoba dibalik oleh decoder Chase
+CHASE_POSITIONS = 3
+
+class HammingCode:
+    """
+    Kode Hamming sistematik: codeword = [k bit data][m bit paritas].
+
+    Args:
+        m (int): Jumlah bit paritas; panjang codeword n = 2^m - 1
+    """
+    def __init__(self, m):
+        import numpy as np
+
+        self.m = m
+        self.n = (1 << m) - 1
+        self.k = self.n - m
+        # Kolom H adalah semua vektor m bit tak nol; kolom berbobot satu menjadi paritas
+        columns = [value for value in range(1, self.n + 1) if value & (value - 1)]
+        columns += [1 << bit for bit in range(m)]
+        self.H = ((np.array(columns)[None, :] >> np.arange(m)[:, None]) & 1).astype(np.uint8)
+        self.parity = np.ascontiguousarray(self.H[:, :self.k].T)
+        self.weights = 1 << np.arange(m)
+        # Tabel sindrom -> posisi bit salah (-1 untuk sindrom nol)
+        self.syndrome_table = np.full(1 << m, -1, dtype=np.intp)
+        self.syndrome_table[np.array(columns)] = np.arange(self.n)
+
+    def encode(self, data):
+        """
+        Mengodekan blok data.
+
+        Args:
+            data (numpy.ndarray): Array 0/1 berbentuk (blok, k)
+
+        Returns:
+            numpy.ndarray: Codeword berbentuk (blok, n)
+        """
+        import numpy as np
+        parity = (data.astype(np.int32) @ self.parity) & 1
+        return np.concatenate([data, parity.astype(np.uint8)], axis=1)
+
+    def _correct(self, received):
+        """Koreksi keras satu bit per codeword; mengembalikan codeword hasil koreksi."""
+        import numpy as np
+        syndrome = ((received.astype(np.int32) @ self.H.T) & 1) @ self.weights
+        positions = self.syndrome_table[syndrome]
+        rows = np.nonzero(positions >= 0)[0]
+        corrected = received.copy()
+        corrected[rows, positions[rows]] ^= 1
+        return corrected
+
+    def decode(self, received, confidence=None):
+        """
+        Mendekode codeword: koreksi keras satu bit per codeword, atau decoding
+        Chase jika keyakinan per bit diberikan.
+
+        Args:
+            received (numpy.ndarray): Array 0/1 berbentuk (blok, n)
+            confidence (numpy.ndarray, optional): Keyakinan per bit berbentuk (blok, n)
+
+        Returns:
+            tuple: (data berbentuk (blok, k), jumlah bit yang dikoreksi)
+        """
+        import numpy as np
+        if confidence is None:
+            best = self._correct(received)
+        else:
+            t = min(CHASE_POSITIONS, self.n)
+            rows = np.arange(len(received))[:, None]
+            weakest = np.argpartition(confidence, t - 1, axis=1)[:, :t]
+            best, best_metric = None, None
+            for pattern in range(1 << t):
+                flips = ((pattern >> np.arange(t)) & 1).astype(np.uint8)
+                trial = received.copy()
+                trial[rows, weakest] ^= flips
+                candidate = self._correct(trial)
+                metric = np.where(candidate != received, confidence, 0).sum(axis=1)
+                if best is None:
+                    best, best_metric = candidate, metric
+                else:
+                    better = metric < best_metric
+                    best[better] = candidate[better]
+                    best_metric = np.minimum(metric, best_metric)
+        return best[:, :self.k], int(np.count_nonzero(best != received))
+
+@functools.lru_cache(maxsize=None)
+def get_code(name):
+    """Instance kode FEC berdasarkan nama (lihat FEC_CODES)."""
+    if name not in FEC_CODES:
+        raise ValueError(f"Kode FEC tidak dikenal: {name} (pilihan: {', '.join(FEC_CODES)})")
+    return HammingCode(FEC_CODES[name])
+
+def encoded_length(bits_length, name):
+    """Panjang aliran terkode untuk payload sepanjang bits_length bit."""
+    code = get_code(name)
+    return -(-(LENGTH_BITS + bits_length) // code.k) * code.n
+
+def encode_bits(bits, name):
+    """
+    Mengodekan string bit payload dengan kode FEC dan interleaver.
+
+    Args:
+        bits (str): String bit payload
+        name (str): Nama kode (lihat FEC_CODES)
+
+    Returns:
+        str: String bit terkode (lihat encoded_length)
+    """
+    import numpy as np
+
+    code = get_code(name)
+    if len(bits) >= 1 << LENGTH_BITS:
+        raise ValueError("Payload terlalu panjang untuk FEC")
+    stream = kernels.bits_to_array(format(len(bits), f'0{LENGTH_BITS}b') + bits)
+    blocks = -(-len(stream) // code.k)
+    data = np.zeros(blocks * code.k, dtype=np.uint8)
+    data[:len(stream)] = stream
+    codewords = code.encode(data.reshape(blocks, code.k))
+    # Interleave: kirim kolom demi kolom sehingga bit berdekatan jatuh di codeword berbeda
+    return kernels.array_to_bits(codewords.T.ravel())
+
+def decode_bits(bits, name, confidence=None):
+    """
+    Men-deinterleave dan mendekode string bit terkode.
+
+    Args:
+        bits (str): String bit hasil ekstraksi (panjang kelipatan n)
+        name (str): Nama kode (lihat FEC_CODES)
+        confidence (numpy.ndarray, optional): Keyakinan per bit sesuai urutan
+            bits (lihat kernels.bit_confidence) untuk decoding soft-decision
+
+    Returns:
+        tuple: (string bit payload, jumlah bit yang dikoreksi)
+
+    Raises:
+        ValueError: Jika panjang aliran atau prefiks panjang payload tidak valid
+    """
+    code = get_code(name)
+    if not bits or len(bits) % code.n:
+        raise ValueError(f"Panjang aliran FEC {len(bits)} bit bukan kelipatan {code.n}")
+    received = kernels.bits_to_array(bits).reshape(code.n, -1).T
+    if confidence is not None:
+        confidence = confidence.reshape(code.n, -1).T
+    data, corrected = code.decode(received, confidence)
+    stream = kernels.array_to_bits(data.ravel())
+    length = int(stream[:LENGTH_BITS], 2)
+    if length > len(stream) - LENGTH_BITS:
+        raise ValueError(f"Panjang payload FEC tidak valid: {length} bit; data rusak di luar "
+                         f"kemampuan koreksi")
+    return stream[LENGTH_BITS:LENGTH_BITS + length], corrected
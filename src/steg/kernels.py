@@ -0,0 +1,160 @@
+"""
+Kernel penyisipan/ekstraksi koefisien dan pengemasan bit.
+
+Tiga backend tersedia:
+    'python' - loop Python asli (acuan)
+    'numpy'  - operasi vektor NumPy, selalu tersedia
+    'numba'  - kernel @njit yang dikompilasi sekali dan di-cache ke disk,
+               hanya jika numba terpasang
+
+Backend 'auto' memakai numba hanya untuk payload minimal NUMBA_MIN_BITS bit
+(jika numba terpasang), karena memuat kernel dari cache tetap memakan sekitar
+setengah detik per proses; payload yang lebih kecil memakai NumPy. Semua
+backend menghasilkan nilai yang identik untuk float64 maupun float32.
+"""
+
+BACKENDS = ('python', 'numpy', 'numba')
+
+# Ukuran payload minimal sebelum 'auto' memuat numba
+NUMBA_MIN_BITS = 1 << 20
+
+# None = belum dicek, False = numba tidak tersedia, selain itu modul kernel numba
+_numba_kernels = None
+
+def _load_numba():
+    """Mengimpor kernel numba sekali saja; mengembalikan None jika numba tidak tersedia."""
+    global _numba_kernels
+    if _numba_kernels is None:
+        try:
+            from . import _numba_kernels as kernels
+        except ImportError:
+            kernels = False
+        _numba_kernels = kernels
+    return _numba_kernels or None
+
+def available_backends():
+    """Daftar backend yang dapat dipakai di lingkungan ini."""
+    return [name for name in BACKENDS if name != 'numba' or _load_numba() is not None]
+
+def resolve_backend(backend='auto'):
+    """
+    Memvalidasi nama backend. 'auto' dikembalikan apa adanya dan dipilih per
+    pemanggilan sesuai ukuran payload.
+
+    Raises:
+        ValueError: Jika backend tidak dikenal atau numba diminta tetapi tidak terpasang
+    """
+    if backend != 'auto' and backend not in BACKENDS:
+        raise ValueError(f"Backend kernel tidak dikenal: {backend!r} "
+                         f"(pilihan: auto, {', '.join(BACKENDS)})")
+    if backend == 'numba' and _load_numba() is None:
+        raise ValueError("Backend 'numba' memerlukan paket numba")
+    return backend
+
+def _select(backend, size):
+    if backend == 'auto':
+        return 'numba' if size >= NUMBA_MIN_BITS and _load_numba() is not None else 'numpy'
+    return backend
+
+def bits_to_array(bits):
+    """Mengubah string bit '0'/'1' menjadi array uint8 bernilai 0/1."""
+    import numpy as np
+    return np.frombuffer(bits.encode('ascii'), dtype=np.uint8) - ord('0')
+
+def array_to_bits(values):
+    """Mengubah array 0/1 (bool atau integer) menjadi string bit."""
+    import numpy as np
+    return (np.asarray(values, dtype=np.uint8) + ord('0')).tobytes().decode('ascii')
+
+def embed_coefficients(detail_coeffs, bits, alpha, backend='numpy'):
+    """
+    Menyisipkan bit ke awal koefisien detail dengan skema sisa modulo 2*alpha.
+
+    Koefisien integer (mode lifting integer) memakai alpha berupa langkah
+    integer dan selalu diproses dengan NumPy sehingga hasilnya eksak.
+
+    Args:
+        detail_coeffs (numpy.ndarray): Koefisien detail (tidak diubah)
+        bits (numpy.ndarray): Array 0/1 hasil bits_to_array
+        alpha (float or int): Faktor skala penyisipan, atau langkah integer
+            untuk koefisien integer
+        backend (str): 'auto', 'numpy', atau 'numba'
+
+    Returns:
+        numpy.ndarray: Salinan koefisien yang telah dimodifikasi
+    """
+    integer = detail_coeffs.dtype.kind in 'iu'
+    if not integer and _select(backend, len(bits)) == 'numba':
+        return _load_numba().embed_coefficients(detail_coeffs, bits, detail_coeffs.dtype.type(alpha))
+
+    import numpy as np
+    modified = detail_coeffs.copy()
+    head = modified[:len(bits)]
+    coeff_abs = np.abs(head)
+    remainder = coeff_abs % (2 * alpha)
+    target = np.where(bits != 0, alpha, 0 if integer else 0.0).astype(coeff_abs.dtype, copy=False)
+    adjusted = coeff_abs + (target - remainder)
+    head[...] = np.where(head >= 0, adjusted, -adjusted)
+    return modified
+
+def extract_coefficients(detail_coeffs, num_bits, alpha, backend='numpy'):
+    """
+    Mengekstrak bit dari awal koefisien detail. Untuk koefisien integer, ambang
+    0.4*alpha dan 1.6*alpha dibandingkan secara eksak dalam aritmetika integer.
+
+    Returns:
+        numpy.ndarray: Array uint8 0/1 sepanjang min(num_bits, len(detail_coeffs))
+    """
+    import numpy as np
+    if detail_coeffs.dtype.kind in 'iu':
+        scaled = 5 * (np.abs(detail_coeffs[:num_bits]) % (2 * alpha))
+        return ((scaled >= 2 * alpha) & (scaled <= 8 * alpha)).view(np.uint8)
+
+    if _select(backend, min(num_bits, len(detail_coeffs))) == 'numba':
+        return _load_numba().extract_coefficients(detail_coeffs, num_bits,
+                                                  detail_coeffs.dtype.type(2 * alpha),
+                                                  0.4 * alpha, 1.6 * alpha)
+
+    remainder = np.abs(detail_coeffs[:num_bits]) % (2 * alpha)
+    return ((remainder >= 0.4 * alpha) & (remainder <= 1.6 * alpha)).view(np.uint8)
+
+def bit_confidence(detail_coeffs, num_bits, alpha, bits=None):
+    """
+    Keyakinan keputusan setiap bit dari jarak sisa modulo 2*alpha ke ambang
+    ekstraksi terdekat (0.4*alpha atau 1.6*alpha), dinormalisasi terhadap
+    jarak pada posisi ideal hasil penyisipan (sisa alpha untuk bit 1, sisa 0
+    untuk bit 0): 1 berarti tepat di posisi ideal, 0 tepat di ambang.
+
+    Args:
+        detail_coeffs (numpy.ndarray): Koefisien detail
+        num_bits (int): Jumlah bit
+        alpha (float or int): Faktor skala, atau langkah integer untuk koefisien integer
+        bits (numpy.ndarray, optional): Hasil extract_coefficients jika sudah dihitung
+
+    Returns:
+        numpy.ndarray: Keyakinan float32 dalam [0, 1]
+    """
+    import numpy as np
+    if bits is None:
+        bits = extract_coefficients(detail_coeffs, num_bits, alpha)
+    remainder = np.abs(detail_coeffs[:len(bits)].astype(np.float64)) % (2 * alpha)
+    one = np.minimum(remainder - 0.4 * alpha, 1.6 * alpha - remainder) / (0.6 * alpha)
+    zero = np.where(remainder < 0.4 * alpha, 0.4 * alpha - remainder, remainder - 1.6 * alpha) / (0.4 * alpha)
+    return np.clip(np.where(bits != 0, one, zero), 0.0, 1.0).astype(np.float32)
+
+def pack_bits(bits, backend='numpy'):
+    """Mengemas array 0/1 menjadi bytes, byte terakhir dipadatkan dengan nol."""
+    # np.packbits sudah berupa kode native, sehingga 'auto' tidak memuat numba di sini
+    if backend == 'numba':
+        return _load_numba().pack_bits(bits).tobytes()
+
+    import numpy as np
+    return np.packbits(bits).tobytes()
+
+def unpack_bits(data, backend='numpy'):
+    """Membongkar bytes menjadi array uint8 0/1 (MSB lebih dulu)."""
+    import numpy as np
+    raw = np.frombuffer(bytes(data), dtype=np.uint8)
+    if backend == 'numba':
+        return _load_numba().unpack_bits(raw)
+    return np.unpackbits(raw)
@@ -0,0 +1,132 @@
+"""
+Mode sebar: payload ditempatkan pada koefisien detail dengan urutan acak berkunci.
+
+Permutasi indeks dibuat dengan jaringan Feistel berkunci di atas domain 2^(2h)
+dan cycle-walking ke rentang [0, ukuran), sehingga indeks ke-i dapat dihitung
+langsung dari i. Indeks dihasilkan per blok dan dipakai untuk gather/scatter
+NumPy; array indeks penuh tidak pernah dibuat, sehingga carrier dengan jutaan
+koefisien tidak memerlukan memori tambahan sebesar permutasinya.
+
+Koefisien sepanjang support filter di kedua tepi band dilewati, sama seperti
+mode multi-band (lihat steg.bands).
+"""
+import hashlib
+
+from . import kernels
+
+# Jumlah indeks yang dihasilkan per blok
+BLOCK_SIZE = 1 << 16
+
+# Jumlah putaran Feistel
+FEISTEL_ROUNDS = 4
+
+class KeyedPermutation:
+    """
+    Permutasi pseudo-acak berkunci atas [0, size).
+
+    Args:
+        key (str or bytes): Kunci sebar (string dikodekan UTF-8)
+        size (int): Ukuran domain
+    """
+    def __init__(self, key, size):
+        import numpy as np
+
+        if size <= 0:
+            raise ValueError("Ukuran permutasi harus positif")
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        self.size = size
+        self.half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = np.uint64((1 << self.half_bits) - 1)
+        digest = hashlib.sha256(key + size.to_bytes(8, 'little')).digest()
+        self.round_keys = np.frombuffer(digest, dtype='<u8')[:FEISTEL_ROUNDS].astype(np.uint64)
+
+    @staticmethod
+    def _mix(values):
+        """Finalizer splitmix64 (perkalian uint64 membungkus modulo 2^64)."""
+        import numpy as np
+
+        values = values ^ (values >> np.uint64(30))
+        values *= np.uint64(0xBF58476D1CE4E5B9)
+        values ^= values >> np.uint64(27)
+        values *= np.uint64(0x94D049BB133111EB)
+        values ^= values >> np.uint64(31)
+        return values
+
+    def _encrypt(self, values):
+        import numpy as np
+
+        shift = np.uint64(self.half_bits)
+        left, right = values >> shift, values & self.mask
+        for round_key in self.round_keys:
+            left, right = right, left ^ (self._mix(right ^ round_key) & self.mask)
+        return (left << shift) | right
+
+    def indices(self, start, stop):
+        """Indeks hasil permutasi untuk posisi [start, stop) sebagai array int64."""
+        import numpy as np
+
+        values = self._encrypt(np.arange(start, stop, dtype=np.uint64))
+        outside = np.flatnonzero(values >= self.size)
+        while len(outside):
+            values[outside] = self._encrypt(values[outside])
+            outside = outside[values[outside] >= self.size]
+        return values.astype(np.int64)
+
+    def blocks(self, count, block_size=BLOCK_SIZE):
+        """Menghasilkan (offset, indeks) per blok untuk `count` posisi pertama."""
+        for start in range(0, count, block_size):
+            stop = min(count, start + block_size)
+            yield start, self.indices(start, stop)
+
+def spread_capacity(length, support):
+    """Kapasitas mode sebar untuk band sepanjang `length` koefisien."""
+    return max(0, length - 2 * support)
+
+def _permutation(detail_length, num_bits, key, support):
+    capacity = spread_capacity(detail_length, support)
+    if num_bits > capacity:
+        raise ValueError(f"Pesan terlalu panjang! Kapasitas maksimal: {capacity} bit, "
+                         f"Pesan terenkripsi: {num_bits} bit")
+    return KeyedPermutation(key, capacity)
+
+def embed_spread(detail_coeffs, bits, step, key, support, backend='numpy'):
+    """
+    Menyisipkan bit ke koefisien detail pada posisi hasil permutasi berkunci.
+
+    Args:
+        detail_coeffs (numpy.ndarray): Koefisien detail (tidak diubah)
+        bits (str): String bit yang akan disisipkan
+        step (float or int): Alpha, atau langkah integer pada mode integer
+        key (str or bytes): Kunci sebar
+        support (int): Panjang filter backend transformasi
+        backend (str): Backend kernel (lihat steg.kernels)
+
+    Returns:
+        numpy.ndarray: Salinan koefisien yang telah dimodifikasi
+    """
+    permutation = _permutation(len(detail_coeffs), len(bits), key, support)
+    payload = kernels.bits_to_array(bits)
+    modified = detail_coeffs.copy()
+    for offset, indices in permutation.blocks(len(payload)):
+        indices += support
+        modified[indices] = kernels.embed_coefficients(
+            modified[indices], payload[offset:offset + len(indices)], step, backend)
+    return modified
+
+def extract_spread(detail_coeffs, num_bits, step, key, support, backend='numpy'):
+    """
+    Mengekstrak bit dari posisi hasil permutasi berkunci.
+
+    Returns:
+        str: String bit yang diekstrak
+    """
+    import numpy as np
+
+    permutation = _permutation(len(detail_coeffs), num_bits, key, support)
+    extracted = np.empty(num_bits, dtype=np.uint8)
+    for offset, indices in permutation.blocks(num_bits):
+        indices += support
+        extracted[offset:offset + len(indices)] = kernels.extract_coefficients(
+            detail_coeffs[indices], len(indices), step, backend)
+    return kernels.array_to_bits(extracted)
@@ -0,0 +1,399 @@
+"""
+Backend transformasi wavelet untuk AudioDWT.
+
+Semua backend memakai tata letak koefisien yang sama dengan pywt.wavedec,
+yaitu [cA_n, cD_n, ..., cD_1], dan menyediakan transformasi rentang
+koefisien (forward_range/inverse_range) yang hanya memproses jendela sampel
+di sekitar rentang tersebut, sehingga pemrosesan parsial dan streaming
+tidak perlu mentransformasi seluruh audio.
+
+Backend yang tersedia:
+    'pywt'    - pywt.wavedec/waverec dengan objek Wavelet yang di-resolve sekali
+    'conv'    - konvolusi NumPy polyphase untuk filter Haar/Daubechies pendek
+                (db1-db4) dengan filter bank yang dihitung sekali dan di-cache;
+                hasilnya sama dengan pywt mode 'symmetric'
+    'lifting' - transformasi lifting LeGall 5/3; input integer menghasilkan
+                koefisien integer yang dapat dibalik persis (integer-to-integer)
+"""
+import functools
+
+TRANSFORMS = ('pywt', 'conv', 'lifting')
+
+# Koefisien filter dekomposisi low-pass Daubechies (sama dengan pywt.Wavelet(...).dec_lo)
+_DAUBECHIES_DEC_LO = {
+    'db1': (0.7071067811865476, 0.7071067811865476),
+    'db2': (-0.12940952255126037, 0.2241438680420134, 0.8365163037378079, 0.48296291314453416),
+    'db3': (0.03522629188570953, -0.08544127388202666, -0.13501102001025458,
+            0.45987750211849154, 0.8068915093110925, 0.33267055295008263),
+    'db4': (-0.010597401785069032, 0.0328830116668852, 0.030841381835560764,
+            -0.18703481171909309, -0.027983769416859854, 0.6308807679298589,
+            0.7148465705529157, 0.2303778133088965),
+}
+_DAUBECHIES_DEC_LO['haar'] = _DAUBECHIES_DEC_LO['db1']
+
+@functools.lru_cache(maxsize=None)
+def filter_bank(wavelet, dtype='float64'):
+    """
+    Filter bank (dec_lo, dec_hi, rec_lo, rec_hi) untuk wavelet Daubechies pendek.
+
+    Filter high-pass dan rekonstruksi diturunkan dari dec_lo dengan relasi
+    quadrature mirror, sama seperti pywt. Hasil di-cache per (wavelet, dtype).
+
+    Raises:
+        ValueError: Jika wavelet tidak tersedia untuk backend konvolusi
+    """
+    import numpy as np
+
+    if wavelet not in _DAUBECHIES_DEC_LO:
+        raise ValueError(f"Backend 'conv' hanya mendukung wavelet "
+                         f"{', '.join(sorted(_DAUBECHIES_DEC_LO))}, bukan {wavelet!r}")
+    dec_lo = np.array(_DAUBECHIES_DEC_LO[wavelet], dtype=np.float64)
+    length = len(dec_lo)
+    dec_hi = np.array([(-1) ** (i + 1) * dec_lo[length - 1 - i] for i in range(length)])
+    bank = tuple(f.astype(dtype) for f in (dec_lo, dec_hi, dec_lo[::-1], dec_hi[::-1]))
+    for f in bank:
+        f.setflags(write=False)
+    return bank
+
+class TransformBackend:
+    """
+    Antarmuka backend transformasi multi-level.
+
+    Subclass mengimplementasikan forward_step/inverse_step (satu level),
+    step_lengths, dan atribut support (panjang filter terpanjang).
+    """
+    name = None
+    support = 2
+
+    def __init__(self, wavelet='db1', level=1):
+        self.wavelet = wavelet
+        self.level = level
+
+    def forward_step(self, data):
+        """Satu level dekomposisi: mengembalikan (cA, cD)."""
+        raise NotImplementedError
+
+    def inverse_step(self, approx, detail):
+        """Satu level rekonstruksi dari (cA, cD)."""
+        raise NotImplementedError
+
+    def step_lengths(self, length):
+        """Panjang (cA, cD) hasil forward_step untuk sinyal sepanjang length."""
+        raise NotImplementedError
+
+    def forward(self, data):
+        """Dekomposisi multi-level, setara pywt.wavedec: [cA_n, cD_n, ..., cD_1]."""
+        details = []
+        approx = data
+        for _ in range(self.level):
+            approx, detail = self.forward_step(approx)
+            details.append(detail)
+        return [approx] + details[::-1]
+
+    def inverse(self, coeffs):
+        """Rekonstruksi multi-level, setara pywt.waverec."""
+        approx = coeffs[0]
+        for detail in coeffs[1:]:
+            approx = self.inverse_step(approx, detail)
+        return approx
+
+    def band_lengths(self, length):
+        """Panjang setiap band koefisien untuk sinyal sepanjang length."""
+        lengths = []
+        for _ in range(self.level):
+            length, detail_length = self.step_lengths(length)
+            lengths.append(detail_length)
+        return [length] + lengths[::-1]
+
+    def synthesis_gain(self, band):
+        """
+        Energi sampel hasil rekonstruksi satu koefisien satuan di band tertentu.
+
+        Bernilai 1 untuk transformasi ortonormal (db2 pada pywt/conv), sehingga
+        energi noise rekonstruksi sama dengan energi perubahan koefisien
+        (Parseval). Pada transformasi biortogonal (lifting) nilai ini menjadi
+        faktor skala energi untuk perubahan koefisien yang tidak saling berkorelasi.
+        """
+        import numpy as np
+
+        gains = self.__dict__.setdefault('_synthesis_gains', {})
+        if band not in gains:
+            length = (4 * self.support + 4) << self.level
+            coeffs = [np.zeros(n) for n in self.band_lengths(length)]
+            coeffs[band][len(coeffs[band]) // 2] = 1.0
+            gains[band] = float(np.sum(np.square(self.inverse(coeffs))))
+        return gains[band]
+
+    def band_level(self, band):
+        """Level dekomposisi dari indeks band (0 = cA_n, 1 = cD_n, ..., n = cD_1)."""
+        return self.level if band == 0 else self.level - band + 1
+
+    def _window(self, start, stop, length, band_level):
+        """Jendela sampel [awal, akhir) yang sejajar 2^level dan memuat margin filter."""
+        block = 1 << self.level
+        margin = self.support << self.level
+        window_start = max(0, (start << band_level) - margin) // block * block
+        window_stop = min(length, (stop << band_level) + margin)
+        return window_start, window_stop
+
+    def forward_range(self, data, start, stop, band=1):
+        """
+        Menghitung coeffs[band][start:stop] hanya dari jendela sampel yang dibutuhkan.
+        Hasilnya identik dengan forward(data)[band][start:stop].
+        """
+        band_level = self.band_level(band)
+        window_start, window_stop = self._window(start, stop, len(data), band_level)
+        coeffs = self.forward(data[window_start:window_stop])
+        offset = window_start >> band_level
+        return coeffs[band][start - offset:stop - offset]
+
+    def inverse_range(self, coeffs, start, stop, length):
+        """
+        Merekonstruksi sampel [start, stop) hanya dari koefisien di sekitarnya.
+
+        Args:
+            coeffs (list): Koefisien lengkap (lihat forward)
+            start (int): Indeks sampel awal
+            stop (int): Indeks sampel akhir (eksklusif)
+            length (int): Panjang sinyal asli
+
+        Returns:
+            numpy.ndarray: Sampel hasil rekonstruksi sepanjang stop - start
+        """
+        window_start, window_stop = self._window(start, stop, length, 0)
+        lengths = self.band_lengths(window_stop - window_start)
+        window = []
+        for band, band_coeffs in enumerate(coeffs):
+            offset = window_start >> self.band_level(band)
+            window.append(band_coeffs[offset:offset + lengths[band]])
+        reconstructed = self.inverse(window)
+        return reconstructed[start - window_start:stop - window_start]
+
+    def shard_window(self, start, stop, length):
+        """
+        Jendela untuk merekonstruksi sampel [start, stop) dari sebagian sinyal.
+
+        Returns:
+            tuple: (inv_start, inv_stop, lengths, fwd_start, fwd_stop) - jendela
+                sampel yang direkonstruksi (seperti inverse_range), panjang setiap
+                band koefisiennya, dan jendela sampel yang forward-nya menghasilkan
+                seluruh koefisien tersebut persis sama dengan forward(data)
+        """
+        inv_start, inv_stop = self._window(start, stop, length, 0)
+        lengths = self.band_lengths(inv_stop - inv_start)
+        fwd_start, fwd_stop = inv_start, inv_stop
+        for band, band_length in enumerate(lengths):
+            band_level = self.band_level(band)
+            first = inv_start >> band_level
+            window_start, window_stop = self._window(first, first + band_length, length, band_level)
+            fwd_start, fwd_stop = min(fwd_start, window_start), max(fwd_stop, window_stop)
+        return inv_start, inv_stop, lengths, fwd_start, fwd_stop
+
+class PywtTransform(TransformBackend):
+    """Backend pywt; objek Wavelet di-resolve sekali per instance."""
+    name = 'pywt'
+
+    def __init__(self, wavelet='db1', level=1):
+        super().__init__(wavelet, level)
+        self._wavelet = None
+
+    @property
+    def pywt_wavelet(self):
+        if self._wavelet is None:
+            import pywt
+            self._wavelet = self.wavelet if isinstance(self.wavelet, pywt.Wavelet) else pywt.Wavelet(self.wavelet)
+        return self._wavelet
+
+    @property
+    def support(self):
+        return self.pywt_wavelet.dec_len
+
+    def forward_step(self, data):
+        import pywt
+        return pywt.dwt(data, self.pywt_wavelet)
+
+    def inverse_step(self, approx, detail):
+        import pywt
+        if len(approx) == len(detail) + 1:
+            approx = approx[:-1]
+        return pywt.idwt(approx, detail, self.pywt_wavelet)
+
+    def step_lengths(self, length):
+        import pywt
+        coeff_length = pywt.dwt_coeff_len(length, self.pywt_wavelet.dec_len, 'symmetric')
+        return coeff_length, coeff_length
+
+    def forward(self, data):
+        import pywt
+        return pywt.wavedec(data, self.pywt_wavelet, level=self.level)
+
+    def inverse(self, coeffs):
+        import pywt
+        return pywt.waverec(coeffs, self.pywt_wavelet)
+
+class ConvolutionTransform(TransformBackend):
+    """
+    Backend konvolusi NumPy polyphase dengan ekstensi simetris (pywt mode 'symmetric').
+
+    Hanya sampel keluaran yang dipakai setelah downsampling yang dihitung,
+    sehingga setiap level membutuhkan len(filter) operasi vektor per band.
+    """
+    name = 'conv'
+
+    def __init__(self, wavelet='db1', level=1):
+        super().__init__(getattr(wavelet, 'name', wavelet), level)
+        self.support = len(_DAUBECHIES_DEC_LO.get(self.wavelet, ())) or None
+        filter_bank(self.wavelet)  # validasi nama wavelet sejak awal
+
+    def step_lengths(self, length):
+        coeff_length = (length + self.support - 1) // 2
+        return coeff_length, coeff_length
+
+    def forward_step(self, data):
+        import numpy as np
+
+        dtype = data.dtype if data.dtype.kind == 'f' else np.float64
+        dec_lo, dec_hi, _, _ = filter_bank(self.wavelet, np.dtype(dtype).name)
+        taps = self.support
+        extended = np.pad(np.asarray(data, dtype=dtype), taps - 1, mode='symmetric')
+        count = self.step_lengths(len(data))[0]
+        # Pisahkan fase genap/ganjil sekali agar setiap tap membaca memori kontigu
+        phases = (extended[0::2].copy(), extended[1::2].copy())
+
+        approx = np.zeros(count, dtype=dtype)
+        detail = np.zeros(count, dtype=dtype)
+        scratch = np.empty(count, dtype=dtype)
+        for i in range(taps):
+            offset = taps - i
+            phase = phases[offset & 1][offset >> 1:(offset >> 1) + count]
+            approx += np.multiply(phase, dec_lo[i], out=scratch)
+            detail += np.multiply(phase, dec_hi[i], out=scratch)
+        return approx, detail
+
+    def inverse_step(self, approx, detail):
+        import numpy as np
+
+        if len(approx) == len(detail) + 1:
+            approx = approx[:-1]
+        if len(approx) != len(detail):
+            raise ValueError(f"Panjang cA ({len(approx)}) dan cD ({len(detail)}) tidak cocok")
+        dtype = np.result_type(approx.dtype, detail.dtype)
+        _, _, rec_lo, rec_hi = filter_bank(self.wavelet, np.dtype(dtype).name)
+        taps = self.support
+        count = len(approx)
+
+        upsampled = np.zeros(2 * count + taps - 2, dtype=dtype)
+        scratch = np.empty(count, dtype=dtype)
+        for i in range(taps):
+            target = upsampled[i:i + 2 * count:2]
+            target += np.multiply(approx, rec_lo[i], out=scratch)
+            target += np.multiply(detail, rec_hi[i], out=scratch)
+        return upsampled[taps - 2:2 * count]
+
+class LiftingTransform(TransformBackend):
+    """
+    Transformasi lifting LeGall 5/3 (JPEG 2000 reversible) dengan ekstensi simetris.
+
+    Input integer diproses dengan pembulatan floor sehingga koefisiennya integer
+    dan rekonstruksinya persis sama dengan input (int16 diproses dalam int32,
+    int32 dalam int64). Input float memakai langkah lifting yang sama tanpa
+    pembulatan. Parameter wavelet diabaikan.
+    """
+    name = 'lifting'
+    support = 5
+
+    def __init__(self, wavelet='5/3', level=1):
+        super().__init__('5/3', level)
+
+    def step_lengths(self, length):
+        return (length + 1) // 2, length // 2
+
+    @staticmethod
+    def _work_dtype(dtype):
+        import numpy as np
+        dtype = np.dtype(dtype)
+        if dtype.kind in 'iu':
+            return np.int32 if dtype.itemsize <= 2 else np.int64
+        return dtype
+
+    @staticmethod
+    def _lift(target, source, offset, shift, add):
+        """
+        Satu langkah lifting in-place: target[i] +/-= (source[i - offset] +
+        source[i + 1 - offset]) / 2^shift, dengan indeks di luar source diganti
+        elemen tepinya (ekstensi simetris). Untuk integer pembagian berupa
+        floor, dengan pembulatan +2 pada langkah update (shift 2).
+        """
+        count, size = len(target), len(source)
+        if size == 0 or count == 0:
+            return
+        integer = target.dtype.kind in 'iu'
+
+        def apply(out, left, right):
+            total = left + right
+            if integer:
+                if shift == 2:
+                    total += 2
+                total >>= shift
+            else:
+                total *= 0.5 ** shift
+            if add:
+                out += total
+            else:
+                out -= total
+
+        # Bagian dalam: kedua indeks berada di dalam source
+        start, stop = offset, min(count, size - 1 + offset)
+        if start < stop:
+            apply(target[start:stop], source[start - offset:stop - offset],
+                  source[start + 1 - offset:stop + 1 - offset])
+        # Elemen tepi memakai indeks yang dipotong ke [0, size - 1]
+        for i in sorted(set(range(min(start, count))) | set(range(max(stop, start), count))):
+            left = min(max(i - offset, 0), size - 1)
+            right = min(max(i + 1 - offset, 0), size - 1)
+            apply(target[i:i + 1], source[left:left + 1], source[right:right + 1])
+
+    def forward_step(self, data):
+        import numpy as np
+
+        data = np.asarray(data)
+        work = self._work_dtype(data.dtype)
+        approx = data[0::2].astype(work)
+        detail = data[1::2].astype(work)
+        self._lift(detail, approx, 0, 1, add=False)
+        self._lift(approx, detail, 1, 2, add=True)
+        return approx, detail
+
+    def inverse_step(self, approx, detail):
+        import numpy as np
+
+        result = np.empty(len(approx) + len(detail), dtype=np.result_type(approx, detail))
+        even, odd = result[0::2], result[1::2]
+        even[...] = approx
+        odd[...] = detail
+        self._lift(even, odd, 1, 2, add=False)
+        self._lift(odd, even, 0, 1, add=True)
+        return result
+
+_BACKENDS = {
+    'pywt': PywtTransform,
+    'conv': ConvolutionTransform,
+    'lifting': LiftingTransform,
+}
+
+def get_transform(name='pywt', wavelet='db1', level=1):
+    """
+    Membuat backend transformasi berdasarkan nama.
+
+    Args:
+        name (str): 'pywt', 'conv', atau 'lifting'
+        wavelet (str or pywt.Wavelet): Wavelet (diabaikan oleh 'lifting')
+        level (int): Level dekomposisi
+
+    Raises:
+        ValueError: Jika nama backend atau wavelet tidak didukung
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"Backend transformasi tidak dikenal: {name!r} "
+                         f"(pilihan: {', '.join(TRANSFORMS)})")
+    return _BACKENDS[name](wavelet, level)
@@ -0,0 +1,254 @@
+"""
+Parser WAV ringan untuk membaca blob WAV di memori tanpa menyalin data sampel.
+"""
+import json
+import struct
+
+# Format tag WAV yang didukung tanpa dekoder
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (format_tag, bits_per_sample) -> dtype NumPy little-endian
+_SAMPLE_DTYPES = {
+    (WAVE_FORMAT_PCM, 16): '<i2',
+    (WAVE_FORMAT_PCM, 32): '<i4',
+    (WAVE_FORMAT_IEEE_FLOAT, 32): '<f4',
+    (WAVE_FORMAT_IEEE_FLOAT, 64): '<f8',
+}
+
+# Faktor normalisasi PCM ke [-1, 1), sama seperti libsndfile
+_PCM_SCALE = {'<i2': 1.0 / 0x8000, '<i4': 1.0 / 0x80000000}
+
+# Skala penuh sampel integer (nilai float 1.0) untuk mode integer
+PCM_FULL_SCALE = {'int16': 0x8000, 'int32': 0x80000000}
+
+# Subtype output yang menyimpan sampel integer tanpa kehilangan bit
+INTEGER_SUBTYPES = {
+    'int16': ('PCM_16', 'PCM_24', 'PCM_32', 'FLOAT', 'DOUBLE'),
+    'int32': ('PCM_32', 'DOUBLE'),
+}
+
+# Subtype output yang kuantisasinya dapat dimodelkan -> lebar langkah dalam
+# satuan integer 32-bit (libsndfile selalu membulatkan ke 32-bit lalu menggeser)
+PCM_SUBTYPE_STEPS = {'PCM_16': 1 << 16, 'PCM_24': 1 << 8, 'PCM_32': 1}
+OUTPUT_SUBTYPES = tuple(PCM_SUBTYPE_STEPS) + ('FLOAT', 'DOUBLE')
+
+# Chunk RIFF kustom untuk metadata publik ekstraksi
+METADATA_CHUNK_ID = b'stgm'
+METADATA_VERSION = 1
+
+def parse_wav_header(buffer):
+    """
+    Membaca header RIFF/WAVE dari buffer.
+
+    Args:
+        buffer (bytes-like): Blob WAV lengkap
+
+    Returns:
+        dict: format_tag, channels, sample_rate, bits_per_sample, block_align,
+              data_offset, dan data_size
+
+    Raises:
+        ValueError: Jika buffer bukan WAV yang valid
+    """
+    view = memoryview(buffer).cast('B')
+    if len(view) < 12 or view[0:4] != b'RIFF' or view[8:12] != b'WAVE':
+        raise ValueError("Buffer bukan file WAV (RIFF/WAVE)")
+
+    header = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        chunk_size, = struct.unpack_from('<I', view, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b'fmt ':
+            format_tag, channels, sample_rate, _, block_align, bits_per_sample = \
+                struct.unpack_from('<HHIIHH', view, body)
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26:
+                # Dua byte pertama GUID subformat berisi format tag sebenarnya
+                format_tag, = struct.unpack_from('<H', view, body + 24)
+            header = {
+                "format_tag": format_tag,
+                "channels": channels,
+                "sample_rate": sample_rate,
+                "bits_per_sample": bits_per_sample,
+                "block_align": block_align,
+            }
+        elif chunk_id == b'data':
+            if header is None:
+                raise ValueError("Chunk data ditemukan sebelum chunk fmt")
+            # WAV hasil streaming bisa memiliki ukuran 0 atau 0xFFFFFFFF
+            available = len(view) - body
+            if chunk_size == 0 or chunk_size > available:
+                chunk_size = available
+            header["data_offset"] = body
+            header["data_size"] = chunk_size
+            return header
+
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise ValueError("Chunk fmt atau data tidak ditemukan dalam WAV")
+
+def wav_buffer_view(buffer):
+    """
+    Membuat view NumPy atas sampel WAV di dalam buffer tanpa menyalin data.
+
+    Args:
+        buffer (bytes-like): Blob WAV lengkap
+
+    Returns:
+        tuple: (samples, sample_rate), dengan samples berbentuk (frames,) untuk
+               mono atau (frames, channels), atau None jika format sampel tidak
+               didukung (misalnya PCM 24-bit)
+    """
+    import numpy as np
+
+    header = parse_wav_header(buffer)
+    dtype = _SAMPLE_DTYPES.get((header["format_tag"], header["bits_per_sample"]))
+    if dtype is None:
+        return None
+
+    channels = header["channels"]
+    frames = header["data_size"] // header["block_align"]
+    samples = np.frombuffer(buffer, dtype=dtype, count=frames * channels,
+                            offset=header["data_offset"])
+    if channels > 1:
+        samples = samples.reshape(frames, channels)
+    return samples, header["sample_rate"]
+
+def samples_to_float(samples, dtype='float64'):
+    """
+    Mengonversi view sampel WAV ke float ternormalisasi seperti sf.read.
+    Sampel float dengan dtype yang sama dikembalikan tanpa salinan.
+    """
+    scale = _PCM_SCALE.get(samples.dtype.str)
+    if scale is None:
+        return samples.astype(dtype, copy=False)
+    result = samples.astype(dtype)
+    result *= scale
+    return result
+
+def samples_to_int(samples, dtype='int16'):
+    """
+    Mengonversi sampel ke integer PCM seperti sf.read(dtype='int16'/'int32').
+    Sampel dengan dtype yang sama dikembalikan tanpa salinan; int16 ke int32
+    digeser 16 bit, int32 ke int16 dipotong 16 bit bawahnya, dan float
+    dibulatkan dengan clipping ke rentang integer.
+    """
+    import numpy as np
+
+    target = np.dtype(dtype)
+    samples = np.asarray(samples)
+    if samples.dtype == target:
+        return samples
+    if samples.dtype.kind in 'iu':
+        shift = 8 * (target.itemsize - samples.dtype.itemsize)
+        if shift >= 0:
+            return samples.astype(target) << shift
+        return (samples >> -shift).astype(target)
+    info = np.iinfo(target)
+    scaled = np.rint(samples * float(PCM_FULL_SCALE[target.name]))
+    return np.clip(scaled, info.min, info.max).astype(target)
+
+def quantize_samples(data, subtype):
+    """
+    Mensimulasikan kuantisasi sf.write ke subtype WAV tanpa menulis file.
+
+    libsndfile mengalikan sampel dengan 2^31, membulatkan ke integer 32-bit
+    (dengan clipping), lalu menggeser ke kanan sesuai lebar subtype. Model ini
+    identik bit-per-bit dengan hasil sf.read dari file yang ditulis.
+
+    Args:
+        data (numpy.ndarray): Sampel float
+        subtype (str): Salah satu OUTPUT_SUBTYPES
+
+    Returns:
+        numpy.ndarray: Sampel float (dtype sama) yang akan terbaca dari file
+    """
+    import numpy as np
+
+    if subtype == 'DOUBLE':
+        return data
+    if subtype == 'FLOAT':
+        return data.astype(np.float32).astype(data.dtype, copy=False)
+    step = PCM_SUBTYPE_STEPS.get(subtype)
+    if step is None:
+        raise ValueError(f"Subtype output tidak didukung: {subtype!r} "
+                         f"(pilihan: {', '.join(OUTPUT_SUBTYPES)})")
+
+    scaled = np.rint(np.asarray(data, dtype=np.float64) * 0x80000000)
+    np.clip(scaled, -0x80000000, 0x7FFFFFFF, out=scaled)
+    if step > 1:
+        np.floor_divide(scaled, step, out=scaled)
+        scaled *= step
+    scaled *= 1.0 / 0x80000000
+    return scaled.astype(data.dtype, copy=False)
+
+def append_metadata_chunk(f, metadata):
+    """
+    Menambahkan chunk metadata (JSON) di akhir WAV yang baru ditulis ke objek
+    file yang sama, lalu memperbarui ukuran RIFF. Chunk setelah data diabaikan
+    oleh pembaca WAV lain, termasuk libsndfile.
+
+    Args:
+        f (file-like): Objek file biner yang dapat di-seek dan berisi WAV lengkap
+        metadata (dict): Metadata publik yang dapat diserialisasi ke JSON
+    """
+    body = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+    end = f.seek(0, 2)
+    if end & 1:
+        # Setiap chunk RIFF harus dimulai pada offset genap
+        f.write(b'\0')
+        end += 1
+    f.write(METADATA_CHUNK_ID + struct.pack('<I', len(body)) + body)
+    if len(body) & 1:
+        f.write(b'\0')
+    end = f.tell()
+    f.seek(4)
+    f.write(struct.pack('<I', end - 8))
+    f.seek(end)
+
+def read_metadata_chunk(source):
+    """
+    Membaca chunk metadata dari WAV hanya dengan membaca header chunk; isi
+    chunk audio dilewati dengan seek.
+
+    Args:
+        source (str, bytes-like, or file-like): Path, blob WAV, atau objek file
+            biner yang dapat di-seek
+
+    Returns:
+        dict: Metadata, atau None jika WAV tidak memiliki chunk metadata
+
+    Raises:
+        ValueError: Jika chunk metadata ada tetapi tidak valid
+    """
+    import io
+    import os
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return read_metadata_chunk(io.BytesIO(source))
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return read_metadata_chunk(f)
+
+    start = source.tell()
+    try:
+        header = source.read(12)
+        if len(header) < 12 or header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+        while True:
+            chunk = source.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, chunk_size = chunk[:4], struct.unpack('<I', chunk[4:])[0]
+            if chunk_id == METADATA_CHUNK_ID:
+                try:
+                    return json.loads(source.read(chunk_size).decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    raise ValueError("Chunk metadata WAV tidak valid") from e
+            source.seek(chunk_size + (chunk_size & 1), 1)
+    finally:
+        source.seek(start)
@@ -0,0 +1,181 @@
+"""
+Sweep alpha: mengevaluasi satu grid alpha untuk sebuah carrier dan payload,
+lalu merekomendasikan alpha terkecil yang memenuhi target BER dan SNR.
+
+Carrier ditransformasi sekali. Penyisipan, SNR analitik (lihat
+core.coefficient_noise_energy), ekstraksi, dan margin keputusan dihitung
+sebagai matriks (alpha x bit) dalam satu operasi vektor NumPy. Round-trip
+kuantisasi ke subtype target memakai koefisien wilayah payload yang sama dan
+hanya merekonstruksi serta mentransformasi ulang wilayah tersebut per alpha,
+karena backend transformasi bekerja pada sinyal 1-D.
+"""
+import csv
+import json
+
+from steg import AudioDWT, kernels, quantize_samples
+
+# Grid alpha bawaan (skala logaritmik)
+DEFAULT_ALPHA_MIN = 1e-5
+DEFAULT_ALPHA_MAX = 1e-2
+DEFAULT_ALPHA_STEPS = 25
+
+def alpha_grid(minimum=DEFAULT_ALPHA_MIN, maximum=DEFAULT_ALPHA_MAX, steps=DEFAULT_ALPHA_STEPS):
+    """Grid alpha logaritmik dari minimum sampai maximum (inklusif)."""
+    import numpy as np
+    if not 0 < minimum <= maximum or steps < 1:
+        raise ValueError("Grid alpha tidak valid: perlu 0 < minimum <= maximum dan steps >= 1")
+    return np.geomspace(minimum, maximum, steps)
+
+def sweep_alpha(audio_data, all_bits, alphas, dwt=None, subtype='PCM_16'):
+    """
+    Mengevaluasi setiap alpha pada grid untuk satu carrier dan payload.
+
+    Args:
+        audio_data (numpy.ndarray): Audio carrier (channel pertama dipakai)
+        all_bits (str): Payload (mode satu band berurutan)
+        alphas (array-like): Grid alpha
+        dwt (AudioDWT, optional): Instance DWT dengan dtype float
+        subtype (str, optional): Subtype output target untuk round-trip
+            kuantisasi (lihat quantize_samples); None berarti tanpa kuantisasi
+
+    Returns:
+        list: Satu dict per alpha (urut naik) dengan alpha, snr_db, bit_errors,
+            ber, mean_confidence, min_confidence, dan low_confidence_bits
+
+    Raises:
+        ValueError: Jika dtype integer atau payload melebihi kapasitas
+    """
+    import numpy as np
+    from core import LOW_CONFIDENCE
+
+    if dwt is None:
+        dwt = AudioDWT(wavelet='db2', level=1)
+    if dwt.integer:
+        raise ValueError("Sweep alpha hanya mendukung dtype float")
+    alphas = np.sort(np.asarray(alphas, dtype=np.float64))
+    num_bits = len(all_bits)
+    channel = np.asarray(audio_data[:, 0] if audio_data.ndim > 1 else audio_data, dtype=dwt.dtype)
+    capacity = dwt.transform.band_lengths(len(channel))[1]
+    if num_bits > capacity:
+        raise ValueError(f"Pesan terlalu panjang! Kapasitas maksimal: {capacity} bit, Payload: {num_bits} bit")
+
+    # Transformasi sekali: hanya wilayah sampel yang menentukan koefisien payload
+    region = channel[:dwt.region_length(num_bits)]
+    coeffs = dwt.apply_dwt(region)
+    head = coeffs[1][:num_bits].astype(np.float64)
+    bits = kernels.bits_to_array(all_bits)
+
+    # Penyisipan untuk seluruh grid sekaligus: matriks (alpha, bit), sama dengan kernels.embed_coefficients
+    step = alphas[:, None]
+    magnitude = np.abs(head)[None, :]
+    adjusted = magnitude + (np.where(bits != 0, step, 0.0) - magnitude % (2 * step))
+    embedded = np.where(head >= 0, adjusted, -adjusted)
+
+    delta = embedded - head
+    noise = dwt.transform.synthesis_gain(1) * np.einsum('ij,ij->i', delta, delta)
+    signal = float(np.dot(channel.astype(np.float64), channel))
+    with np.errstate(divide='ignore'):
+        snr_db = 10 * np.log10(signal / noise)
+
+    # Round-trip: rekonstruksi wilayah, kuantisasi ke subtype target, transformasi ulang
+    received = np.empty_like(embedded)
+    for i in range(len(alphas)):
+        modified = list(coeffs)
+        modified[1] = coeffs[1].copy()
+        modified[1][:num_bits] = embedded[i]
+        stego = dwt.apply_idwt(modified)[:len(region)]
+        if subtype is not None:
+            stego = quantize_samples(stego, subtype)
+        received[i] = dwt.detail_coefficients(stego, num_bits)
+
+    remainder = np.abs(received) % (2 * step)
+    extracted = ((remainder >= 0.4 * step) & (remainder <= 1.6 * step)).view(np.uint8)
+    errors = np.count_nonzero(extracted != bits[None, :], axis=1)
+    confidence = kernels.bit_confidence(received, len(alphas), step, extracted)
+
+    rows = []
+    for i, alpha in enumerate(alphas):
+        rows.append({
+            "alpha": float(alpha),
+            "snr_db": float(snr_db[i]),
+            "bit_errors": int(errors[i]),
+            "ber": float(errors[i]) / num_bits if num_bits else 0.0,
+            "mean_confidence": float(confidence[i].mean()) if num_bits else 0.0,
+            "min_confidence": float(confidence[i].min()) if num_bits else 0.0,
+            "low_confidence_bits": int(np.count_nonzero(confidence[i] < LOW_CONFIDENCE)),
+        })
+    return rows
+
+def recommend_alpha(rows, target_ber=0.0, target_snr=None):
+    """
+    Alpha terkecil yang memenuhi target BER dan (jika diisi) target SNR.
+
+    Returns:
+        dict: Baris hasil sweep_alpha yang direkomendasikan, atau None jika
+            tidak ada alpha pada grid yang memenuhi kedua target
+    """
+    for row in sorted(rows, key=lambda row: row["alpha"]):
+        if row["ber"] <= target_ber and (target_snr is None or row["snr_db"] >= target_snr):
+            return row
+    return None
+
+def format_table(rows, recommended=None):
+    """Tabel teks hasil sweep; baris yang direkomendasikan ditandai '*'."""
+    lines = [f"  {'alpha':>10} {'SNR (dB)':>9} {'bit salah':>10} {'BER':>10} "
+             f"{'keyakinan':>9} {'minimum':>8} {'marginal':>8}"]
+    for row in rows:
+        mark = "*" if recommended is not None and row["alpha"] == recommended["alpha"] else " "
+        lines.append(f"{mark} {row['alpha']:>10.3g} {row['snr_db']:>9.2f} {row['bit_errors']:>10} "
+                     f"{row['ber']:>10.6f} {row['mean_confidence']:>9.3f} {row['min_confidence']:>8.3f} "
+                     f"{row['low_confidence_bits']:>8}")
+    return "\n".join(lines)
+
+def write_csv(rows, path):
+    """Menyimpan hasil sweep sebagai CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def write_json(rows, path, recommended=None, targets=None):
+    """Menyimpan hasil sweep, target, dan rekomendasi sebagai JSON."""
+    with open(path, 'w') as f:
+        json.dump({"targets": targets or {}, "recommended": recommended, "results": rows}, f, indent=2)
+
+def write_chart(rows, path, recommended=None, target_ber=None, target_snr=None):
+    """
+    Menyimpan grafik SNR dan BER terhadap alpha (sumbu log) sebagai gambar,
+    tanpa display (backend Agg).
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    alphas = [row["alpha"] for row in rows]
+    fig, snr_axis = plt.subplots(figsize=(9, 5))
+    snr_axis.semilogx(alphas, [row["snr_db"] for row in rows], "o-", color="tab:blue", label="SNR analitik")
+    snr_axis.set_xlabel("alpha")
+    snr_axis.set_ylabel("SNR (dB)", color="tab:blue")
+    if target_snr is not None:
+        snr_axis.axhline(target_snr, color="tab:blue", linestyle=":", label=f"target SNR {target_snr} dB")
+
+    ber_axis = snr_axis.twinx()
+    # BER nol digambar di dasar sumbu log, satu dekade di bawah BER positif terkecil
+    positive = [row["ber"] for row in rows if row["ber"] > 0]
+    floor = min(positive) / 10 if positive else 1e-6
+    ber_axis.semilogy(alphas, [max(row["ber"], floor) for row in rows], "s-", color="tab:red",
+                      label="BER round-trip")
+    ber_axis.set_ylabel("BER", color="tab:red")
+    if target_ber:
+        ber_axis.axhline(target_ber, color="tab:red", linestyle=":", label=f"target BER {target_ber}")
+    if recommended is not None:
+        snr_axis.axvline(recommended["alpha"], color="tab:green", linestyle="--",
+                         label=f"rekomendasi {recommended['alpha']:.3g}")
+
+    handles = snr_axis.get_legend_handles_labels()[0] + ber_axis.get_legend_handles_labels()[0]
+    labels = snr_axis.get_legend_handles_labels()[1] + ber_axis.get_legend_handles_labels()[1]
+    snr_axis.legend(handles, labels, loc="best")
+    snr_axis.set_title("Sweep alpha: SNR dan BER")
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
@@ -1,4 +1,5 @@
 """
 Package untuk utilitas pembantu.
 """
-from .bit_utils import text_to_bits, bits_to_text, bytes_to_bits, bits_to_bytes
\ No newline at end of file
+from .bit_utils import text_to_bits, bits_to_text, bytes_to_bits, bits_to_bytes
+from .console import suppress_stdout
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+Utilitas untuk membungkam output print per thread.
+
+contextlib.redirect_stdout mengganti sys.stdout secara global sehingga tidak
+aman dipakai bersamaan di beberapa thread. suppress_stdout hanya membungkam
+thread yang memanggilnya, sedangkan thread lain tetap menulis ke stdout asli.
+"""
+import sys
+import threading
+import contextlib
+
+_local = threading.local()
+_install_lock = threading.Lock()
+
+class _ThreadAwareStdout:
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        if getattr(_local, "depth", 0):
+            return len(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        if not getattr(_local, "depth", 0):
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+@contextlib.contextmanager
+def suppress_stdout():
+    """Membungkam print dari thread saat ini selama blok with berjalan."""
+    with _install_lock:
+        if not isinstance(sys.stdout, _ThreadAwareStdout):
+            sys.stdout = _ThreadAwareStdout(sys.stdout)
+    _local.depth = getattr(_local, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
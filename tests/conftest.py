@@ -0,0 +1,23 @@
+"""
+Fixture bersama untuk test round-trip. Modul proyek diimpor gaya sys.path
+(`from core import ...`) seperti pada src/.
+"""
+import os
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+@pytest.fixture(scope="session")
+def carrier(tmp_path_factory):
+    """Carrier WAV sinus 3 detik (cukup untuk beberapa pesan pendek)."""
+    from core import generate_audio
+    from utils import suppress_stdout
+
+    path = str(tmp_path_factory.mktemp("carrier") / "carrier.wav")
+    with suppress_stdout():
+        generate_audio(path, duration=3)
+    return path
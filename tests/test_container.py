@@ -0,0 +1,65 @@
+"""
+Round-trip kontainer multi-pesan: setiap penerima hanya membuka segmennya,
+dan append menambah penerima tanpa merusak segmen yang sudah ada.
+"""
+import shutil
+
+import pytest
+
+from core import extract_payload
+from utils import suppress_stdout
+
+def _extract(stego_file, info):
+    return extract_payload(stego_file, info["bits_length"], alpha=info["alpha"],
+                           ecc_private_key=info["ecc_private_key"],
+                           rsa_private_key=info["rsa_private_key"],
+                           recipient_key=info["rsa_public_key"])
+
+def test_container_round_trip(tmp_path, carrier):
+    from container import embed_container
+
+    output = str(tmp_path / "kontainer.wav")
+    messages = ["untuk penerima satu", "untuk penerima dua"]
+    with suppress_stdout():
+        infos = embed_container(carrier, output, messages)
+        assert [_extract(output, info) for info in infos] == messages
+
+def test_container_wrong_key(tmp_path, carrier):
+    from container import embed_container
+
+    output = str(tmp_path / "kontainer.wav")
+    with suppress_stdout():
+        first, second = embed_container(carrier, output, ["satu", "dua"])
+        # Kunci privat penerima lain tidak dapat membuka segmen ini
+        wrong = {**first, "rsa_private_key": second["rsa_private_key"]}
+        with pytest.raises(Exception):
+            _extract(output, wrong)
+
+def test_append_round_trip(tmp_path, carrier):
+    from container import embed_container, append_container
+
+    output = str(tmp_path / "kontainer.wav")
+    with suppress_stdout():
+        infos = embed_container(carrier, output, ["pertama"], slots=3)
+        infos.append(append_container(output, "kedua", alpha=infos[0]["alpha"]))
+        copy = str(tmp_path / "salinan.wav")
+        infos.append(append_container(output, "ketiga", alpha=infos[0]["alpha"], output_file=copy))
+
+        assert [_extract(output, info) for info in infos[:2]] == ["pertama", "kedua"]
+        assert [_extract(copy, info) for info in infos] == ["pertama", "kedua", "ketiga"]
+        # Salinan ditulis terpisah; kontainer asli tidak memuat penerima ketiga
+        with pytest.raises(Exception):
+            _extract(output, infos[2])
+
+def test_append_full_toc(tmp_path, carrier):
+    from container import embed_container, append_container
+
+    output = str(tmp_path / "kontainer.wav")
+    with suppress_stdout():
+        embed_container(carrier, output, ["satu", "dua"])
+        backup = str(tmp_path / "cadangan.wav")
+        shutil.copy(output, backup)
+        with pytest.raises(ValueError, match="Slot TOC"):
+            append_container(output, "tiga")
+    with open(output, 'rb') as a, open(backup, 'rb') as b:
+        assert a.read() == b.read()
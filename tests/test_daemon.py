@@ -0,0 +1,69 @@
+"""
+Handler request daemon (mode thread) dan round-trip lewat UNIX socket.
+"""
+import os
+import json
+import socket
+import tempfile
+
+import pytest
+
+@pytest.fixture
+def daemon(tmp_path):
+    from daemon import StegoDaemon
+
+    # Path UNIX socket dibatasi sekitar 100 karakter; tmp_path pytest bisa lebih panjang
+    socket_dir = tempfile.mkdtemp(prefix="stegod-")
+    stego_daemon = StegoDaemon(os.path.join(socket_dir, "daemon.sock"), workers=2,
+                               keystore_root=str(tmp_path / "keystore"), use_threads=True)
+    with stego_daemon:
+        yield stego_daemon
+    os.rmdir(socket_dir)
+
+@pytest.mark.parametrize("request_", ["id", ["id"], 5, None])
+def test_rejects_non_object_request(daemon, request_):
+    response = daemon.handle_request(request_)
+    assert response["ok"] is False
+    assert response["code"] == "invalid"
+
+def test_rejects_non_object_params(daemon):
+    response = daemon.handle_request({"id": 7, "op": "ping", "params": ["x"]})
+    assert response == {"id": 7, "ok": False, "error": "params harus berupa objek JSON", "code": "invalid"}
+
+def test_unknown_op_and_missing_params(daemon):
+    assert daemon.handle_request({"op": "hapus"})["code"] == "invalid"
+    assert daemon.handle_request({"op": "embed", "params": {}})["code"] == "invalid"
+    assert daemon.handle_request({"op": "extract", "params": {}})["code"] == "invalid"
+
+def test_ping(daemon):
+    response = daemon.handle_request({"id": "a", "op": "ping"})
+    assert response["ok"] is True and response["id"] == "a"
+    assert response["result"]["workers"] == 2
+
+def test_embed_extract_round_trip(daemon, tmp_path, carrier):
+    from daemon import DaemonClient, DaemonError
+
+    output = str(tmp_path / "daemon.wav")
+    with DaemonClient(daemon.socket_path, timeout=60) as client:
+        result = client.embed(carrier, output, "pesan lewat daemon", sidecars=False)
+        assert result["key_id"] in daemon.keystore
+        assert not os.path.exists(output + ".info")
+        assert client.extract(output) == "pesan lewat daemon"
+        assert client.extract(output, key_id=result["key_id"]) == "pesan lewat daemon"
+
+        # key_id yang sudah terpakai ditolak sebelum file output ditimpa
+        before = os.path.getmtime(output)
+        with pytest.raises(DaemonError) as error:
+            client.embed(carrier, output, "pesan lain", sidecars=False)
+        assert error.value.code == "invalid"
+        assert os.path.getmtime(output) == before
+        assert client.extract(output) == "pesan lewat daemon"
+
+def test_invalid_json_line(daemon):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(daemon.socket_path)
+        stream = sock.makefile('rwb')
+        stream.write(b"{bukan json\n")
+        stream.flush()
+        assert json.loads(stream.readline())["code"] == "invalid"
@@ -0,0 +1,68 @@
+"""
+Round-trip FEC Hamming: koreksi satu bit per codeword, decoding Chase untuk
+dua bit marginal, dan integrasi dengan embed/extract payload.
+"""
+import numpy as np
+import pytest
+
+from steg import fec, kernels
+
+def _random_bits(length, seed=0):
+    rng = np.random.default_rng(seed)
+    return kernels.array_to_bits(rng.integers(0, 2, size=length, dtype=np.uint8))
+
+@pytest.mark.parametrize("name", sorted(fec.FEC_CODES))
+def test_round_trip_without_errors(name):
+    bits = _random_bits(1000)
+    encoded = fec.encode_bits(bits, name)
+    assert len(encoded) == fec.encoded_length(len(bits), name)
+    assert fec.decode_bits(encoded, name) == (bits, 0)
+
+@pytest.mark.parametrize("name", sorted(fec.FEC_CODES))
+def test_corrects_one_error_per_codeword(name):
+    code = fec.get_code(name)
+    bits = _random_bits(777, seed=1)
+    received = kernels.bits_to_array(fec.encode_bits(bits, name))
+    blocks = len(received) // code.n
+    # Setelah interleaving, bit ke-(p * blocks + b) adalah bit p dari codeword b
+    positions = np.random.default_rng(2).integers(0, code.n, size=blocks)
+    received[positions * blocks + np.arange(blocks)] ^= 1
+    decoded, corrected = fec.decode_bits(kernels.array_to_bits(received), name)
+    assert decoded == bits
+    assert corrected == blocks
+
+def test_chase_corrects_two_low_confidence_errors():
+    code = fec.get_code("hamming7")
+    bits = _random_bits(400, seed=3)
+    received = kernels.bits_to_array(fec.encode_bits(bits, "hamming7"))
+    blocks = len(received) // code.n
+    confidence = np.ones(len(received), dtype=np.float32)
+    flipped = np.concatenate([0 * blocks + np.arange(blocks), 5 * blocks + np.arange(blocks)])
+    received[flipped] ^= 1
+    confidence[flipped] = 0.05
+
+    soft, corrected = fec.decode_bits(kernels.array_to_bits(received), "hamming7", confidence)
+    assert soft == bits
+    assert corrected == 2 * blocks
+
+def test_rejects_invalid_stream_length():
+    with pytest.raises(ValueError):
+        fec.decode_bits("0" * 8, "hamming7")
+    with pytest.raises(ValueError):
+        fec.get_code("hamming63")
+
+def test_payload_round_trip(tmp_path, carrier):
+    from core import embed_payload, extract_payload
+    from utils import suppress_stdout
+
+    output = str(tmp_path / "fec.wav")
+    with suppress_stdout():
+        info = embed_payload(carrier, output, "pesan dengan FEC", fec="hamming15")
+        assert info["fec"] == "hamming15"
+        stats = {}
+        message = extract_payload(output, info["bits_length"], alpha=info["alpha"],
+                                  ecc_private_key=info["ecc_private_key"],
+                                  rsa_private_key=info["rsa_private_key"],
+                                  fec=info["fec"], stats=stats)
+    assert message == "pesan dengan FEC"
+    assert stats["fec_corrected"] == 0
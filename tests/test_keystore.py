@@ -0,0 +1,85 @@
+"""
+Round-trip keystore dan chunk metadata: kunci privat hanya ada di keystore,
+parameter publik di chunk RIFF, dan key_id bawaan tidak bertabrakan.
+"""
+import os
+
+import pytest
+
+from crypto import KeyStore, path_key_id
+
+def test_put_get_round_trip(tmp_path):
+    keystore = KeyStore(str(tmp_path))
+    keystore.put("stego.wav", {"bits_length": 8})
+    assert keystore.get("stego.wav") == {"bits_length": 8}
+    assert "stego.wav" in keystore
+    assert keystore.get("lain.wav") is None
+    assert keystore.key_ids() == ["stego.wav"]
+
+def test_put_refuses_overwrite(tmp_path):
+    keystore = KeyStore(str(tmp_path))
+    keystore.put("stego.wav", {"bits_length": 8})
+    with pytest.raises(ValueError, match="sudah ada"):
+        keystore.put("stego.wav", {"bits_length": 16})
+    assert keystore.get("stego.wav") == {"bits_length": 8}
+    keystore.put("stego.wav", {"bits_length": 16}, overwrite=True)
+    assert keystore.get("stego.wav") == {"bits_length": 16}
+    # Tidak ada file sementara yang tertinggal
+    assert os.listdir(str(tmp_path)) == ["stego.wav.json"]
+
+def test_invalid_key_id(tmp_path):
+    keystore = KeyStore(str(tmp_path))
+    for key_id in ("", "..", "a/b", "spasi di nama"):
+        with pytest.raises(ValueError):
+            keystore.put(key_id, {})
+
+def test_path_key_id_is_unique_per_path(tmp_path):
+    first = path_key_id(str(tmp_path / "a" / "out.wav"))
+    second = path_key_id(str(tmp_path / "b" / "out.wav"))
+    assert first != second
+    assert first.startswith("out.wav.") and second.startswith("out.wav.")
+    assert path_key_id(str(tmp_path / "a" / ".." / "a" / "out.wav")) == first
+
+def test_metadata_chunk_same_basename(tmp_path, carrier, capsys):
+    """Dua output bernama sama di direktori berbeda tetap dapat diekstrak."""
+    from cli import main
+
+    keystore = str(tmp_path / "keystore")
+    outputs = {}
+    for name in ("a", "b"):
+        os.makedirs(str(tmp_path / name))
+        output = str(tmp_path / name / "out.wav")
+        assert main(["embed", carrier, "-o", output, "-m", f"pesan {name}",
+                     "--keystore", keystore, "--metadata-chunk"]) == 0
+        assert not os.path.exists(output + ".key")
+        outputs[name] = output
+    assert len(KeyStore(keystore).key_ids()) == 2
+
+    for name, output in outputs.items():
+        capsys.readouterr()
+        assert main(["extract", output, "--keystore", keystore]) == 0
+        assert capsys.readouterr().out.rstrip("\n") == f"pesan {name}"
+
+    # Embed ulang ke path yang sama ditolak tanpa menimpa kunci lama
+    assert main(["embed", carrier, "-o", outputs["a"], "-m", "baru",
+                 "--keystore", keystore, "--metadata-chunk"]) == 1
+    capsys.readouterr()
+    assert main(["extract", outputs["a"], "--keystore", keystore]) == 0
+    assert capsys.readouterr().out.rstrip("\n") == "pesan a"
+
+def test_resolve_from_metadata_chunk(tmp_path, carrier):
+    from core import embed_payload, extract_payload, resolve_stego_info
+    from utils import suppress_stdout
+
+    output = str(tmp_path / "stego.wav")
+    keystore = KeyStore(str(tmp_path / "keystore"))
+    with suppress_stdout():
+        info = embed_payload(carrier, output, "rahasia", metadata_chunk=True, key_id="penerima")
+        keystore.put("penerima", info)
+        resolved = resolve_stego_info(output, keystore=keystore)
+        assert resolved["key_id"] == "penerima"
+        assert resolved["bits_length"] == info["bits_length"]
+        message = extract_payload(output, resolved["bits_length"], alpha=resolved["alpha"],
+                                  ecc_private_key=resolved["ecc_private_key"],
+                                  rsa_private_key=resolved["rsa_private_key"])
+    assert message == "rahasia"